@@ -4,7 +4,7 @@ os.environ['DJANGO_SETTINGS_MODULE']='settings'
 # import settings
 from trees.plots import *
 import csv
-from trees.models import TreeliveSummary, ConditionVariantLookup
+from trees.models import TreeliveSummary, ConditionVariantLookup, SpeciesSizeCatalog
 import ipdb
 import datetime
 import gc
@@ -107,6 +107,8 @@ if terminated:
     print "%s" % start_index
 if done:
     # print 'Complete! %s records inserted.' % str(start_index)
+    rebuild_candidate_indexes()
+    SpeciesSizeCatalog.rebuild()
     print 'done'
 if error:
     sys.exit(1)
@@ -88,8 +88,42 @@ POINT_BUFFER = 2500  # meters
 DEFAULT_EXTENT = [-14056200, 4963200, -12471500, 6128400]  # in mercator
 EQUAL_AREA_ACRES_CONVERSION = 0.000247105381  # sq m to acres
 SLIVER_THRESHOLD = 100.0  # square meters
+STAND_IMPORT_BATCH_SIZE = 500  # rows per INSERT when importing stands
+STAND_UPLOAD_ASYNC_FEATURES = 1000  # larger uploads are imported by a celery job
+OUTLINE_UNION_PROCESSES = 1  # process pool for property outline unions (outside celery)
 MILL_SHAPEFILE = os.path.realpath(os.path.join(os.path.dirname(__file__),
                                   'fixtures', 'mills', 'mills.shp'))
+# Match stands against the in-memory treelive_summary index (trees.plots)
+# rather than querying the database for each species/size class
+NN_CANDIDATE_INDEX = True
+# ...and look up candidate site conditions in an in-memory copy of idb_summary
+NN_SITE_TABLE = True
+# Scaled candidate matrix/KDTree per stand list; shared via the cache and kept
+# in an LRU of this many entries in each process
+NN_MATCHER_CACHE_SIZE = 10
+NN_MATCHER_CACHE_TIMEOUT = 60 * 60 * 24 * 7
+# Threads for batch KD-tree queries (-1 = all cores)
+NN_QUERY_JOBS = -1
+
+# Terrain rasters: decoded 512x512 blocks kept per worker (shared by all
+# rasters) and whether to use uncompressed <raster>.npy copies when present
+TERRAIN_BLOCK_CACHE_SIZE = 64
+TERRAIN_MEMMAP = True
+# Stands are batched into windows by the tile (in TERRAIN_PROJ metres) their
+# centroid falls in, so scattered parcels don't read one huge window
+TERRAIN_WINDOW_SIZE = 5000
+# Stands up to this size get terrain computed inline on save instead of
+# through celery (0 to always go async); keep it well under a second on a
+# cold worker (see the bench_terrain_inline command). Batched saves
+# (defer_rasters) always go through impute_rasters_batch.
+TERRAIN_SYNC_MAX_ACRES = 100
+TERRAIN_SYNC_MAX_VERTICES = 1000
+# Harvested stand-years priced by the cost model per celery subtask
+COST_MODEL_CHUNK_SIZE = 50
+# Bump when forestcost changes to retire the memoized costs (trees.models.CostMemo)
+COST_MODEL_VERSION = 1
+# Most price vectors accepted by the scenario revenue sweep
+REVENUE_SWEEP_MAX_VECTORS = 100
 
 # ------------------------------------------------------------------------------
 # Redis sessions and caching
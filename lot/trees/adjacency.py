@@ -0,0 +1,98 @@
+"""
+Stand adjacency.
+
+Since the data are not topological, adjacency is determined by a minimum
+distance threshold: two stands are adjacent if one intersects the other
+buffered by the threshold.
+
+All geometries are loaded once and candidate neighbours come from an
+STRtree, rather than a spatial query per stand. Only depends on shapely
+so it can be used offline (see trees_test/scripts/adjacency.py).
+"""
+from shapely.strtree import STRtree
+from shapely.prepared import prep
+from shapely import wkb
+
+
+def adjacency_pairs(features, threshold):
+    """
+    Yield (fid, fid2) for every ordered pair of adjacent features
+    in an iterable of (fid, shapely geometry)
+    """
+    features = list(features)
+    if not features:
+        return
+    geoms = [geom for fid, geom in features]
+    fids = dict((id(geom), fid) for fid, geom in features)
+    tree = STRtree(geoms)
+
+    for fid, geom in features:
+        geom_buf = geom.buffer(threshold)
+        prepared = prep(geom_buf)
+        for geom2 in tree.query(geom_buf):
+            fid2 = fids[id(geom2)]
+            if fid == fid2:
+                continue
+            if prepared.intersects(geom2):
+                yield fid, fid2
+
+
+def adjacency_map(features, threshold):
+    """
+    {fid: [adjacent fids] or None}, for features as in adjacency_pairs
+    """
+    features = list(features)
+    adj = dict((fid, []) for fid, geom in features)
+    for fid, fid2 in adjacency_pairs(features, threshold):
+        adj[fid].append(fid2)
+    for fid in adj:
+        if len(adj[fid]) == 0:
+            adj[fid] = None
+        else:
+            adj[fid].sort()
+    return adj
+
+
+def write_adjacency_csv(adj, outfh):
+    """
+    Write an adjacency map as 2-column csv, one line per adjacent pair
+    """
+    for fid in sorted(adj):
+        for fid2 in adj[fid] or []:
+            outfh.write("%d,%d\n" % (fid, fid2))
+
+
+def load_features(qs, field='geometry_final'):
+    """
+    (pk, shapely geometry) for each feature of a queryset, in one query
+    """
+    return [(pk, wkb.loads(str(geom.wkb)))
+            for pk, geom in qs.values_list('pk', field)]
+
+
+def postgis_adjacency_map(qs, threshold, field='geometry_final'):
+    """
+    adjacency_map computed by the database in one self-join
+    (ST_DWithin; equivalent up to the buffer's approximation of curves)
+    """
+    from django.db import connection
+
+    table = qs.model._meta.db_table
+    ids = list(qs.values_list('pk', flat=True))
+    cursor = connection.cursor()
+    cursor.execute("""
+        SELECT a.id, b.id
+        FROM %(table)s a, %(table)s b
+        WHERE a.id = ANY(%%s) AND b.id = ANY(%%s)
+        AND a.id <> b.id
+        AND ST_DWithin(a.%(field)s, b.%(field)s, %%s)
+        ORDER BY a.id, b.id
+    """ % {'table': table, 'field': field}, [ids, ids, threshold])
+
+    adj = dict((pk, []) for pk in ids)
+    for fid, fid2 in cursor.fetchall():
+        adj[fid].append(fid2)
+    for fid in adj:
+        if len(adj[fid]) == 0:
+            adj[fid] = None
+    return adj
@@ -0,0 +1,315 @@
+"""
+Cost model (forestcost) precomputation for Scenario.output_cash_metrics.
+
+Pricing every harvested stand-year with main_model.cost_func is too slow for
+a web request, so it is done once per scenario run (tasks.precompute_cash_metrics):
+
+  1. cost_rows collects the cost_func arguments of each harvested row
+     (landing and routing are cached per property, ForestProperty.cost_routing,
+     and routed to the nearest mill from a per-process index, nearest_mill)
+  2. rows priced before, by any scenario, come from the CostMemo table
+     (split_memoized); the rest are priced in chunks of
+     settings.COST_MODEL_CHUNK_SIZE, fanned out across celery workers
+     (price_cost_rows), and memoized
+  3. the priced chunks are reduced into annual cable/ground/haul totals
+     (annual_costs) and stored on the scenario (Scenario.output_cash_results)
+"""
+import operator
+import hashlib
+from collections import defaultdict
+from django.conf import settings
+from django.db import connection, transaction, IntegrityError
+from madrona.common.utils import get_logger
+
+logger = get_logger()
+
+
+class CostModelError(Exception):
+    pass
+
+
+# mill points and their STRtree, per shapefile, loaded once per worker process
+_mills = {}
+
+
+def mill_index(path=None):
+    """
+    (STRtree, points) of the mills in path (default settings.MILL_SHAPEFILE,
+    in EPSG:4326), read from disk once per process
+    """
+    from django.contrib.gis.gdal import DataSource
+    from shapely.geometry import Point
+    from shapely.strtree import STRtree
+
+    if path is None:
+        path = settings.MILL_SHAPEFILE
+    if path not in _mills:
+        points = [Point(feature.geom.tuple[:2]) for feature in DataSource(path)[0]]
+        _mills[path] = (STRtree(points), points)
+    return _mills[path]
+
+
+def nearest_mill(coords, path=None):
+    """
+    (lon, lat) of the mill nearest to coords (lon, lat), by straight line
+    """
+    from shapely.geometry import Point
+
+    tree, points = mill_index(path)
+    if not points:
+        raise CostModelError("No mills in %s" % (path or settings.MILL_SHAPEFILE))
+    point = Point(coords)
+    # widen the search box until it holds a mill within its half-width;
+    # nothing outside the box can be nearer than that mill
+    radius = 0.1
+    while True:
+        hits = [(point.distance(mill), mill) for mill in tree.query(point.buffer(radius).envelope)]
+        if hits:
+            dist, mill = min(hits, key=lambda hit: hit[0])
+            if dist <= radius:
+                return mill.coords[0]
+        radius *= 2
+
+
+def cost_rows(scenario):
+    """
+    Returns (years, rows) for a scenario with materialized results:
+    every year of the results, and (sstand_id, stand_id, year, cost_args, haul_prop)
+    for each stand-year with a harvest to price.
+    Raises CostModelError if the property landing or routing fails.
+    """
+    sql = """SELECT
+                ss.id AS sstand_id,
+                ss.stand_id AS stand_id,
+                a.cond, a.rx, a.year, a.offset,
+                ST_AsText(ss.geometry_final) AS stand_wkt,
+                a.acres          AS acres,
+                a.LG_CF          AS LG_CF,
+                a.LG_HW          AS LG_HW,
+                a.LG_TPA         AS LG_TPA,
+                a.SM_CF          AS SM_CF,
+                a.SM_HW          AS SM_HW,
+                a.SM_TPA         AS SM_TPA,
+                a.CH_CF          AS CH_CF,
+                a.CH_HW          AS CH_HW,
+                a.CH_TPA         AS CH_TPA,
+                stand.elevation  AS elev,
+                stand.slope      AS slope,
+                a.CUT_TYPE       AS CUT_TYPE
+            FROM
+                trees_scenariostandresult a
+            JOIN
+                trees_scenariostand ss
+              ON  a.scenariostand_id = ss.id
+            JOIN trees_stand stand
+              ON ss.stand_id = stand.id
+            WHERE a.scenario_id = %s -- get from current scenario
+            ORDER BY a.year, ss.id;"""
+
+    cursor = connection.cursor()
+    cursor.execute(sql, [scenario.id])
+    desc = cursor.description
+    rows = [
+        dict(zip([col[0] for col in desc], row))
+        for row in cursor.fetchall()
+        if None not in row  # remove any nulls; incomplete data can't be used
+    ]
+
+    # computed once per property geometry
+    landing_coords, haulDist, haulTime, coord_mill = scenario.input_property.cost_routing
+
+    years = []
+    harvest_rows = []
+    for row in rows:
+        year = int(row['year'])
+        if not years or years[-1] != year:
+            years.append(year)
+
+        ### Tree Data ###
+        # Cut type code indicating type of harvest implemented.
+        # 0 = no harvest, 1 = pre-commercial thin,
+        # 2 = commercial thin, 3 = regeneration harvest
+        try:
+            cut_type = int(row['cut_type'])
+        except:
+            # no harvest so don't attempt to calculate
+            cut_type = 0
+
+        # PartialCut(clear cut = 0, partial cut = 1)
+        if cut_type == 3:
+            PartialCut = 0
+            # Assume partial cut moves all the timber off-site
+            haul_prop = 1.0
+        elif cut_type in [1, 2]:
+            PartialCut = 1
+            # Assume partial cut moves 1/2 the timber off-site
+            haul_prop = 0.5
+        else:
+            # no harvest so don't attempt to calculate
+            continue
+
+        cost_args = (
+            # stand info
+            row['acres'], row['elev'], row['slope'], row['stand_wkt'],
+            # harvest info
+            row['ch_tpa'], row['ch_cf'],
+            row['sm_tpa'], row['sm_cf'],
+            row['lg_tpa'], row['lg_cf'],
+            row['ch_hw'], row['sm_hw'], row['lg_hw'],
+            PartialCut,
+            # routing info
+            landing_coords, haulDist, haulTime, coord_mill
+        )
+        harvest_rows.append((row['sstand_id'], row['stand_id'], year, cost_args, haul_prop))
+
+    return years, harvest_rows
+
+
+def cost_key(cost_args, haul_prop):
+    """
+    Digest of everything the cost model result depends on: the stand
+    (acres, elevation, slope, geometry), the harvested volumes, the cut,
+    the landing and haul route, and settings.COST_MODEL_VERSION
+    """
+    version = getattr(settings, 'COST_MODEL_VERSION', 1)
+    return hashlib.sha1(repr((version, cost_args, haul_prop))).hexdigest()
+
+
+def split_memoized(rows):
+    """
+    Returns (priced, unpriced): (year, result) for rows found in the CostMemo
+    table and the rows from cost_rows that still need the cost model
+    """
+    from trees.models import CostMemo
+
+    keys = [cost_key(cost_args, haul_prop)
+            for sstand_id, stand_id, year, cost_args, haul_prop in rows]
+    memos = {}
+    unique_keys = list(set(keys))
+    for i in range(0, len(unique_keys), 1000):
+        for memo in CostMemo.objects.filter(key__in=unique_keys[i:i + 1000]):
+            memos[memo.key] = memo.result
+
+    priced = []
+    unpriced = []
+    for row, key in zip(rows, keys):
+        if key in memos:
+            priced.append((row[2], memos[key]))
+        else:
+            unpriced.append(row)
+    return priced, unpriced
+
+
+def memoize(memos):
+    """
+    Store new CostMemos, tolerating ones another worker stored meanwhile
+    """
+    from trees.models import CostMemo
+
+    try:
+        with transaction.commit_on_success():
+            CostMemo.objects.bulk_create(memos)
+    except IntegrityError:
+        for memo in memos:
+            try:
+                with transaction.commit_on_success():
+                    memo.save()
+            except IntegrityError:
+                pass
+
+
+def price_rows(rows):
+    """
+    Run the cost model on rows from cost_rows, memoizing the results
+    Returns (year, result) for each row; result is None if the cost model failed
+    """
+    from forestcost import main_model
+    from trees.models import handle_cost_error, CostMemo
+
+    priced = []
+    memos = {}
+    for sstand_id, stand_id, year, cost_args, haul_prop in rows:
+        try:
+            result = main_model.cost_func(*cost_args,
+                Helicopter=False,  # don't bother with helipcopter logging costs
+                HaulProportion=haul_prop  # only haul the requisite proportion
+            )
+        except Exception as e:
+            handle_cost_error(e, cost_args, sstand_id)
+            priced.append((year, None))
+            continue
+
+        result = {
+            'total_cost': result['total_cost'],
+            'total_haul_cost': result['total_haul_cost'],
+            'total_harvest_cost': result['total_harvest_cost'],
+            'harvest_system': result['harvest_system'],
+        }
+        priced.append((year, result))
+        key = cost_key(cost_args, haul_prop)
+        memos[key] = CostMemo(key=key, stand_id=stand_id, **result)
+
+    memoize(memos.values())
+    return priced
+
+
+def annual_costs(years, priced):
+    """
+    Reduce priced rows into the annual totals of output_cash_metrics
+    """
+    annual_total_cost = defaultdict(float)
+    annual_haul_cost = defaultdict(float)
+    annual_ground_harvest_cost = defaultdict(float)
+    annual_cable_harvest_cost = defaultdict(float)
+    for year in years:
+        annual_total_cost[year] += 0
+        annual_haul_cost[year] += 0
+        annual_ground_harvest_cost[year] += 0
+        annual_cable_harvest_cost[year] += 0
+
+    used_records = 0
+    skip_error = 0
+    skip_noharvest = 0
+    for year, result in priced:
+        if result is None:
+            skip_error += 1
+            continue
+
+        annual_haul_cost[year] += result['total_haul_cost']
+        annual_total_cost[year] += result['total_cost']
+
+        system = result['harvest_system']
+        if system.startswith("Ground"):
+            annual_ground_harvest_cost[year] += result['total_harvest_cost']
+        elif system.startswith("Cable"):
+            annual_cable_harvest_cost[year] += result['total_harvest_cost']
+        else:
+            # Assume not ground and not cable = no harvest
+            skip_noharvest += 1
+            continue
+        used_records += 1
+
+    logger.debug("Cost model: %d rows used, %d without harvest, %d failed" % (
+        used_records, skip_noharvest, skip_error))
+
+    # Costs
+    def ordered_costs(x):
+        sorted_x = sorted(x.iteritems(), key=operator.itemgetter(0))
+        return [z[1] for z in sorted_x]
+
+    data = {}
+    data['cable'] = ordered_costs(annual_cable_harvest_cost)
+    data['ground'] = ordered_costs(annual_ground_harvest_cost)
+    data['haul'] = ordered_costs(annual_haul_cost)
+    data['years'] = sorted(annual_haul_cost.keys())
+    # data['admin'] = ordered_costs(annual_admin_cost)
+    # data['tax'] = ordered_costs(annual_tax_cost)
+    # data['road'] = ordered_costs(annual_road_cost)
+
+    return data
+
+
+def chunks(rows, size=None):
+    if size is None:
+        size = getattr(settings, 'COST_MODEL_CHUNK_SIZE', 50)
+    return [rows[i:i + size] for i in range(0, len(rows), size)]
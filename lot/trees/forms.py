@@ -64,6 +64,7 @@ class PropertyForm(FeatureForm):
 class StrataForm(FeatureForm):
     class Meta(FeatureForm.Meta):
         model = Strata
+        exclude = list(FeatureForm.Meta.exclude) + ['relaxed_classes']
 
 
 class ScenarioForm(FeatureForm):
@@ -93,7 +94,8 @@ class ScenarioForm(FeatureForm):
 
     class Meta(FeatureForm.Meta):
         model = Scenario
-        exclude = list(FeatureForm.Meta.exclude) + ['output_scheduler_results']
+        exclude = list(FeatureForm.Meta.exclude) + ['output_scheduler_results', 'output_cash_results',
+                                                   'results_materialized']
 
     def __init__(self, *args, **kwargs):
         super(ScenarioForm, self).__init__(*args, **kwargs)
@@ -0,0 +1,97 @@
+import json
+import time
+import numpy as np
+from optparse import make_option
+from django.core.management.base import BaseCommand, CommandError
+from trees.plots import (get_plotsummaries, build_plot_matcher, stand_list_params,
+                         get_nearest_neighbors, invalidate_plot_matchers,
+                         NearestNeighborError)
+
+
+class Command(BaseCommand):
+    help = 'Replays nearest neighbor inputs and reports build, query and end-to-end timings'
+    args = '[corpus.json ...]'
+    option_list = BaseCommand.option_list + (
+        make_option('--repeat', type='int', dest='repeat', default=1,
+                    help='Number of passes over the corpus'),
+        make_option('--k', type='int', dest='k', default=10,
+                    help='Number of plots to match'),
+    )
+
+    def handle(self, *args, **options):
+        '''
+        Each corpus file holds one input or a list of inputs in the format
+        of trees/tests/test_plots/*.json (and export_matches' matching_inputs.json)
+          {"tree_list": [["Douglas-fir", 6, 12, 120], ...],
+           "variant": "PN",
+           "plot_attrs": {"calc_aspect": 278.2, "elev_ft": 1338.0, ...}}
+        '''
+        if not args:
+            raise CommandError("Specify one or more corpus files\n"
+                               "e.g. python manage.py bench_nn trees/tests/test_plots/*.json")
+
+        inputs = []
+        for path in args:
+            with open(path) as fh:
+                data = json.load(fh)
+            if isinstance(data, dict):
+                data = [data]
+            inputs.extend(data)
+
+        k = options['k']
+        timings = {'fetch': [], 'build': [], 'query': [], 'cold': [], 'warm': []}
+        failures = 0
+
+        for i in range(options['repeat']):
+            for data in inputs:
+                classes = data['tree_list']
+                variant = data['variant']
+                site_cond = data['plot_attrs']
+                try:
+                    # candidates + site variables
+                    start = time.time()
+                    plotsummaries = get_plotsummaries(classes, variant)
+                    fetched = time.time()
+                    # scaled matrix + tree
+                    matcher = build_plot_matcher(plotsummaries, classes, site_cond.keys())
+                    built = time.time()
+                    input_params, total_ba = stand_list_params(
+                        classes, plotsummaries.axes[1].tolist())
+                    input_params.update(site_cond)
+                    matcher.match([input_params], k)
+                    queried = time.time()
+
+                    # end to end, without and with the matcher cached
+                    invalidate_plot_matchers(classes)
+                    cold_start = time.time()
+                    get_nearest_neighbors(site_cond, classes, variant, k=k)
+                    warm_start = time.time()
+                    get_nearest_neighbors(site_cond, classes, variant, k=k)
+                    done = time.time()
+                except NearestNeighborError as e:
+                    print "No candidates for %s (%s): %s" % (classes, variant, e)
+                    failures += 1
+                    continue
+
+                timings['fetch'].append(fetched - start)
+                timings['build'].append(built - fetched)
+                timings['query'].append(queried - built)
+                timings['cold'].append(warm_start - cold_start)
+                timings['warm'].append(done - warm_start)
+
+        print "%d inputs x %d passes, %d failed" % (len(inputs), options['repeat'], failures)
+        print "%-28s %8s %8s %8s %8s" % ('(milliseconds)', 'mean', 'p50', 'p95', 'max')
+        labels = [
+            ('fetch', 'candidates + sites'),
+            ('build', 'matrix + tree build'),
+            ('query', 'tree query'),
+            ('cold', 'end-to-end, cold matcher'),
+            ('warm', 'end-to-end, cached matcher'),
+        ]
+        for key, label in labels:
+            times = np.array(timings[key]) * 1000.0
+            if len(times) == 0:
+                continue
+            print "%-28s %8.1f %8.1f %8.1f %8.1f" % (
+                label, times.mean(), np.percentile(times, 50),
+                np.percentile(times, 95), times.max())
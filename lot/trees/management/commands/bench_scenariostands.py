@@ -0,0 +1,47 @@
+import time
+import numpy as np
+from optparse import make_option
+from django.core.management.base import BaseCommand, CommandError
+from trees.models import Scenario, ScenarioStand
+from trees.utils import create_scenariostands, fake_scenariostands
+
+
+class Command(BaseCommand):
+    help = 'Times fake_scenariostands against create_scenariostands (the spatial identity)'
+    args = 'scenario_id [scenario_id ...]'
+    option_list = BaseCommand.option_list + (
+        make_option('--repeat', type='int', dest='repeat', default=3,
+                    help='Number of runs of each method per scenario'),
+    )
+
+    def handle(self, *args, **options):
+        '''
+        Note: replaces the ScenarioStands of the given scenarios,
+        leaving the output of create_scenariostands
+        '''
+        if not args:
+            raise CommandError("Specify one or more scenario ids\n"
+                               "e.g. python manage.py bench_scenariostands 12 13")
+
+        methods = [
+            ('fake', fake_scenariostands),
+            ('identity', create_scenariostands),
+        ]
+
+        print "%-10s %-10s %8s %8s %8s %8s" % ('scenario', 'method', 'stands', 'mean', 'min', 'max')
+        for scenario_id in args:
+            try:
+                scenario = Scenario.objects.get(id=int(scenario_id))
+            except (ValueError, Scenario.DoesNotExist):
+                raise CommandError("No scenario with id %s" % scenario_id)
+
+            for label, func in methods:
+                times = []
+                for i in range(options['repeat']):
+                    start = time.time()
+                    func(scenario)
+                    times.append(time.time() - start)
+                count = ScenarioStand.objects.filter(scenario=scenario).count()
+                times = np.array(times) * 1000.0
+                print "%-10s %-10s %8d %8.1f %8.1f %8.1f" % (
+                    scenario_id, label, count, times.mean(), times.min(), times.max())
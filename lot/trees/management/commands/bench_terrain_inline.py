@@ -0,0 +1,35 @@
+import time
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+from trees.models import Stand
+from trees import terrain
+
+
+class Command(BaseCommand):
+    help = 'Times the inline terrain computation (trees.terrain, uncached) for stands, ' \
+           'to size settings.TERRAIN_SYNC_MAX_ACRES and TERRAIN_SYNC_MAX_VERTICES'
+    args = 'stand_id [stand_id ...]'
+
+    def handle(self, *args, **options):
+        if not args:
+            raise CommandError("Specify one or more stand ids\n"
+                               "e.g. python manage.py bench_terrain_inline 12 13")
+
+        print "%-10s %10s %10s %10s %10s" % ('stand', 'acres', 'vertices', 'cold', 'warm')
+        for stand_id in args:
+            try:
+                stand = Stand.objects.get(id=int(stand_id))
+            except (ValueError, Stand.DoesNotExist):
+                raise CommandError("No stand with id %s" % stand_id)
+
+            geom = stand.geometry_final.transform(settings.TERRAIN_PROJ, clone=True)
+            times = []
+            # cold: a fresh worker, nothing open or decoded yet
+            terrain._rasters.clear()
+            terrain._blocks.clear()
+            for i in range(2):
+                start = time.time()
+                terrain.terrain_zonal(geom)
+                times.append((time.time() - start) * 1000.0)
+            print "%-10s %10.1f %10d %8.1fms %8.1fms" % (
+                stand_id, stand.acres, stand.geometry_final.num_points, times[0], times[1])
@@ -1,4 +1,4 @@
-import os, csv
+import os, csv, json
 # os.environ['DJANGO_SETTINGS_MODULE']='settings'
 from django.conf import settings
 from trees.models import *
@@ -17,6 +17,7 @@ class Command(BaseCommand):
         MAX_ITERATIONS = 0      # <1 for 'run all'
 
         match_dicts = []
+        input_dicts = []  # replayable with manage.py bench_nn
         miss_count = 0
         no_strata_count = 0
 
@@ -42,6 +43,12 @@ class Command(BaseCommand):
                     }
                 weight_dict=None
                 k=CANDIDATES_DESIRED
+                input_dicts.append({
+                        'stand_id': stand.id,
+                        'tree_list': classes,
+                        'variant': variant,
+                        'plot_attrs': site_cond
+                    })
                 try:
                     result, num_candidates = get_nearest_neighbors(site_cond, classes, variant, weight_dict, k)
                     for rank, match in enumerate(result):  # matches come ordered by most-to-least suited. We can iterate
@@ -71,6 +78,11 @@ class Command(BaseCommand):
             for match_dict in match_dicts:
                 writer.writerow(match_dict)
 
+        inputs_location = '%s/../docs/output/matching_inputs.json' % settings.BASE_DIR
+        with open(inputs_location, 'w') as outfile:
+            json.dump(input_dicts, outfile, indent=2)
+
         print 'Misses: %s' % str(miss_count)
         print 'Strata Misses: %s' % str(no_strata_count)
         print 'Output can be found at %s' % out_location
+        print 'Inputs (for bench_nn) can be found at %s' % inputs_location
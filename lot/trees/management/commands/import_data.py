@@ -3,7 +3,8 @@ import subprocess
 from django.db import connection, transaction
 from django.core.management.base import BaseCommand
 from django.core.management import call_command
-from trees.models import IdbSummary, TreeliveSummary, County, FVSVariant, FVSSpecies, ConditionVariantLookup, Rx, FVSAggregate
+from trees.plots import rebuild_candidate_indexes
+from trees.models import IdbSummary, TreeliveSummary, County, FVSVariant, FVSSpecies, ConditionVariantLookup, Rx, FVSAggregate, SpeciesSizeCatalog
 from madrona.raster_stats.models import RasterDataset
 from urllib import urlretrieve
 
@@ -177,3 +178,9 @@ class Command(BaseCommand):
                 call_command('loaddata', fname)
             else:
                 print "\tSkip loading %s data" % klass.__name__
+
+        print "\tRebuilding nearest-neighbor candidate indexes"
+        rebuild_candidate_indexes()
+
+        print "\tRebuilding species size class catalogs"
+        SpeciesSizeCatalog.rebuild()
@@ -1,18 +1,13 @@
 import os
 from django.core.management.base import BaseCommand, CommandError
 from django.conf import settings
-from trees.models import ForestProperty, Stand, FVSVariant, ScenarioStand
+from trees.models import ForestProperty, Stand, ScenarioStand, SpeciesSizeCatalog
 
 class Command(BaseCommand):
 
     def handle(self, *args, **options):
-        from trees.views import list_species_sizecls
-        from django.test.client import RequestFactory
-
-        print "Caching the species_sizecls.json responses..."
-        for v in FVSVariant.objects.all():
-            request = RequestFactory().get('/trees/variant/%s/species_sizecls.json' % v.id)
-            list_species_sizecls(request, v.id)
+        print "Building the species size class catalogs..."
+        SpeciesSizeCatalog.rebuild()
 
         # from madrona.layer_manager.views import get_json
         # print "Caching the layer_manager response..."
@@ -0,0 +1,40 @@
+from optparse import make_option
+from django.core.management.base import BaseCommand
+from trees.terrain import (terrain_version, terrain_cache_stats,
+                           purge_terrain_cache)
+
+
+class Command(BaseCommand):
+    help = 'Reports on, purges or rebuilds the cached terrain zonal stats'
+    option_list = BaseCommand.option_list + (
+        make_option('--purge', action='store_true', dest='purge', default=False,
+                    help='Delete all cached terrain results'),
+        make_option('--stale', action='store_true', dest='stale', default=False,
+                    help='Delete cached terrain results from older terrain versions'),
+        make_option('--rebuild', action='store_true', dest='rebuild', default=False,
+                    help='Drop stale results, then recompute terrain for every stand '
+                         '(run after new process_dems.sh output is in place)'),
+    )
+
+    def handle(self, *args, **options):
+        print "Terrain version %s" % terrain_version()
+
+        if options['purge']:
+            print "\tPurged %d entries" % purge_terrain_cache()
+        elif options['stale'] or options['rebuild']:
+            print "\tPurged %d stale entries" % purge_terrain_cache(stale_only=True)
+
+        if options['rebuild']:
+            from trees.models import Stand, postgres_now, datetime_to_unix
+            from trees.tasks import impute_rasters_batch
+
+            savetime = datetime_to_unix(postgres_now())
+            by_property = {}
+            for stand_id, collection_id in Stand.objects.values_list('id', 'object_id'):
+                by_property.setdefault(collection_id, []).append(stand_id)
+            for stand_ids in by_property.values():
+                impute_rasters_batch(stand_ids, savetime)
+            print "\tRebuilt terrain for %d stands" % sum(len(x) for x in by_property.values())
+
+        for key, val in sorted(terrain_cache_stats().items()):
+            print "\t%s: %s" % (key, val)
@@ -0,0 +1,16 @@
+import os
+from django.core.management.base import BaseCommand
+from django.conf import settings
+from trees.terrain import TERRAIN_RASTERS, export_memmap
+
+
+class Command(BaseCommand):
+    help = 'Writes uncompressed memory-mappable copies (<raster>.npy) of the terrain rasters'
+
+    def handle(self, *args, **options):
+        for name in TERRAIN_RASTERS:
+            path = os.path.join(settings.TERRAIN_DIR, name)
+            if not os.path.exists(path):
+                print "\tSkipping %s, not found" % path
+                continue
+            print "\tWriting %s" % export_memmap(path)
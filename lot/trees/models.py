@@ -6,7 +6,6 @@ import datetime
 import math
 import random
 import time
-import operator
 import numpy as np
 import pandas as pd
 from django.contrib.gis.db import models
@@ -23,7 +22,7 @@ from madrona.common.utils import clean_geometry
 from madrona.common.utils import get_logger
 from django.core.cache import cache
 from django.contrib.gis.geos import GEOSGeometry
-from trees.tasks import impute_rasters, impute_nearest_neighbor, schedule_harvest
+from trees.tasks import impute_rasters, impute_rasters_batch, impute_nearest_neighbor, impute_nearest_neighbor_batch, schedule_harvest
 from django.db.models.signals import post_save, pre_delete
 from django.dispatch import receiver
 from django.db import connection
@@ -150,6 +149,44 @@ class Stand(DirtyFieldsMixin, PolygonFeature):
         savetime = datetime_to_unix(postgres_now())
         impute_rasters.delay(self.id, savetime)
 
+    def impute_terrain_inline(self, savetime):
+        '''
+        Synchronous computation of terrain variables for small stands,
+        from the worker's open rasters (trees.terrain) rather than a celery
+        round trip. Stands over settings.TERRAIN_SYNC_MAX_ACRES or
+        TERRAIN_SYNC_MAX_VERTICES are left alone (returns False)
+        so the caller can impute them asynchronously.
+        '''
+        from trees.terrain import cached_terrain_zonal
+
+        max_acres = getattr(settings, 'TERRAIN_SYNC_MAX_ACRES', 0)
+        max_vertices = getattr(settings, 'TERRAIN_SYNC_MAX_VERTICES', 0)
+        if not self.geometry_final or self.geometry_final.num_points > max_vertices:
+            return False
+        acres = self.acres
+        if acres is None or acres > max_acres:
+            return False
+
+        try:
+            g1 = self.geometry_final.transform(settings.TERRAIN_PROJ, clone=True)
+            elevation, slope, aspect, cost = cached_terrain_zonal(g1)
+        except Exception:
+            logger.exception("Inline terrain failed for stand %s; going async" % self.id)
+            return False
+
+        # same guard as impute_rasters; don't clobber a more recent request
+        updated = Stand.objects.filter(id=self.id, rast_savetime__lt=savetime).update(
+            elevation=elevation,
+            slope=slope,
+            aspect=aspect,
+            cost=cost,
+            rast_savetime=savetime)
+        if updated:
+            self.elevation, self.slope, self.aspect, self.cost = elevation, slope, aspect, cost
+            self.rast_savetime = savetime
+            self.invalidate_cache()
+        return True
+
     def get_cond_id(self, force=False):
         '''
         Synchronous computation of nearest neighbor or just return what we've got
@@ -169,6 +206,10 @@ class Stand(DirtyFieldsMixin, PolygonFeature):
         res = impute_nearest_neighbor(self.id, savetime)
         return res['cond_id']
 
+    @property
+    def has_terrain(self):
+        return bool(self.elevation and self.slope and self.aspect and self.cost)
+
     @property
     def is_locked(self):
         if self.locked_cond_id is None:
@@ -269,6 +310,11 @@ class Stand(DirtyFieldsMixin, PolygonFeature):
         return True
 
     def save(self, *args, **kwargs):
+        # defer_nn: caller will run nearest neighbor itself (in a batch)
+        # once terrain is in place; see impute_nearest_neighbor_batch
+        self._defer_nn = kwargs.pop('defer_nn', False)
+        # defer_rasters: likewise for terrain; see impute_rasters_batch
+        self._defer_rasters = kwargs.pop('defer_rasters', False)
         self.invalidate_cache()
 
         if not self.name or self.name.strip() == '':
@@ -278,6 +324,9 @@ class Stand(DirtyFieldsMixin, PolygonFeature):
         if 'geometry_final' in self.get_dirty_fields().keys() or not self.id:
             # got new geom - time to recalc terrain rasters!
             self.elevation = self.slope = self.aspect = self.cost = self.cond_id = None
+            # ... and the memoized costs are for the old shape and terrain
+            if self.id:
+                CostMemo.objects.filter(stand=self.id).delete()
         if 'strata_id' in self.get_dirty_fields().keys() or (not self.id and self.strata):
             # got new strata - time to recalc nearest neighbor!
             self.cond_id = None
@@ -287,11 +336,9 @@ class Stand(DirtyFieldsMixin, PolygonFeature):
             self.cond_id = self.locked_cond_id
 
         super(Stand, self).save(*args, **kwargs)
-        # Cheesy hack allows the app to pause long enough
-        # to hopefully get the terrain variables calculated
-        # TODO .. this is going to slow down shapefile imports
-        # why not just run the terrain zonal syncronously rather than deal with celery???
-        # time.sleep(0.2)
+        # Small stands get their terrain variables synchronously in the
+        # post-save handler (see impute_terrain_inline) unless the save is
+        # part of a batch (defer_rasters); the rest via celery
 
 
 class JSONField(models.TextField):
@@ -321,7 +368,7 @@ class JSONField(models.TextField):
         """Convert our JSON object to a string before we save"""
         if value == "":
             return None
-        if isinstance(value, dict):
+        if isinstance(value, (dict, list)):
             value = dumps(value, cls=DjangoJSONEncoder)
 
         return super(JSONField, self).get_db_prep_save(value, *args, **kwargs)
@@ -363,6 +410,11 @@ class Scenario(Feature):
     # contains dictionary of {scenariostand id: offset}
     # All output fields should be allowed to be Null/Blank
     output_scheduler_results = JSONField(null=True, blank=True)
+    # annual cost model totals, see output_cash_metrics
+    output_cash_results = JSONField(null=True, blank=True)
+    # when ScenarioStandResult last materialized the results; None if they
+    # have been cleared since (a run may legitimately materialize no rows)
+    results_materialized = models.DateTimeField(null=True, blank=True)
 
     def __unicode__(self):
         return self.name
@@ -391,29 +443,22 @@ class Scenario(Feature):
 
         sql = """SELECT
                     a.year AS year,
-                    SUM(a.total_stand_carbon * ss.acres) AS total_carbon,
-                    SUM(a.agl * ss.acres) AS agl_carbon,
-                    SUM(a.removed_merch_bdft * ss.acres)/1000.0 AS harvested_timber, -- convert to mbf
-                    SUM(a.after_merch_bdft * ss.acres)/1000.0 AS standing_timber, -- convert to mbf
-                    SUM(a.age * ss.acres)/ SUM(ss.acres) as age,  -- area-weighted average age
-                    SUM(a.after_ba * ss.acres)/ SUM(ss.acres) as ba, -- area-weighted average ba
-                    SUM(a.after_tpa * ss.acres)/ SUM(ss.acres) as tpa,  -- area-weighted average tpa
-                    SUM(a.after_total_ft3 * ss.acres) as standing_vol,
-                    SUM(CASE WHEN firehzd = 10 then ss.acres else 0 end) as fire, -- number of acres in high fire risk
-                    SUM(CASE WHEN pp_btl >= 7.5 OR lp_btl = 7.5 then ss.acres else 0 end) as pine_btl, -- number of acres in high pine btl
-                    SUM(CASE WHEN es_btl >= 7.5 then ss.acres else 0 end) as es_btl -- number of acres in high es btl
+                    SUM(a.total_stand_carbon * a.acres) AS total_carbon,
+                    SUM(a.agl * a.acres) AS agl_carbon,
+                    SUM(a.removed_merch_bdft * a.acres)/1000.0 AS harvested_timber, -- convert to mbf
+                    SUM(a.after_merch_bdft * a.acres)/1000.0 AS standing_timber, -- convert to mbf
+                    SUM(a.age * a.acres)/ SUM(a.acres) as age,  -- area-weighted average age
+                    SUM(a.after_ba * a.acres)/ SUM(a.acres) as ba, -- area-weighted average ba
+                    SUM(a.after_tpa * a.acres)/ SUM(a.acres) as tpa,  -- area-weighted average tpa
+                    SUM(a.after_total_ft3 * a.acres) as standing_vol,
+                    SUM(CASE WHEN firehzd = 10 then a.acres else 0 end) as fire, -- number of acres in high fire risk
+                    SUM(CASE WHEN pp_btl >= 7.5 OR lp_btl = 7.5 then a.acres else 0 end) as pine_btl, -- number of acres in high pine btl
+                    SUM(CASE WHEN es_btl >= 7.5 then a.acres else 0 end) as es_btl -- number of acres in high es btl
                 FROM
-                    trees_fvsaggregate a
-                JOIN
-                    trees_scenariostand ss
-                  ON  a.cond = ss.cond_id
-                  AND a.rx = ss.rx_internal_num
-                  AND a.offset = ss.offset
-                -- WHERE a.site = 2 -- TODO if we introduce multiple site classes, we need to fix
-                AND   a.var = '%s' -- get variant_code from current property
-                AND   ss.scenario_id = %d -- get id from current scenario
+                    trees_scenariostandresult a
+                WHERE a.scenario_id = %d -- get id from current scenario
                 GROUP BY a.year
-                ORDER BY a.year;""" % (self.input_property.variant.code, self.id)
+                ORDER BY a.year;""" % self.id
 
         cursor = connection.cursor()
         cursor.execute(sql)
@@ -447,7 +492,7 @@ class Scenario(Feature):
             d[sstand.pk] = defaultdict(list)
 
         sql = """SELECT
-                    ss.id AS sstand_id, a.cond, a.rx, a.year, a.offset, ss.acres AS acres,
+                    a.scenariostand_id AS sstand_id, a.cond, a.rx, a.year, a.offset, a.acres AS acres,
                     a.total_stand_carbon AS total_carbon,
                     a.agl AS agl_carbon,
                     a.removed_merch_bdft / 1000.0 AS harvested_timber, -- convert to mbf
@@ -460,16 +505,9 @@ class Scenario(Feature):
                     CASE WHEN a.pp_btl > a.lp_btl THEN a.pp_btl ELSE a.lp_btl END AS pine_btl,
                     a.es_btl AS es_btl
                 FROM
-                    trees_fvsaggregate a
-                JOIN
-                    trees_scenariostand ss
-                  ON  a.cond = ss.cond_id
-                  AND a.rx = ss.rx_internal_num
-                  AND a.offset = ss.offset
-                -- WHERE a.site = 2 -- TODO if we introduce multiple site classes, we need to fix
-                AND   var = '%s' -- get from current property
-                AND   ss.scenario_id = %d -- get from current scenario
-                ORDER BY ss.id, a.year;""" % (self.input_property.variant.code, self.id)
+                    trees_scenariostandresult a
+                WHERE a.scenario_id = %d -- get from current scenario
+                ORDER BY a.scenariostand_id, a.year;""" % self.id
 
         cursor = connection.cursor()
         cursor.execute(sql)
@@ -490,77 +528,88 @@ class Scenario(Feature):
         return d
 
     @property
-    @cachemethod("Scenario_%(id)s_revenue_metrics")
-    def output_revenue_metrics(self):
-        if self.needs_rerun or self.is_running:
-            return None
-
+    @cachemethod("Scenario_%(id)s_harvest_volumes")
+    def harvest_volumes(self):
+        """
+        Harvested volume (mbf, all stands) by year and timber type
+        {'years': [year, ...], 'timber_types': ['cedr_hrv', ...],
+         'volumes': [[mbf of each timber type] for each year]}
+        """
+        timber_types = [x[0] for x in timber_choices]
         sql = """SELECT
-                    ss.id                          AS sstand_id,
-                    a.year                         AS year,
-                    ss.acres                       AS acres,
-                    a.CUT_TYPE                     AS CUT_TYPE,
-                    a.CEDR_HRV / 1000              AS CEDR_HRV,
-                    a.DF_HRV / 1000                AS DF_HRV,
-                    a.HW_HRV / 1000                AS HW_HRV,
-                    a.MNCONHRV / 1000              AS MNCONHRV,
-                    a.MNHW_HRV / 1000              AS MNHW_HRV,
-                    a.PINE_HRV / 1000              AS PINE_HRV,
-                    a.WJ_HRV / 1000                AS WJ_HRV,
-                    a.WW_HRV / 1000                AS WW_HRV,
-                    a.SPRC_HRV / 1000              AS SPRC_HRV
+                    a.year AS year,
+                    %s
                 FROM
-                    trees_fvsaggregate a
-                JOIN
-                    trees_scenariostand ss
-                  ON  a.cond = ss.cond_id
-                  AND a.rx = ss.rx_internal_num
-                  AND a.offset = ss.offset
-                WHERE   var = '%s' -- get from current property
-                AND   ss.scenario_id = %d -- get from current scenario
-                ORDER BY a.year, ss.id;""" % (self.input_property.variant.code, self.id)
+                    trees_scenariostandresult a
+                WHERE a.scenario_id = %%s -- get from current scenario
+                GROUP BY a.year
+                ORDER BY a.year;""" % ",\n                    ".join(
+            "SUM(COALESCE(a.%s, 0) / 1000 * a.acres) AS %s" % (t, t) for t in timber_types)
 
         cursor = connection.cursor()
-        cursor.execute(sql)
-        desc = cursor.description
-        rows = [dict(zip([col[0] for col in desc], row))
-                for row in cursor.fetchall()]
+        cursor.execute(sql, [self.id])
+        years = []
+        volumes = []
+        for row in cursor.fetchall():
+            years.append(int(row[0]))
+            volumes.append(list(row[1:]))
 
-        timber_prices = list(TimberPrice.objects.filter(variant=self.input_property.variant))
+        return {'years': years, 'timber_types': timber_types, 'volumes': volumes}
 
-        prices_per_mbf = dict([
-            (x.timber_type, x.price)
-            for x in timber_prices
-        ])
+    def gross_revenue(self, price_vectors):
+        """
+        Annual gross revenue for each of a list of price vectors
+        ({timber_type: price per mbf}, missing types are worth nothing),
+        as one product of the harvest volume matrix (years x timber types)
+        and the price matrix (timber types x price vectors)
+        Returns: (years, [[revenue for each year] for each price vector])
+        """
+        hv = self.harvest_volumes
+        timber_types = hv['timber_types']
+        volumes = np.array(hv['volumes'], dtype=np.float64).reshape(
+            len(hv['years']), len(timber_types))
+        prices = np.array([[pv.get(t, 0.0) for pv in price_vectors] for t in timber_types],
+                          dtype=np.float64).reshape(len(timber_types), len(price_vectors))
+        gross = np.dot(volumes, prices)
+        return hv['years'], gross.T.tolist()
+
+    def output_revenue_sweep(self, price_vectors):
+        """
+        Annual gross revenue under each of a list of price vectors
+        ({timber_type: price per mbf}); timber types left out of a vector
+        keep the variant's current TimberPrice
+        """
+        if self.needs_rerun or self.is_running:
+            return None
 
-        annual_revenue = defaultdict(float)
+        current = dict(TimberPrice.objects.filter(
+            variant=self.input_property.variant).values_list('timber_type', 'price'))
+        vectors = []
+        for pv in price_vectors:
+            prices = current.copy()
+            prices.update(pv)
+            vectors.append(prices)
 
-        year = None
-        years = []
-        for row in rows:
-            if year != int(row['year']):
-                year = int(row['year'])
-                years.append(year)
-                annual_revenue[year] += 0
+        years, gross = self.gross_revenue(vectors)
+        return {'years': years, 'gross': gross, 'prices': vectors}
 
-            acres = row['acres']
+    @property
+    @cachemethod("Scenario_%(id)s_revenue_metrics")
+    def output_revenue_metrics(self):
+        if self.needs_rerun or self.is_running:
+            return None
 
-            for k, v in row.items():
-                if 'hrv' not in k or v is None or v == 0:
-                    continue
-                price = prices_per_mbf[k]
-                revenue = v * acres * price
-                annual_revenue[year] += revenue
+        timber_prices = list(TimberPrice.objects.filter(variant=self.input_property.variant))
 
-        def ordered_revenue(x, years):
-            sorted_x = sorted(x.iteritems(), key=operator.itemgetter(0))
-            return [rev for year, rev in sorted_x if year in years]
+        prices_per_mbf = dict([
+            (x.timber_type, x.price)
+            for x in timber_prices
+        ])
 
-        rev = dict(annual_revenue)
+        years, (gross,) = self.gross_revenue([prices_per_mbf])
 
         data = {}
-        data['years'] = sorted(rev.keys())
-        gross = ordered_revenue(rev, data['years'])
+        data['years'] = years
         data['gross'] = gross
 
         price_sheet = dict([
@@ -571,168 +620,25 @@ class Scenario(Feature):
         return data
 
     @property
-    @cachemethod("Scenario_%(id)s_cash_metrics")
     def output_cash_metrics(self):
+        """
+        The annual cost model totals, precomputed after each run
+        (tasks.precompute_cash_metrics). {'status': 'computing'} until they are ready
+        """
         if self.needs_rerun or self.is_running:
             return None
 
-        from forestcost import main_model
-        from forestcost import routing
-        from forestcost import landing
+        data = self.output_cash_results
+        if data is None:
+            if not cache.get('CashPending_%s' % self.uid):
+                from trees.tasks import precompute_cash_metrics
+                cache.set('CashPending_%s' % self.uid, True, 60 * 60)
+                precompute_cash_metrics.delay(self.id)
+            return {'status': 'computing'}
 
-        sql = """SELECT
-                    ss.id AS sstand_id,
-                    a.cond, a.rx, a.year, a.offset,
-                    ST_AsText(ss.geometry_final) AS stand_wkt,
-                    ss.acres         AS acres,
-                    a.LG_CF          AS LG_CF,
-                    a.LG_HW          AS LG_HW,
-                    a.LG_TPA         AS LG_TPA,
-                    a.SM_CF          AS SM_CF,
-                    a.SM_HW          AS SM_HW,
-                    a.SM_TPA         AS SM_TPA,
-                    a.CH_CF          AS CH_CF,
-                    a.CH_HW          AS CH_HW,
-                    a.CH_TPA         AS CH_TPA,
-                    stand.elevation  AS elev,
-                    stand.slope      AS slope,
-                    a.CUT_TYPE       AS CUT_TYPE
-                FROM
-                    trees_fvsaggregate a
-                JOIN
-                    trees_scenariostand ss
-                  ON  a.cond = ss.cond_id
-                  AND a.rx = ss.rx_internal_num
-                  AND a.offset = ss.offset
-                JOIN trees_stand stand
-                  ON ss.stand_id = stand.id
-                -- WHERE a.site = 2 -- TODO if we introduce multiple site classes, we need to fix
-                WHERE   var = '%s' -- get from current property
-                AND   ss.scenario_id = %d -- get from current scenario
-                ORDER BY a.year, ss.id;""" % (self.input_property.variant.code, self.id)
-
-        cursor = connection.cursor()
-        cursor.execute(sql)
-        desc = cursor.description
-        rows = [
-            dict(zip([col[0] for col in desc], row))
-            for row in cursor.fetchall()
-            if None not in row  # remove any nulls; incomplete data can't be used
-        ]
-
-        # Landing Coordinates
-        center = self.input_property.geometry_final.point_on_surface
-        centroid_coords = center.transform(4326, clone=True).tuple
-        try:
-            landing_coords = landing.landing(centroid_coords=centroid_coords)
-        except:
-            logger.error("Cost model landing failed: centroid_coords=%r" % (centroid_coords,))
-            return None
-
-        try:
-            haulDist, haulTime, coord_mill = routing.routing(
-                landing_coords, mill_shp=settings.MILL_SHAPEFILE
-            )
-        except:
-            logger.error("Cost model routing failed: landing=%r millshp=%s" % (landing_coords, settings.MILL_SHAPEFILE))
+        if 'error' in data:
+            # landing or routing failed
             return None
-
-        annual_total_cost = defaultdict(float)
-        annual_haul_cost = defaultdict(float)
-        annual_ground_harvest_cost = defaultdict(float)
-        annual_cable_harvest_cost = defaultdict(float)
-        used_records = 0
-        skip_noharvest = 0
-        skip_error = 0
-
-        year = None
-        years = []
-        for row in rows:
-            if year != int(row['year']):
-                year = int(row['year'])
-                years.append(year)
-                annual_total_cost[year] += 0
-                annual_haul_cost[year] += 0
-                annual_ground_harvest_cost[year] += 0
-                annual_cable_harvest_cost[year] += 0
-                #annual_admin_cost[year] += 0
-                #annual_tax_cost[year] += 0
-                #annual_road_cost[year] += 0
-
-            ### Tree Data ###
-            # Cut type code indicating type of harvest implemented.
-            # 0 = no harvest, 1 = pre-commercial thin,
-            # 2 = commercial thin, 3 = regeneration harvest
-            try:
-                cut_type = int(row['cut_type'])
-            except:
-                # no harvest so don't attempt to calculate
-                cut_type = 0
-
-            # PartialCut(clear cut = 0, partial cut = 1)
-            if cut_type == 3:
-                PartialCut = 0
-                # Assume partial cut moves all the timber off-site
-                haul_prop = 1.0
-            elif cut_type in [1, 2]:
-                PartialCut = 1
-                # Assume partial cut moves 1/2 the timber off-site
-                haul_prop = 0.5
-            else:
-                # no harvest so don't attempt to calculate
-                skip_noharvest += 1
-                continue
-
-            cost_args = (
-                # stand info
-                row['acres'], row['elev'], row['slope'], row['stand_wkt'],
-                # harvest info
-                row['ch_tpa'], row['ch_cf'],
-                row['sm_tpa'], row['sm_cf'],
-                row['lg_tpa'], row['lg_cf'],
-                row['ch_hw'], row['sm_hw'], row['lg_hw'],
-                PartialCut,
-                # routing info
-                landing_coords, haulDist, haulTime, coord_mill
-            )
-
-            try:
-                result = main_model.cost_func(*cost_args,
-                    Helicopter=False,  # don't bother with helipcopter logging costs
-                    HaulProportion=haul_prop  # only haul the requisite proportion
-                )
-            except Exception as e:
-                handle_cost_error(e, cost_args, row['sstand_id'])
-                skip_error += 1
-
-            annual_haul_cost[year] += result['total_haul_cost']
-            annual_total_cost[year] += result['total_cost']
-
-            system = result['harvest_system']
-            if system.startswith("Ground"):
-                annual_ground_harvest_cost[year] += result['total_harvest_cost']
-            elif system.startswith("Cable"):
-                annual_cable_harvest_cost[year] += result['total_harvest_cost']
-            else:
-                # Assume not ground and not cable = no harvest
-                skip_noharvest += 1
-                continue
-            used_records += 1
-
-        # Costs
-        def ordered_costs(x):
-            sorted_x = sorted(x.iteritems(), key=operator.itemgetter(0))
-            return [z[1] for z in sorted_x]
-
-        data = {}
-        data['cable'] = ordered_costs(annual_cable_harvest_cost)
-        data['ground'] = ordered_costs(annual_ground_harvest_cost)
-        data['haul'] = ordered_costs(annual_haul_cost)
-        data['years'] = sorted(annual_haul_cost.keys())
-        # data['admin'] = ordered_costs(annual_admin_cost)
-        # data['tax'] = ordered_costs(annual_tax_cost)
-        # data['road'] = ordered_costs(annual_road_cost)
-
         return data
 
     @property
@@ -763,7 +669,20 @@ class Scenario(Feature):
         if not self.output_scheduler_results:
             return True
 
+        # results are materialized by the run (see ScenarioStandResult)
+        results_missing = self.results_materialized is None
+
+        return results_missing or not self.scenariostands_current
+
+    @property
+    def scenariostands_current(self):
+        '''
+        True if the scenario stands of the last run still match
+        the property's stands
+        '''
         results = self.output_scheduler_results
+        if not results:
+            return False
 
         # make sure we have exactly the same IDs
         sstand_ids = [int(x.id) for x in self.scenariostand_set.all()]
@@ -788,9 +707,9 @@ class Scenario(Feature):
             time_mismatch = True
 
         if sstand_id_mismatch or stand_id_mismatch or time_mismatch:
-            return True
+            return False
 
-        return False
+        return True
 
     @property
     def is_runnable(self):
@@ -955,6 +874,11 @@ class Scenario(Feature):
                       'trees.views.scenario_revenue',
                       type="application/json",
                       select='single'),
+            # Link to calculate revenue under several sets of timber prices
+            alternate('Scenario Revenue Sweep',
+                      'trees.views.scenario_revenue_sweep',
+                      type="application/json",
+                      select='single'),
         )
 
 
@@ -1319,6 +1243,40 @@ class ForestProperty(FeatureCollection):
                 the_variant = variant
         return the_variant
 
+    @property
+    @cachemethod("ForestProperty_%(id)s_cost_routing")
+    def cost_routing(self):
+        '''
+        Returns: (landing_coords, haulDist, haulTime, coord_mill)
+        the cost model landing and haul route to the nearest mill,
+        shared by all scenarios on this property (see trees.costs.cost_rows)
+        Raises trees.costs.CostModelError if either fails
+        '''
+        from forestcost import routing
+        from forestcost import landing
+        from trees.costs import CostModelError, nearest_mill
+
+        # Landing Coordinates
+        center = self.geometry_final.point_on_surface
+        centroid_coords = center.transform(4326, clone=True).tuple
+        try:
+            landing_coords = landing.landing(centroid_coords=centroid_coords)
+        except:
+            raise CostModelError("Cost model landing failed: centroid_coords=%r" % (centroid_coords,))
+
+        # route to the nearest mill from the per-process index
+        # rather than having forestcost re-read the mill shapefile
+        mill_coords = nearest_mill(landing_coords)
+        try:
+            haulDist, haulTime, coord_mill = routing.routing(
+                landing_coords, mill_coords=mill_coords
+            )
+        except:
+            raise CostModelError("Cost model routing failed: landing=%r mill=%r" % (
+                landing_coords, mill_coords))
+
+        return landing_coords, haulDist, haulTime, coord_mill
+
     @property
     @cachemethod("ForestProperty_%(id)s_location")
     def location(self):
@@ -1393,13 +1351,13 @@ class ForestProperty(FeatureCollection):
 
         return path
 
-    def adjacency(self, threshold=1.0):
+    def adjacency(self, threshold=1.0, postgis=False):
         from trees.utils import calculate_adjacency
         stands = Stand.objects.filter(
             content_type=ContentType.objects.get_for_model(self),
             object_id=self.pk
         )
-        return calculate_adjacency(stands, threshold)
+        return calculate_adjacency(stands, threshold, postgis)
 
     def share_with_group(self, group, requester):
         if self.user == requester and group.user_is_member(requester):
@@ -1637,6 +1595,9 @@ class Strata(DirtyFieldsMixin, Feature):
     search_tpa = models.FloatField()
     additional_desc = models.TextField(blank=True, null=True)
     stand_list = JSONField()  # {'classes': [(species, age class, tpa), ...]}
+    # stand list classes dropped from the candidate search because they
+    # yielded too few matching plots; set by clean() with the search itself
+    relaxed_classes = JSONField(null=True, blank=True, default=None)
 
     @property
     def _dict(self):
@@ -1692,16 +1653,20 @@ class Strata(DirtyFieldsMixin, Feature):
         except:
             raise ValidationError("Cannot look up variant from stand list.property")
 
-        from plots import get_candidates, NearestNeighborError
+        from plots import get_relaxed_candidates, NearestNeighborError
         min_candidates = 1
         try:
-            candidates = get_candidates(self.stand_list['classes'], variant.code, min_candidates)
+            candidates, dropped = get_relaxed_candidates(
+                self.stand_list['classes'], variant.code, min_candidates)
         except NearestNeighborError:
             raise ValidationError("Stand list did not return enough candidate plots.")
 
         if len(candidates) < min_candidates:
             raise ValidationError("Stand list did not return enough candidate plots.")
 
+        # kept so the strata list can explain the relaxation without
+        # repeating the candidate search
+        self.relaxed_classes = dropped
         return True
 
     def save(self, *args, **kwargs):
@@ -1722,12 +1687,32 @@ class Strata(DirtyFieldsMixin, Feature):
 
         super(Strata, self).save(*args, **kwargs)
 
+        if 'stand_list' in dirty.keys():
+            from plots import invalidate_plot_matchers
+            try:
+                invalidate_plot_matchers(dirty['stand_list']['classes'])
+            except (KeyError, TypeError):
+                pass
+
         if recalc_required:
             # null out nearest neighbor field
             # (post-save signal must be triggered so can't use qs.update)
+            # stands that already have terrain are matched in a single batch,
+            # the rest get terrain (then nearest neighbor) in another
+            batch = []
+            terrain_batch = []
             for stand in self.stand_set.all():
                 stand.cond_id = None
-                stand.save()
+                stand.save(defer_nn=True, defer_rasters=True)
+                if not stand.has_terrain:
+                    terrain_batch.append(stand.id)
+                elif not stand.is_locked:
+                    batch.append(stand.id)
+            savetime = datetime_to_unix(postgres_now())
+            if batch:
+                impute_nearest_neighbor_batch.apply_async(args=(batch, savetime))
+            if terrain_batch:
+                impute_rasters_batch.apply_async(args=(terrain_batch, savetime))
 
         for stand in self.stand_set.all():
             #print "Invalidating ", stand
@@ -1768,6 +1753,28 @@ class TreeliveSummary(models.Model):
             self.cond_id, self.fia_forest_type_name, self.calc_dbh_class, self.sumoftpa, self.pct_of_totalba)
 
 
+class TreeliveCrosstab(models.Model):
+    """
+    treelive_summary rolled up by variant, condition, FVS species code and
+    2" dbh class, for the species matching within each condition's variants.
+
+    A materialized copy; don't edit directly, it is rebuilt from
+    treelive_summary by trees.plots.refresh_treelive_crosstab
+    """
+    variant = models.CharField(max_length=10)
+    cond_id = models.BigIntegerField()
+    fvs_spp_code = models.CharField(max_length=10)
+    calc_dbh_class = models.FloatField()
+    sumoftpa = models.FloatField(null=True, blank=True)
+    sumofba_ft2_ac = models.FloatField(null=True, blank=True)
+    pct_of_totalba = models.FloatField(null=True, blank=True)
+    count_speciessizeclasses = models.FloatField(null=True, blank=True)
+    total_ba_ft2_ac = models.FloatField(null=True, blank=True)
+
+    class Meta:
+        db_table = u'treelive_crosstab'
+
+
 class ConditionVariantLookup(models.Model):
     """
     Instead of making a M2M relationship on IdbSummary, we will maintain this table
@@ -1814,6 +1821,117 @@ class FVSVariant(models.Model):
         return Rx.objects.filter(variant=self, internal_type="GO")[0]
 
 
+class SpeciesSizeCatalog(models.Model):
+    """
+    The species and suggested size classes available in a variant,
+    serialized as served to the strata editor.
+
+    Depends only on the plot data so it is built at data-load time
+    (see rebuild) rather than aggregated per request.
+    """
+    variant = models.OneToOneField(FVSVariant, related_name='species_catalog')
+    catalog_json = models.TextField()
+    etag = models.CharField(max_length=40)
+    date_modified = models.DateTimeField(auto_now=True)
+
+    # Suggested diameter classes
+    dbh_classes = [
+        [0, 2],
+        [2, 6],
+        [6, 12],
+        [12, 24],
+        [24, 36],
+        [36, 48],
+        [48, 999],  # the top end will get replaced
+    ]
+    ignore_species = []
+
+    def __unicode__(self):
+        return u'Species catalog for %s' % self.variant
+
+    @classmethod
+    def summarize(cls, rows):
+        """
+        Turn (species, min_dbh, max_dbh, count) rows into the catalog list
+        """
+        res = []
+        for species, min_dbh, max_dbh, count in rows:
+            relevant_classes = [dict(zip(['min', 'max'], [float(y) for y in x]))
+                                for x in cls.dbh_classes
+                                if x[1] > min_dbh and x[0] <= max_dbh]
+
+            # filter
+            if count <= 10:
+                continue
+            if species in cls.ignore_species:
+                continue
+            if 'unknown' in species.lower():
+                continue
+            if len(relevant_classes) == 0:
+                continue
+
+            relevant_classes[-1]['max'] = max_dbh  # limit top end
+            res.append({
+                'species': species,
+                'size_classes': relevant_classes,
+            })
+        return res
+
+    @classmethod
+    def rebuild(cls, variants=None):
+        """
+        (Re)build the catalogs for the given variants (default all)
+        with a single aggregate over treelive_summary
+        """
+        import hashlib
+        from django.db import transaction
+
+        if variants is None:
+            variants = FVSVariant.objects.all()
+        by_code = dict((v.code, v) for v in variants)
+        if not by_code:
+            return []
+
+        sql = """
+        SELECT cvl.variant_code,
+               fia_forest_type_name,
+               MIN(calc_dbh_class) AS min_dbh,
+               MAX(calc_dbh_class) AS max_dbh,
+               COUNT(calc_dbh_class) AS number
+        FROM treelive_summary summary, trees_conditionvariantlookup cvl
+        WHERE cvl.cond_id = summary.cond_id
+        AND cvl.variant_code IN %s
+        GROUP BY fia_forest_type_name, variant_code
+        """
+        cursor = connection.cursor()
+        cursor.execute(sql, (tuple(by_code.keys()),))
+        rows = defaultdict(list)
+        for row in cursor.fetchall():
+            rows[row[0]].append(row[1:])
+
+        catalogs = []
+        with transaction.commit_on_success():
+            for code, variant in by_code.items():
+                catalog_json = dumps(cls.summarize(rows[code]))
+                catalog, created = cls.objects.get_or_create(
+                    variant=variant, defaults={'catalog_json': catalog_json})
+                catalog.catalog_json = catalog_json
+                catalog.etag = hashlib.sha1(catalog_json).hexdigest()
+                catalog.save()
+                catalogs.append(catalog)
+        return catalogs
+
+    @classmethod
+    def for_variant(cls, variant):
+        """
+        The catalog for a variant, building it if the loaders haven't
+        """
+        try:
+            return cls.objects.get(variant=variant)
+        except cls.DoesNotExist:
+            return cls.rebuild([variant])[0]
+
+
 # Auto-generated `LayerMapping` dictionaries for shapefile-backed models
 county_mapping = {
     'fips': 'FIPS',
@@ -1928,12 +2046,13 @@ class SpatialConstraint(models.Model):
 class ScenarioStand(PolygonFeature):
     """
     Populated as the scenario is created (tasks.schedule_harvest)
-    ScenarioStands were intended to be the result of a spatial intersection b/t
+    ScenarioStands are the result of a spatial identity b/t
       1. Stands for this scenario
       2. All SpatialConstraints chosen for this scenario
     The Rx from #2 takes precedence over the Rx from #1.
+    see trees.utils.create_scenariostands
 
-    BUT... we currently just copy the stands 1:1 to scenariostands
+    Without any SpatialConstraints the stands are just copied 1:1
     see trees.utils.fake_scenariostands
     """
     # geometry_final = inherited from PolygonFeature
@@ -1979,6 +2098,134 @@ class ScenarioStand(PolygonFeature):
         super(ScenarioStand, self).save(*args, **kwargs)
 
 
+class ScenarioStandResult(models.Model):
+    """
+    Growth-and-yield results for a scenario, one row per ScenarioStand per year.
+    A copy of the FVSAggregate columns used by the Scenario output_* metrics,
+    materialized once when the scenario is run (tasks.schedule_harvest)
+    so reading the metrics never has to join the (large) FVSAggregate table.
+    """
+    scenario = models.ForeignKey(Scenario)
+    scenariostand = models.ForeignKey(ScenarioStand)
+    year = models.FloatField()
+    cond = models.IntegerField()
+    rx = models.IntegerField()
+    offset = models.IntegerField()
+    acres = models.FloatField()
+    # from FVSAggregate
+    agl = models.FloatField(null=True, blank=True)
+    total_stand_carbon = models.FloatField(null=True, blank=True)
+    cut_type = models.FloatField(null=True, blank=True)
+    firehzd = models.FloatField(null=True, blank=True)
+    es_btl = models.FloatField(null=True, blank=True)
+    lp_btl = models.FloatField(null=True, blank=True)
+    pp_btl = models.FloatField(null=True, blank=True)
+    cedr_hrv = models.FloatField(null=True, blank=True)
+    df_hrv = models.FloatField(null=True, blank=True)
+    hw_hrv = models.FloatField(null=True, blank=True)
+    mnconhrv = models.FloatField(null=True, blank=True)
+    mnhw_hrv = models.FloatField(null=True, blank=True)
+    pine_hrv = models.FloatField(null=True, blank=True)
+    sprc_hrv = models.FloatField(null=True, blank=True)
+    wj_hrv = models.FloatField(null=True, blank=True)
+    ww_hrv = models.FloatField(null=True, blank=True)
+    ch_cf = models.FloatField(null=True, blank=True)
+    ch_hw = models.FloatField(null=True, blank=True)
+    ch_tpa = models.FloatField(null=True, blank=True)
+    lg_cf = models.FloatField(null=True, blank=True)
+    lg_hw = models.FloatField(null=True, blank=True)
+    lg_tpa = models.FloatField(null=True, blank=True)
+    sm_cf = models.FloatField(null=True, blank=True)
+    sm_hw = models.FloatField(null=True, blank=True)
+    sm_tpa = models.FloatField(null=True, blank=True)
+    after_ba = models.IntegerField(null=True, blank=True)
+    after_merch_bdft = models.IntegerField(null=True, blank=True)
+    after_total_ft3 = models.IntegerField(null=True, blank=True)
+    after_tpa = models.IntegerField(null=True, blank=True)
+    age = models.IntegerField(null=True, blank=True)
+    removed_merch_bdft = models.IntegerField(null=True, blank=True)
+
+    fvs_fields = [
+        'agl', 'total_stand_carbon', 'cut_type', 'firehzd', 'es_btl', 'lp_btl', 'pp_btl',
+        'cedr_hrv', 'df_hrv', 'hw_hrv', 'mnconhrv', 'mnhw_hrv', 'pine_hrv', 'sprc_hrv',
+        'wj_hrv', 'ww_hrv', 'ch_cf', 'ch_hw', 'ch_tpa', 'lg_cf', 'lg_hw', 'lg_tpa',
+        'sm_cf', 'sm_hw', 'sm_tpa', 'after_ba', 'after_merch_bdft', 'after_total_ft3',
+        'after_tpa', 'age', 'removed_merch_bdft',
+    ]
+
+    @classmethod
+    def clear(klass, scenario):
+        # raw delete; the ORM would fetch every row first
+        cursor = connection.cursor()
+        cursor.execute("DELETE FROM trees_scenariostandresult WHERE scenario_id = %s",
+                       [scenario.id])
+        Scenario.objects.filter(pk=scenario.id).update(results_materialized=None)
+        scenario.results_materialized = None
+
+    @classmethod
+    def materialize(klass, scenario):
+        """
+        Replace the results for a scenario with those of its current
+        ScenarioStands (cond, rx, offset), in one INSERT ... SELECT,
+        and stamp the scenario's results_materialized
+        """
+        from django.db import transaction
+
+        columns = ", ".join(klass.fvs_fields)
+        a_columns = ", ".join("a.%s" % x for x in klass.fvs_fields)
+        sql = """
+            INSERT INTO trees_scenariostandresult
+                (scenario_id, scenariostand_id, year, cond, rx, "offset", acres, %s)
+            SELECT ss.scenario_id, ss.id, a.year, a.cond, a.rx, a.offset, ss.acres, %s
+            FROM
+                trees_fvsaggregate a
+            JOIN
+                trees_scenariostand ss
+              ON  a.cond = ss.cond_id
+              AND a.rx = ss.rx_internal_num
+              AND a.offset = ss.offset
+            -- WHERE a.site = 2 -- TODO if we introduce multiple site classes, we need to fix
+            WHERE a.var = %%s -- get variant_code from current property
+            AND   ss.scenario_id = %%s -- get id from current scenario
+        """ % (columns, a_columns)
+
+        with transaction.commit_on_success():
+            klass.clear(scenario)
+            cursor = connection.cursor()
+            cursor.execute(sql, [scenario.input_property.variant.code, scenario.id])
+            # stamped separately from the rows: none may match
+            now = datetime.datetime.now()
+            Scenario.objects.filter(pk=scenario.id).update(results_materialized=now)
+            scenario.results_materialized = now
+            return cursor.rowcount
+
+
+class CostMemo(models.Model):
+    """
+    Cost model (forestcost main_model.cost_func) results, keyed by a digest
+    of the cost_func arguments (see trees.costs.cost_key). Shared by all
+    scenarios, so re-runs and scenarios with the same stands and harvests
+    only price rows that haven't been seen before.
+    """
+    key = models.CharField(max_length=40, unique=True)
+    # for invalidation when the stand's geometry changes
+    stand = models.ForeignKey(Stand)
+    total_cost = models.FloatField()
+    total_haul_cost = models.FloatField()
+    total_harvest_cost = models.FloatField()
+    harvest_system = models.CharField(max_length=100)
+    date_created = models.DateTimeField(auto_now_add=True)
+
+    @property
+    def result(self):
+        return {
+            'total_cost': self.total_cost,
+            'total_haul_cost': self.total_haul_cost,
+            'total_harvest_cost': self.total_harvest_cost,
+            'harvest_system': self.harvest_system,
+        }
+
+
 class FVSAggregate(models.Model):
     """
     Model to hold all FVS growth-and-yield results
@@ -2173,11 +2420,16 @@ def postsave_stand_handler(sender, *args, **kwargs):
 
     savetime = datetime_to_unix(postgres_now())
 
-    has_terrain = False
-    if st.elevation and st.slope and st.aspect and st.cost:
-        has_terrain = True
+    has_terrain = st.has_terrain
 
-    if not has_terrain and not st.strata:
+    if not has_terrain and getattr(st, '_defer_rasters', False):
+        # terrain (and nearest neighbor after it) will be run in a batch
+        pass
+    elif not has_terrain and st.impute_terrain_inline(savetime):
+        # small stand, terrain is done; calculate nearest neighbors if needed
+        if st.strata and not st.cond_id and not getattr(st, '_defer_nn', False):
+            impute_nearest_neighbor.apply_async(args=(st.id, savetime))
+    elif not has_terrain and not st.strata:
         # just impute terrain rasters"
         impute_rasters.apply_async(args=(st.id, savetime))
     elif not st.cond_id and not has_terrain and st.strata:
@@ -2186,7 +2438,8 @@ def postsave_stand_handler(sender, *args, **kwargs):
                                    link=impute_nearest_neighbor.s(savetime))
     elif has_terrain and st.strata and not st.cond_id:
         # just calculate nearest neighbors"
-        impute_nearest_neighbor.apply_async(args=(st.id, savetime))
+        if not getattr(st, '_defer_nn', False):
+            impute_nearest_neighbor.apply_async(args=(st.id, savetime))
     else:
         # we already have all aux data; no need to call any async processes
         # (assuming the model save has nulled out the appropos fields)
@@ -2199,10 +2452,15 @@ def delete_strata_handler(sender, *args, **kwargs):
     When a strata is deleted, make sure to set all stand's cond_id to null
     and invalidate the stand's caches
     '''
+    from trees.plots import invalidate_plot_matchers
     strata = kwargs['instance']
     for stand in strata.stand_set.all():
         #print "Invalidating stand", stand, "after deleting strata ", strata
         stand.invalidate_cache()
+    try:
+        invalidate_plot_matchers(strata.stand_list['classes'])
+    except (KeyError, TypeError):
+        pass
     strata.stand_set.all().update(
         cond_id=None, strata=None,
         nn_savetime=datetime_to_unix(datetime.datetime.now())
@@ -9,7 +9,7 @@ DELAY = 0.5
 @task(max_retries=5, default_retry_delay=DELAY)  # retry up to 5 times, 5 seconds apart
 def impute_rasters(stand_id, savetime):
     # import here to avoid circular dependencies
-    from trees.utils import terrain_zonal
+    from trees.terrain import cached_terrain_zonal
     from trees.models import Stand
     from django.conf import settings
 
@@ -23,12 +23,7 @@ def impute_rasters(stand_id, savetime):
     g1 = stand.geometry_final.transform(rproj, clone=True)
 
     # Either get cached zonal stats or generate it
-    key = "terrain_zonal_%s" % (g1.wkt.__hash__())
-    stats = cache.get(key)
-    if stats is None:
-        stats = terrain_zonal(g1)
-        cache.set(key, stats, 60 * 60 * 24 * 365)
-    elevation, slope, aspect, cost = stats
+    elevation, slope, aspect, cost = cached_terrain_zonal(g1)
 
     # stuff might have changed, we dont want a wholesale update of all fields!
     # use the timestamp to make sure we don't clobber a more recent request
@@ -48,11 +43,56 @@ def impute_rasters(stand_id, savetime):
     return res
 
 
+@task()
+def impute_rasters_batch(stand_ids, savetime):
+    '''
+    Terrain for many stands (typically all stands of a property) at once;
+    each terrain raster is read once for the lot (see trees.terrain).
+    Stands that then have everything nearest neighbor needs are handed
+    to impute_nearest_neighbor_batch.
+    '''
+    # import here to avoid circular dependencies
+    from trees.terrain import cached_terrain_zonal_batch
+    from trees.models import Stand
+    from django.conf import settings
+
+    rproj = settings.TERRAIN_PROJ
+    stands = list(Stand.objects.filter(id__in=stand_ids))
+
+    # Either get cached zonal stats or generate them, all misses in one go
+    geoms = [stand.geometry_final.transform(rproj, clone=True) for stand in stands]
+    stats = dict(zip([stand.id for stand in stands], cached_terrain_zonal_batch(geoms)))
+
+    results = []
+    nn_batch = []
+    for stand in stands:
+        elevation, slope, aspect, cost = stats[stand.id]
+
+        # use the timestamp to make sure we don't clobber a more recent request
+        Stand.objects.filter(id=stand.id, rast_savetime__lt=savetime).update(
+            elevation=elevation,
+            slope=slope,
+            aspect=aspect,
+            cost=cost,
+            rast_savetime=savetime)
+        stand.invalidate_cache()
+
+        if stand.strata_id and not stand.cond_id:
+            nn_batch.append(stand.id)
+        results.append({'stand_id': stand.id, 'elevation': elevation, 'aspect': aspect,
+                        'slope': slope, 'cost': cost})
+
+    if nn_batch:
+        impute_nearest_neighbor_batch.apply_async(args=(nn_batch, savetime))
+
+    return results
+
+
 @task(max_retries=5, default_retry_delay=DELAY)  # retry up to 5 times, 5 seconds apart
 def impute_nearest_neighbor(stand_results, savetime):
     # import here to avoid circular dependencies
     from trees.models import Stand, IdbSummary
-    from trees.plots import get_nearest_neighbors
+    from trees.plots import get_nearest_neighbors, get_site_conditions
 
     # you can pass the output of impute_rasters OR a stand id
 
@@ -89,19 +129,7 @@ def impute_nearest_neighbor(stand_results, savetime):
     variant = stand.collection.variant.code
 
     stand_list = stand.strata.stand_list
-    geom = stand.geometry_final.transform(4326, clone=True)
-    site_cond = {
-        'latitude_fuzz': geom.centroid[1],
-        'longitude_fuzz': geom.centroid[0],
-    }
-    if stand.aspect:
-        site_cond['calc_aspect'] = stand.aspect
-    if stand.elevation:
-        site_cond['elev_ft'] = stand.elevation
-    if stand.slope:
-        site_cond['calc_slope'] = stand.slope
-    if stand.strata.search_age:
-        site_cond['stand_age'] = float(stand.strata.search_age)
+    site_cond = get_site_conditions(stand)
 
     weight_dict = None  # take the default defined in plots.py
     ps, num_candidates = get_nearest_neighbors(
@@ -124,10 +152,88 @@ def impute_nearest_neighbor(stand_results, savetime):
     return {'stand_id': stand_id, 'cond_id': cond_id}
 
 
+@task()
+def impute_nearest_neighbor_batch(stand_ids, savetime):
+    '''
+    Nearest neighbor for many stands at once; stands sharing a strata
+    share one candidate search (see plots.get_nearest_neighbors_batch).
+    Locked stands, stands still waiting on terrain and stands without
+    candidates are handed off to impute_nearest_neighbor individually.
+    '''
+    # import here to avoid circular dependencies
+    from trees.models import Stand
+    from trees.plots import get_nearest_neighbors_batch
+
+    stands = []
+    leftover = []
+    for stand in Stand.objects.filter(id__in=stand_ids).select_related('strata'):
+        if stand.is_locked or not (stand.strata and stand.elevation and stand.aspect and
+                                   stand.slope and stand.geometry_final):
+            leftover.append(stand.id)
+        else:
+            stands.append(stand)
+
+    weight_dict = None  # take the default defined in plots.py
+    matches = get_nearest_neighbors_batch(stands, weight_dict=weight_dict, k=2)
+
+    results = []
+    for stand in stands:
+        if stand.id not in matches:
+            leftover.append(stand.id)
+            continue
+
+        # Take the top match
+        ps, num_candidates = matches[stand.id]
+        cond_id = int(ps[0].name)
+
+        # use the timestamp to make sure we don't clobber a more recent request
+        Stand.objects.filter(id=stand.id, nn_savetime__lt=savetime).update(
+            cond_id=cond_id, nn_savetime=savetime)
+        stand.invalidate_cache()
+        results.append({'stand_id': stand.id, 'cond_id': cond_id})
+
+    for stand_id in leftover:
+        impute_nearest_neighbor.apply_async(args=(stand_id, savetime))
+
+    return results
+
+
+@task()
+def import_stands(ogr_path, user_id, property_pk=None, new_property_name=None, pre_impute=True):
+    '''
+    StandImporter.import_ogr as a background job for large uploads;
+    progress is reported through the task state (see views.upload_stands_status).
+    The upload's temp directory is removed when done.
+    '''
+    # import here to avoid circular dependencies
+    from trees.models import ForestProperty
+    from trees.utils import StandImporter
+    from django.contrib.auth.models import User
+    from celery import current_task
+    import os
+    import shutil
+
+    def progress(stage, done, total):
+        current_task.update_state(state='PROGRESS',
+                                  meta={'stage': stage, 'current': done, 'total': total})
+
+    try:
+        user = User.objects.get(pk=user_id)
+        fp = None
+        if property_pk:
+            fp = ForestProperty.objects.get(pk=property_pk)
+        s = StandImporter(user, progress=progress)
+        s.import_ogr(ogr_path, forest_property=fp,
+                     new_property_name=new_property_name, pre_impute=pre_impute)
+        return {'X-Madrona-Select': s.forest_property.uid}
+    finally:
+        shutil.rmtree(os.path.dirname(ogr_path), ignore_errors=True)
+
+
 @task(max_retries=5, default_retry_delay=DELAY)
 def schedule_harvest(scenario_id):
     # import here to avoid circular dependencies
-    from trees.models import Scenario, ScenarioNotRunnable
+    from trees.models import Scenario, ScenarioStandResult, ScenarioNotRunnable
     import time
     from celery import current_task
 
@@ -141,46 +247,41 @@ def schedule_harvest(scenario_id):
     time.sleep(1)
 
     #
-    # Populate ScenarioStands
+    # Determine offsets
     #
-    # TODO implement the actual spatial identity operation
+    # TODO prep scheduler, run it, parse the outputs
     #
-    # INSTEAD, just fake it by copying over the stands 1:1
-
-    # from trees.utils import create_scenariostands
-    # scenariostands = create_scenariostands(scenario)
-    # might raise ScenarioNotRunnable, retry
+    # INSTEAD just assign random offset to every scenariostand
+    # as it is created
+    def random_offset(rx):
+        if rx.internal_num == 1:
+            # Special case, offset for rx=1 (Grow Only)
+            # should always be zero
+            return 0
+        # Otherwise, randomly assign offset index, 0 to 4
+        return random.randint(0, 4)
 
-    from trees.utils import fake_scenariostands
+    #
+    # Populate ScenarioStands
+    #
+    # With spatial constraints, do the spatial identity operation
+    # Otherwise the stands are just copied over 1:1
+    from trees.utils import create_scenariostands, fake_scenariostands
     try:
-        scenariostands = fake_scenariostands(scenario)
+        if scenario.constraint_set().exists():
+            scenariostands = create_scenariostands(scenario, offset_func=random_offset)
+        else:
+            scenariostands = fake_scenariostands(scenario, offset_func=random_offset)
     except ScenarioNotRunnable:
         print "****************\n" * 20
         raise schedule_harvest.retry(max_retries=2)
 
-    #
-    # Determine offsets
-    #
-    # TODO prep scheduler, run it, parse the outputs
-    #
-    # INSTEAD just assign random offset to every scenariostand
     # construct scheduler results dict eventually stored as output_scheduler_results
     # (not used currently except to check scenario status so it must exist)
-    offsets = {}
-    for sstand in scenariostands:
-        if sstand.rx_internal_num == 1:
-            # Special case, offset for rx=1 (Grow Only)
-            # should always be zero
-            random_offset = 0
-        else:
-            # Otherwise, randomly assign offset index, 0 to 4
-            random_offset = random.randint(0, 4)
+    offsets = dict(scenariostands.values_list('id', 'offset'))
 
-        offsets[sstand.id] = random_offset
-        sstand.offset = random_offset
-        sstand.save()
-    # Update the offset on the scenariostands directly
-    # scenariostands.update(offset=0)
+    # one pass over the growth-and-yield data for all the output metrics
+    ScenarioStandResult.materialize(scenario)
 
     #
     # update the database
@@ -188,13 +289,75 @@ def schedule_harvest(scenario_id):
     # stuff might have changed, we dont want a wholesale update of all fields!
     # use the timestamp to make sure we don't clobber a more recent request
     datemod = datetime.datetime.now()
-    scenario_qs.update(output_scheduler_results=json.dumps(offsets), date_modified=datemod)
+    scenario_qs.update(output_scheduler_results=json.dumps(offsets), date_modified=datemod,
+                       output_cash_results=None)
 
     cache.delete('Taskid_%s' % scenario.uid)
 
+    # the cost model is too slow to run on demand; start on it now
+    precompute_cash_metrics.delay(scenario_id)
+
     return {'scenario_id': scenario_id, 'output_scheduler_results': offsets}
 
 
+@task()
+def precompute_cash_metrics(scenario_id):
+    """
+    Price the harvests of a scenario with the cost model, in parallel chunks
+    (see trees.costs), and store the annual totals as output_cash_results
+    """
+    from trees.models import Scenario
+    from trees.costs import cost_rows, split_memoized, chunks, CostModelError
+    from celery import chord
+
+    scenario = Scenario.objects.get(id=scenario_id)
+    stamp = scenario.date_modified
+    cache.set('CashPending_%s' % scenario.uid, True, 60 * 60)
+
+    try:
+        years, rows = cost_rows(scenario)
+    except CostModelError as e:
+        store_cash_metrics([], scenario_id, stamp, years=None, error=str(e))
+        return
+
+    # only price what hasn't been priced before
+    memoized, rows = split_memoized(rows)
+
+    if not rows:
+        store_cash_metrics([memoized], scenario_id, stamp, years=years)
+        return
+
+    header = [price_cost_rows.s(chunk) for chunk in chunks(rows)]
+    chord(header)(store_cash_metrics.s(scenario_id, stamp, years=years, memoized=memoized))
+
+
+@task()
+def price_cost_rows(rows):
+    from trees.costs import price_rows
+    return price_rows(rows)
+
+
+@task()
+def store_cash_metrics(priced_chunks, scenario_id, stamp, years=None, error=None, memoized=None):
+    from trees.models import Scenario
+    from trees.costs import annual_costs
+    from madrona.common.utils import get_logger
+
+    if error:
+        get_logger().error(error)
+        data = {'error': error}
+    else:
+        priced = [x for chunk in priced_chunks for x in chunk] + (memoized or [])
+        data = annual_costs(years, priced)
+
+    # don't clobber the results of a more recent run
+    scenario_qs = Scenario.objects.filter(id=scenario_id, date_modified=stamp)
+    scenario_qs.update(output_cash_results=json.dumps(data))
+    for scenario in scenario_qs:
+        cache.delete('CashPending_%s' % scenario.uid)
+    return data
+
+
 @task()
 def sweep_for_errors():
     print "Here we go..."
@@ -0,0 +1,496 @@
+"""
+Batched zonal statistics for the terrain rasters.
+
+terrain_zonal (trees.utils) runs rasterstats once per raster per stand,
+re-opening and re-reading the GeoTIFF window every time. Here all stands
+of a property share window reads: stands are clustered by location
+(window_clusters) and each cluster is read once per raster. Within a
+cluster the stand polygons are rasterized once into label arrays (one per
+layer of non-overlapping stands, overlap_layers) and the per-stand
+mean/median/sum come from bincount-style reductions over those arrays.
+
+Statistics follow rasterstats: pixels whose centers fall inside the polygon,
+nodata and NaN pixels ignored, and the pixel under the centroid used for
+stands too small to cover any pixel center.
+
+Rasters are read through TerrainRaster, which keeps each GeoTIFF open for
+the life of the worker process and caches decoded blocks in a bounded LRU
+(settings.TERRAIN_BLOCK_CACHE_SIZE blocks, shared by all rasters). If an
+uncompressed copy written by export_memmap sits next to the GeoTIFF
+(<raster>.npy) and settings.TERRAIN_MEMMAP is on, windows are sliced
+straight out of the memory-mapped array instead.
+
+Results are cached under a digest of the geometry's WKB and the terrain
+dataset version (see terrain_cache_key), so all workers share hits and a
+DEM refresh never serves stale values.
+"""
+import math
+import os
+import hashlib
+import numpy as np
+from collections import OrderedDict
+from django.conf import settings
+from django.core.cache import cache
+
+TERRAIN_CACHE_PREFIX = "terrain_zonal_"
+TERRAIN_CACHE_TIMEOUT = 60 * 60 * 24 * 365
+# hit/miss counters; outside TERRAIN_CACHE_PREFIX so purges keep them
+TERRAIN_HITS_KEY = "terrain_cache_hits"
+TERRAIN_MISSES_KEY = "terrain_cache_misses"
+
+TERRAIN_RASTERS = ('dem.tif', 'cos_aspect.tif', 'sin_aspect.tif', 'slope.tif')
+
+
+def _extent(geoms):
+    extents = np.array([g.extent for g in geoms], dtype=float)
+    return (extents[:, 0].min(), extents[:, 1].min(),
+            extents[:, 2].max(), extents[:, 3].max())
+
+
+# open rasters and decoded blocks, per worker process
+_rasters = {}
+_blocks = OrderedDict()
+
+
+class TerrainRaster(object):
+    """
+    First band of a (tiled) GeoTIFF, held open and read by block
+    """
+
+    def __init__(self, path):
+        from osgeo import gdal
+
+        self.path = path
+        self.mtime = os.path.getmtime(path)
+        self.ds = gdal.Open(path)
+        if self.ds is None:
+            raise IOError("Cannot open raster %s" % path)
+        self.band = self.ds.GetRasterBand(1)
+        self.gt = self.ds.GetGeoTransform()
+        self.xsize = self.ds.RasterXSize
+        self.ysize = self.ds.RasterYSize
+        self.block_size = self.band.GetBlockSize()
+        self.nodata = self.band.GetNoDataValue()
+
+        self.memmap = None
+        mmap_path = path + '.npy'
+        if getattr(settings, 'TERRAIN_MEMMAP', True) and os.path.exists(mmap_path) \
+                and os.path.getmtime(mmap_path) >= self.mtime:
+            self.memmap = np.load(mmap_path, mmap_mode='r')
+
+    def block(self, bx, by):
+        """
+        Decoded block (bx, by), from the LRU if we have it
+        """
+        key = (self.path, self.mtime, bx, by)
+        try:
+            data = _blocks.pop(key)
+        except KeyError:
+            bw, bh = self.block_size
+            col0, row0 = bx * bw, by * bh
+            data = self.band.ReadAsArray(col0, row0, min(bw, self.xsize - col0),
+                                         min(bh, self.ysize - row0))
+            while len(_blocks) >= getattr(settings, 'TERRAIN_BLOCK_CACHE_SIZE', 64):
+                _blocks.popitem(last=False)
+        _blocks[key] = data
+        return data
+
+    def read(self, col0, row0, ncols, nrows):
+        """
+        Pixel window as float64, nodata as NaN; must lie within the raster
+        """
+        if self.memmap is not None:
+            arr = np.array(self.memmap[row0:row0 + nrows, col0:col0 + ncols], dtype=np.float64)
+        else:
+            arr = np.empty((nrows, ncols), dtype=np.float64)
+            bw, bh = self.block_size
+            for by in range(row0 // bh, (row0 + nrows - 1) // bh + 1):
+                for bx in range(col0 // bw, (col0 + ncols - 1) // bw + 1):
+                    block = self.block(bx, by)
+                    bcol, brow = bx * bw, by * bh
+                    c0, c1 = max(col0, bcol), min(col0 + ncols, bcol + block.shape[1])
+                    r0, r1 = max(row0, brow), min(row0 + nrows, brow + block.shape[0])
+                    arr[r0 - row0:r1 - row0, c0 - col0:c1 - col0] = \
+                        block[r0 - brow:r1 - brow, c0 - bcol:c1 - bcol]
+
+        if self.nodata is not None:
+            arr[arr == self.nodata] = np.nan
+        return arr
+
+    def window(self, extent):
+        """
+        Read the raster over the extent (xmin, ymin, xmax, ymax),
+        clipped to the raster.
+        Returns (array, geotransform of the window); nodata becomes NaN.
+        The array is None if the extent does not overlap the raster.
+        """
+        gt = self.gt
+        xmin, ymin, xmax, ymax = extent
+        col0 = max(int(math.floor((xmin - gt[0]) / gt[1])), 0)
+        col1 = min(int(math.ceil((xmax - gt[0]) / gt[1])), self.xsize)
+        row0 = max(int(math.floor((ymax - gt[3]) / gt[5])), 0)
+        row1 = min(int(math.ceil((ymin - gt[3]) / gt[5])), self.ysize)
+        window_gt = (gt[0] + col0 * gt[1], gt[1], 0.0,
+                     gt[3] + row0 * gt[5], 0.0, gt[5])
+        if col1 <= col0 or row1 <= row0:
+            return None, window_gt
+        return self.read(col0, row0, col1 - col0, row1 - row0), window_gt
+
+
+def get_raster(path):
+    """
+    The worker's open TerrainRaster for path, reopened if the file changed
+    """
+    raster = _rasters.get(path)
+    if raster is None or raster.mtime != os.path.getmtime(path):
+        raster = _rasters[path] = TerrainRaster(path)
+    return raster
+
+
+def export_memmap(path):
+    """
+    Write the uncompressed <path>.npy copy that TerrainRaster memory-maps
+    """
+    from numpy.lib.format import open_memmap
+
+    raster = TerrainRaster(path)
+    out = open_memmap(path + '.npy', mode='w+', dtype=raster.band.ReadAsArray(0, 0, 1, 1).dtype,
+                      shape=(raster.ysize, raster.xsize))
+    bw, bh = raster.block_size
+    for row0 in range(0, raster.ysize, bh):
+        nrows = min(bh, raster.ysize - row0)
+        out[row0:row0 + nrows, :] = raster.band.ReadAsArray(0, row0, raster.xsize, nrows)
+    out.flush()
+    del out
+    return path + '.npy'
+
+
+def rasterize_labels(geoms, window_gt, shape):
+    """
+    Burn geoms[i] into a label array of the given shape with value i + 1;
+    0 is outside every geometry
+    """
+    from osgeo import gdal, ogr
+
+    target = gdal.GetDriverByName('MEM').Create('', shape[1], shape[0], 1, gdal.GDT_Int32)
+    target.SetGeoTransform(window_gt)
+
+    source = ogr.GetDriverByName('Memory').CreateDataSource('labels')
+    layer = source.CreateLayer('labels', geom_type=ogr.wkbMultiPolygon)
+    layer.CreateField(ogr.FieldDefn('label', ogr.OFTInteger))
+    defn = layer.GetLayerDefn()
+    for i, geom in enumerate(geoms):
+        feature = ogr.Feature(defn)
+        feature.SetField('label', i + 1)
+        feature.SetGeometry(ogr.CreateGeometryFromWkb(str(geom.wkb)))
+        layer.CreateFeature(feature)
+
+    gdal.RasterizeLayer(target, [1], layer, options=['ATTRIBUTE=label'])
+    return target.GetRasterBand(1).ReadAsArray()
+
+
+def label_stats(values, labels, n):
+    """
+    Mean, median and sum of values for labels 1..n, ignoring NaN values.
+    Returns three arrays of length n; NaN where a label has no valid pixels.
+    """
+    valid = (labels > 0) & ~np.isnan(values)
+    labs = labels[valid].astype(np.intp)
+    vals = values[valid]
+
+    counts = np.bincount(labs, minlength=n + 1)[1:]
+    sums = np.bincount(labs, weights=vals, minlength=n + 1)[1:].astype(np.float64)
+
+    mean = np.empty(n)
+    mean.fill(np.nan)
+    median = mean.copy()
+    has = counts > 0
+    mean[has] = sums[has] / counts[has]
+
+    # values sorted within each label; the median sits in the middle of each run
+    ordered = vals[np.lexsort((vals, labs))]
+    starts = np.concatenate(([0], np.cumsum(counts)[:-1]))
+    lo = starts + (counts - 1) // 2
+    hi = starts + counts // 2
+    median[has] = (ordered[lo[has]] + ordered[hi[has]]) / 2.0
+
+    sums[~has] = np.nan
+    return mean, median, sums
+
+
+def overlap_layers(geoms):
+    """
+    Split range(len(geoms)) into layers whose geometries don't overlap.
+    A pixel of a label array carries one label, so overlapping (or
+    duplicate) stands are rasterized into separate arrays; stands that
+    only touch share a layer.
+    """
+    from shapely import wkb
+    from shapely.strtree import STRtree
+
+    shapes = [wkb.loads(str(g.wkb)) for g in geoms]
+    index = dict((id(shape), i) for i, shape in enumerate(shapes))
+    tree = STRtree(shapes)
+
+    layers = []
+    layer_of = []
+    for i, shape in enumerate(shapes):
+        taken = set()
+        for other in tree.query(shape):
+            j = index[id(other)]
+            if j < i and shape.intersects(other) and not shape.touches(other):
+                taken.add(layer_of[j])
+        k = 0
+        while k in taken:
+            k += 1
+        if k == len(layers):
+            layers.append([])
+        layers[k].append(i)
+        layer_of.append(k)
+    return layers
+
+
+def window_clusters(geoms, size=None):
+    """
+    Group range(len(geoms)) by the size x size tile (in map units, default
+    settings.TERRAIN_WINDOW_SIZE) holding each centroid, so that a property
+    with scattered parcels reads one small window per cluster rather than
+    a single window over its whole bounding box
+    """
+    if size is None:
+        size = getattr(settings, 'TERRAIN_WINDOW_SIZE', 5000)
+    clusters = OrderedDict()
+    for i, geom in enumerate(geoms):
+        x, y = geom.centroid.coords
+        tile = (int(math.floor(x / size)), int(math.floor(y / size)))
+        clusters.setdefault(tile, []).append(i)
+    return clusters.values()
+
+
+def batch_layout(geoms):
+    """
+    [(cluster, [layer, ...]), ...]: the window clusters of geoms, each
+    split into non-overlapping layers (lists of indices into geoms)
+    """
+    layout = []
+    for cluster in window_clusters(geoms):
+        layers = overlap_layers([geoms[i] for i in cluster])
+        layout.append((cluster, [[cluster[j] for j in layer] for layer in layers]))
+    return layout
+
+
+def _centroid_value(geom, values, window_gt):
+    """
+    The pixel under geom's centroid, or None if it is nodata or off the window
+    """
+    x, y = geom.centroid.coords
+    col = int(math.floor((x - window_gt[0]) / window_gt[1]))
+    row = int(math.floor((y - window_gt[3]) / window_gt[5]))
+    if 0 <= row < values.shape[0] and 0 <= col < values.shape[1]:
+        val = values[row, col]
+        if not np.isnan(val):
+            return float(val)
+    return None
+
+
+def zonal_stats_batch(geoms, raster_path, labels_cache=None, layout=None):
+    """
+    [{'mean': .., 'median': .., 'sum': ..}, ...] for each of geoms (in the
+    raster's projection), with one window read of raster_path per cluster
+    of nearby stands (see batch_layout).
+
+    labels_cache, a dict, lets rasters sharing a grid reuse the label arrays;
+    layout, from batch_layout(geoms), lets them reuse the clustering.
+    """
+    stats = [dict(mean=None, median=None, sum=None) for g in geoms]
+    if not geoms:
+        return stats
+
+    try:
+        raster = get_raster(raster_path)
+    except (IOError, OSError):
+        return stats
+
+    if labels_cache is None:
+        labels_cache = {}
+    if layout is None:
+        layout = batch_layout(geoms)
+
+    for cluster, layers in layout:
+        values, window_gt = raster.window(_extent([geoms[i] for i in cluster]))
+        if values is None:
+            continue
+
+        for layer in layers:
+            grid = (window_gt, values.shape, tuple(layer))
+            if grid not in labels_cache:
+                labels_cache[grid] = rasterize_labels([geoms[i] for i in layer],
+                                                      window_gt, values.shape)
+            mean, median, sums = label_stats(values, labels_cache[grid], len(layer))
+
+            for k, i in enumerate(layer):
+                if np.isnan(mean[k]):
+                    # fall back to the pixel under the centroid
+                    val = _centroid_value(geoms[i], values, window_gt)
+                    stats[i] = dict(mean=val, median=val, sum=val)
+                else:
+                    stats[i] = dict(mean=float(mean[k]), median=float(median[k]),
+                                    sum=float(sums[k]))
+    return stats
+
+
+def terrain_zonal_batch(geoms):
+    """
+    Batched trees.utils.terrain_zonal: a list of
+    (elevation, slope, aspect, cost) tuples for geoms in TERRAIN_PROJ
+    """
+    tdir = settings.TERRAIN_DIR
+
+    labels_cache = {}
+    layout = batch_layout(geoms) if geoms else []
+    stats = dict((name, zonal_stats_batch(geoms, os.path.join(tdir, name),
+                                          labels_cache, layout))
+                 for name in TERRAIN_RASTERS)
+
+    results = []
+    for i in range(len(geoms)):
+        # elevation
+        elevation = stats['dem.tif'][i]['mean']
+
+        # aspect
+        aspect = None
+        Esin = stats['sin_aspect.tif'][i]['sum']
+        Ecos = stats['cos_aspect.tif'][i]['sum']
+        if Ecos and Esin:
+            avg_aspect_rad = math.atan2(Esin, Ecos)
+            aspect = math.degrees(avg_aspect_rad) % 360
+
+        # slope
+        slope = stats['slope.tif'][i]['median']
+        cost = slope
+
+        terrain = (elevation, slope, aspect, cost)
+
+        if any(x is None or math.isnan(x) for x in terrain):
+            # fail silently so as not to distrupt NN
+            terrain = (0, 0, 0, 0)
+        results.append(terrain)
+    return results
+
+
+def terrain_zonal(geom):
+    """
+    Same as trees.utils.terrain_zonal, served from the open rasters
+    """
+    return terrain_zonal_batch([geom])[0]
+
+
+def terrain_version():
+    """
+    Version stamp of the terrain dataset in settings.TERRAIN_DIR: the
+    VERSION file written by scripts/process_dems.sh or, failing that,
+    a digest of the rasters' sizes and modification times
+    """
+    tdir = settings.TERRAIN_DIR
+    try:
+        with open(os.path.join(tdir, 'VERSION')) as fh:
+            version = fh.read().strip()
+        if version:
+            return version
+    except IOError:
+        pass
+
+    stamp = []
+    for name in TERRAIN_RASTERS:
+        try:
+            st = os.stat(os.path.join(tdir, name))
+            stamp.append("%s:%d:%d" % (name, st.st_size, st.st_mtime))
+        except OSError:
+            stamp.append("%s:missing" % name)
+    return hashlib.sha1(";".join(stamp)).hexdigest()[:12]
+
+
+def terrain_cache_key(geom, version=None):
+    """
+    Cache key for geom's terrain: the terrain version plus a digest of
+    the geometry as 2D little-endian WKB (stable across processes, unlike
+    hash(wkt))
+    """
+    from django.contrib.gis.geos import WKBWriter
+
+    if version is None:
+        version = terrain_version()
+    writer = WKBWriter()
+    writer.byteorder = 1  # little endian
+    writer.outdim = 2
+    digest = hashlib.sha1(str(writer.write(geom))).hexdigest()
+    return "%s%s_%s" % (TERRAIN_CACHE_PREFIX, version, digest)
+
+
+def _count(key, n):
+    if not n:
+        return
+    try:
+        cache.incr(key, n)
+    except ValueError:
+        # first count for this key
+        cache.set(key, n, timeout=0)
+
+
+def cached_terrain_zonal_batch(geoms):
+    """
+    terrain_zonal_batch, serving whatever is already cached and computing
+    the rest in one batch
+    """
+    version = terrain_version()
+    keys = [terrain_cache_key(g, version) for g in geoms]
+    cached = cache.get_many(keys)
+
+    missing = [i for i, key in enumerate(keys) if cached.get(key) is None]
+    _count(TERRAIN_HITS_KEY, len(keys) - len(missing))
+    _count(TERRAIN_MISSES_KEY, len(missing))
+
+    if missing:
+        computed = terrain_zonal_batch([geoms[i] for i in missing])
+        for i, terrain in zip(missing, computed):
+            cached[keys[i]] = terrain
+            cache.set(keys[i], terrain, TERRAIN_CACHE_TIMEOUT)
+
+    return [tuple(cached[key]) for key in keys]
+
+
+def cached_terrain_zonal(geom):
+    return cached_terrain_zonal_batch([geom])[0]
+
+
+def terrain_cache_stats():
+    """
+    Hit/miss counts and number of cached entries, current and stale
+    """
+    current = "%s%s_" % (TERRAIN_CACHE_PREFIX, terrain_version())
+    keys = cache.keys(TERRAIN_CACHE_PREFIX + "*")
+    fresh = len([k for k in keys if k.startswith(current)])
+    return {
+        'hits': cache.get(TERRAIN_HITS_KEY) or 0,
+        'misses': cache.get(TERRAIN_MISSES_KEY) or 0,
+        'entries': fresh,
+        'stale_entries': len(keys) - fresh,
+    }
+
+
+def purge_terrain_cache(stale_only=False):
+    """
+    Delete cached terrain results, all of them or only those computed
+    from an older terrain version. Returns the number deleted.
+    """
+    if not stale_only:
+        n = len(cache.keys(TERRAIN_CACHE_PREFIX + "*"))
+        # depends on django-redis as the cache backend!!!
+        cache.delete_pattern(TERRAIN_CACHE_PREFIX + "*")
+        cache.delete_many([TERRAIN_HITS_KEY, TERRAIN_MISSES_KEY])
+        return n
+
+    current = "%s%s_" % (TERRAIN_CACHE_PREFIX, terrain_version())
+    stale = [k for k in cache.keys(TERRAIN_CACHE_PREFIX + "*") if not k.startswith(current)]
+    cache.delete_many(stale)
+    return len(stale)
@@ -67,6 +67,119 @@ class StandTest(TestCase):
         Stand.objects.filter(name="My Stand2").delete()
         self.assertEqual(len(Stand.objects.all()), 1)
 
+    def test_inline_terrain(self):
+        stand1 = Stand(user=self.user, name="My Stand", geometry_orig=g1)
+        stand1.save()
+        max_acres = settings.TERRAIN_SYNC_MAX_ACRES
+        try:
+            settings.TERRAIN_SYNC_MAX_ACRES = 0
+            # over budget, left to celery
+            self.assertFalse(stand1.impute_terrain_inline(1e12))
+            settings.TERRAIN_SYNC_MAX_ACRES = stand1.acres + 1
+            self.assertTrue(stand1.impute_terrain_inline(1e12))
+            self.assertEqual(Stand.objects.get(id=stand1.id).rast_savetime, 1e12)
+            # an older request doesn't clobber it
+            self.assertTrue(stand1.impute_terrain_inline(1.0))
+            self.assertEqual(Stand.objects.get(id=stand1.id).rast_savetime, 1e12)
+
+            # saves that are part of a batch leave terrain to impute_rasters_batch
+            stand2 = Stand(user=self.user, name="My Stand2", geometry_orig=g1)
+            stand2.save(defer_rasters=True)
+            self.assertIsNone(Stand.objects.get(id=stand2.id).elevation)
+        finally:
+            settings.TERRAIN_SYNC_MAX_ACRES = max_acres
+
+
+class TerrainBatchTest(TestCase):
+    '''
+    Batched zonal stats should agree with rasterstats run stand by stand
+    '''
+
+    def test_zonal_stats_batch(self):
+        from rasterstats import raster_stats
+        from trees.terrain import zonal_stats_batch
+        from django.contrib.gis.gdal import DataSource
+        d = os.path.dirname(__file__)
+        testdata = os.path.abspath(os.path.join(d, '..', 'fixtures', 'testdata'))
+        raster = os.path.join(testdata, 'elevation.tif')
+        layer = DataSource(os.path.join(testdata, 'test_stands.shp'))[0]
+        geoms = [feature.geom.geos for feature in layer]
+
+        batch = zonal_stats_batch(geoms, raster)
+        self.assertEqual(len(batch), len(geoms))
+        for geom, stats in zip(geoms, batch):
+            expected = raster_stats(geom.wkt, raster, stats="median mean sum")[0]
+            if expected['mean'] is None:
+                continue
+            for stat in ('mean', 'median', 'sum'):
+                self.assertAlmostEqual(stats[stat], expected[stat], places=4)
+
+    def test_overlapping_stands(self):
+        import shutil
+        import tempfile
+        from trees.terrain import terrain_zonal_batch, batch_layout
+        from trees.utils import terrain_zonal
+        from django.contrib.gis.gdal import DataSource
+        d = os.path.dirname(__file__)
+        testdata = os.path.abspath(os.path.join(d, '..', 'fixtures', 'testdata'))
+        layer = DataSource(os.path.join(testdata, 'test_stands.shp'))[0]
+        stands = [feature.geom.geos for feature in layer]
+        # a duplicate stand, one overlapping it, and a distant parcel
+        geoms = [stands[0], stands[0].clone(), stands[0].buffer(30), stands[-1]]
+
+        tdir = tempfile.mkdtemp()
+        old_tdir, old_size = settings.TERRAIN_DIR, settings.TERRAIN_WINDOW_SIZE
+        try:
+            for name, source in [('dem.tif', 'elevation.tif'), ('cos_aspect.tif', 'cos_aspect.tif'),
+                                 ('sin_aspect.tif', 'sin_aspect.tif'), ('slope.tif', 'slope.tif')]:
+                shutil.copy(os.path.join(testdata, source), os.path.join(tdir, name))
+            settings.TERRAIN_DIR = tdir
+            for size in (100, 100000):
+                settings.TERRAIN_WINDOW_SIZE = size
+                layout = batch_layout(geoms)
+                layers = [layers for cluster, layers in layout if 0 in cluster][0]
+                self.assertEqual(len([layer for layer in layers if set(layer) & set([0, 1, 2])]), 3)
+
+                for geom, terrain in zip(geoms, terrain_zonal_batch(geoms)):
+                    expected = terrain_zonal(geom)
+                    for got, exp in zip(terrain, expected):
+                        self.assertAlmostEqual(got, exp, places=4)
+        finally:
+            settings.TERRAIN_DIR, settings.TERRAIN_WINDOW_SIZE = old_tdir, old_size
+            shutil.rmtree(tdir)
+
+    def test_block_cache(self):
+        import numpy as np
+        from osgeo import gdal
+        from trees.terrain import get_raster, _blocks
+        d = os.path.dirname(__file__)
+        raster = os.path.abspath(os.path.join(d, '..', 'fixtures', 'testdata', 'elevation.tif'))
+        expected = gdal.Open(raster).GetRasterBand(1).ReadAsArray().astype(np.float64)
+
+        cache_size = settings.TERRAIN_BLOCK_CACHE_SIZE
+        settings.TERRAIN_BLOCK_CACHE_SIZE = 2
+        _blocks.clear()
+        try:
+            rast = get_raster(raster)
+            self.assertIs(rast, get_raster(raster))
+            if rast.nodata is not None:
+                expected[expected == rast.nodata] = np.nan
+            rows, cols = expected.shape
+            for row0, col0 in [(0, 0), (rows // 3, cols // 2), (rows // 2, 0)]:
+                got = rast.read(col0, row0, cols - col0, rows - row0)
+                np.testing.assert_array_equal(got, expected[row0:, col0:])
+                self.assertTrue(len(_blocks) <= 2)
+        finally:
+            settings.TERRAIN_BLOCK_CACHE_SIZE = cache_size
+            _blocks.clear()
+
+    def test_cache_key(self):
+        from trees.terrain import terrain_cache_key
+        same = GEOSGeometry(g1.wkt, srid=g1.srid)
+        self.assertEqual(terrain_cache_key(g1, 'v1'), terrain_cache_key(same, 'v1'))
+        self.assertNotEqual(terrain_cache_key(g1, 'v1'), terrain_cache_key(g1, 'v2'))
+        self.assertNotEqual(terrain_cache_key(g1, 'v1'), terrain_cache_key(single_p1, 'v1'))
+
 
 class ForestPropertyTest(TestCase):
     '''
@@ -480,6 +593,75 @@ class StandImportTest(TestCase):
         self.assertEqual(len(Stand.objects.filter(name='001A')), 0)
         self.assertEqual(len(Stand.objects.filter(name='277')), 1)
         self.assertEqual(len(self.prop1.feature_set()), 37)
+        # bulk inserted stands are complete, as if saved one by one
+        for stand in self.prop1.feature_set(feature_classes=[Stand]):
+            self.assertTrue(stand.geometry_final)
+            self.assertTrue(stand.date_created)
+
+    def test_importer_progress(self):
+        calls = []
+        s = StandImporter(self.user, progress=lambda *args: calls.append(args))
+        s.import_ogr(self.shp_path, forest_property=self.prop1)
+        self.assertIn(('reading', 37, 37), calls)
+        self.assertEqual(calls[-1], ('saving', 37, 37))
+
+    def test_outline_builder(self):
+        from trees.utils import OutlineBuilder
+        from django.contrib.gis.gdal import DataSource
+        from shapely.ops import cascaded_union
+        from shapely.geometry import Polygon, MultiPolygon
+        from shapely import wkb
+        d = os.path.dirname(self.shp_path)
+        for name in ('test_stands.shp', 'test_stands2.shp', 'test_stands_condid.shp'):
+            geoms = [feature.geom.geos for feature in DataSource(os.path.join(d, name))[0]]
+
+            # the monolithic union with the python sliver filter
+            casc_poly = cascaded_union([wkb.loads(str(g.wkb)) for g in geoms])
+            parts = list(casc_poly) if casc_poly.type == 'MultiPolygon' else [casc_poly]
+            expected = MultiPolygon([
+                Polygon(shell=c.exterior,
+                        holes=[x for x in c.interiors
+                               if Polygon(x).area > settings.SLIVER_THRESHOLD])
+                for c in parts])
+
+            for batch_size, processes in ((1, 1), (5, 1), (500, 1), (5, 2)):
+                outline = OutlineBuilder(batch_size=batch_size, processes=processes)
+                for geom in geoms:
+                    outline.add(geom)
+                result = outline.multipolygon()
+                self.assertIsNone(outline.pool)
+                self.assertTrue(result.equals(expected), name)
+                self.assertEqual(len(result), len(expected))
+                self.assertEqual(sum(len(p.interiors) for p in result),
+                                 sum(len(p.interiors) for p in expected))
+
+    def test_outline_builder_no_polygons(self):
+        from trees.utils import OutlineBuilder
+        # an empty layer
+        with self.assertRaisesRegexp(Exception, "No polygon stands"):
+            OutlineBuilder().multipolygon()
+
+        # a point/line layer
+        outline = OutlineBuilder(batch_size=1)
+        outline.add(cntr)
+        outline.add(GEOSGeometry('SRID=3857;LINESTRING(-13842474 5280123, -13841474 5281123)'))
+        with self.assertRaisesRegexp(Exception, "No polygon stands"):
+            outline.multipolygon()
+
+        # lines mixed in with the stands are dropped
+        outline = OutlineBuilder(batch_size=1)
+        outline.add(cntr.buffer(75))
+        outline.add(GEOSGeometry('SRID=3857;LINESTRING(-13842474 5290123, -13841474 5291123)'))
+        result = outline.multipolygon()
+        self.assertEqual(len(result), 1)
+        self.assertAlmostEqual(result.area, cntr.buffer(75).area, places=2)
+
+        # a failed upload doesn't leave the pool's workers behind
+        outline = OutlineBuilder(batch_size=1, processes=2)
+        outline.add(cntr.buffer(75))
+        self.assertIsNotNone(outline.pool)
+        outline.close()
+        self.assertIsNone(outline.pool)
 
     def test_importer_py_newproperty(self):
         self.assertEqual(len(Stand.objects.all()), 0)
@@ -553,6 +735,43 @@ class StandImportTest(TestCase):
         prop2 = ForestProperty.objects.get(name="holes2")
         self.assertEqual(prop2.geometry_final[0].num_interior_rings, 2)
 
+    def test_importer_badgeom(self):
+        '''
+        A self-intersecting feature is cleaned, as Stand.save would, not rejected
+        '''
+        import tempfile
+        from osgeo import ogr, osr
+        bad = GEOSGeometry("SRID=3857;POLYGON((-13738982.554637 5741643.81587,-13748693.674233 \
+                5750032.832398,-13740702.387773 5750625.1666924,-13744294.928102 \
+                5751848.1591448,-13738982.554637 5741643.81587))")
+        good = cntr.buffer(75)
+        self.assertFalse(bad.valid)
+
+        tmpdir = tempfile.mkdtemp()
+        try:
+            shp_path = os.path.join(tmpdir, 'badgeom.shp')
+            srs = osr.SpatialReference()
+            srs.ImportFromEPSG(3857)
+            ds = ogr.GetDriverByName('ESRI Shapefile').CreateDataSource(shp_path)
+            layer = ds.CreateLayer('badgeom', srs, ogr.wkbPolygon)
+            layer.CreateField(ogr.FieldDefn('name', ogr.OFTString))
+            for name, geom in [('bad', bad), ('good', good)]:
+                feature = ogr.Feature(layer.GetLayerDefn())
+                feature.SetField('name', name)
+                feature.SetGeometry(ogr.CreateGeometryFromWkt(geom.wkt))
+                layer.CreateFeature(feature)
+            ds = None
+
+            s = StandImporter(self.user)
+            s.import_ogr(shp_path, forest_property=self.prop1)
+        finally:
+            shutil.rmtree(tmpdir)
+
+        self.assertEqual(len(self.prop1.feature_set()), 2)
+        for stand in Stand.objects.all():
+            self.assertTrue(stand.geometry_orig.valid)
+            self.assertTrue(stand.geometry_final.valid)
+
     def test_importer_http(self):
         self.client.login(username='featuretest', password='pword')
         self.assertEqual(len(self.prop1.feature_set()), 0)
@@ -567,6 +786,34 @@ class StandImportTest(TestCase):
         self.assertNotEqual(response.content.find('X-Madrona-Select'), -1, response.content)
         self.assertEqual(len(self.prop1.feature_set()), 37)
 
+    def test_importer_http_enqueue_fails(self):
+        import glob
+        import tempfile
+        from trees.tasks import import_stands
+
+        def broker_down(*args, **kwargs):
+            raise IOError("broker down")
+
+        self.client.login(username='featuretest', password='pword')
+        d = os.path.dirname(__file__)
+        ogr_path = os.path.abspath(os.path.join(d, '..', 'fixtures',
+            'testdata', 'test_stands.zip'))
+        tempdirs = os.path.join(tempfile.gettempdir(), 'featuretest_*')
+        before = set(glob.glob(tempdirs))
+        old_features = getattr(settings, 'STAND_UPLOAD_ASYNC_FEATURES', 1000)
+        settings.STAND_UPLOAD_ASYNC_FEATURES = 0
+        import_stands.apply_async = broker_down
+        try:
+            with open(ogr_path) as f:
+                response = self.client.post(reverse('trees-upload_stands'),
+                                            {'property_pk': self.prop1.pk, 'ogrfile': f})
+        finally:
+            del import_stands.apply_async
+            settings.STAND_UPLOAD_ASYNC_FEATURES = old_features
+        self.assertEqual(response.status_code, 500, response.content)
+        self.assertIn('Error importing stands', response.content)
+        self.assertEqual(set(glob.glob(tempdirs)), before)
+
     def test_importer_http_unauth(self):
         self.assertEqual(len(self.prop1.feature_set()), 0)
         d = os.path.dirname(__file__)
@@ -657,6 +904,9 @@ class UserInventoryTest(TestCase):
         with self.assertRaises(Exception):
             # haven't populated the fvsaggregate table so upload is invalid
             s.import_ogr(self.condid_shp_path, new_property_name="Locked Property")
+        # the stands inserted before the condids were checked are rolled back
+        self.assertEqual(len(Stand.objects.all()), 0)
+        self.assertEqual(len(ForestProperty.objects.filter(name="Locked Property")), 0)
 
     def test_importer_condid(self):
         self.assertEqual(len(Stand.objects.all()), 0)
@@ -679,6 +929,27 @@ class UserInventoryTest(TestCase):
                               if x.strata is None]), 0)
         self.assertEqual(len(Strata.objects.all()), 4)
 
+    def test_importer_condid_batches(self):
+        self._populate_fvsaggregate()
+        old_size = settings.STAND_IMPORT_BATCH_SIZE
+        settings.STAND_IMPORT_BATCH_SIZE = 5
+        calls = []
+        try:
+            s = StandImporter(self.user, progress=lambda *args: calls.append(args))
+            s.import_ogr(self.condid_shp_path, new_property_name="Locked Property")
+        finally:
+            settings.STAND_IMPORT_BATCH_SIZE = old_size
+
+        self.assertIn(('saving', 5, 37), calls)
+        self.assertEqual(calls[-1], ('saving', 37, 37))
+        new_property = ForestProperty.objects.get(name="Locked Property")
+        self.assertTrue(new_property.geometry_final)
+        stands = new_property.feature_set(feature_classes=[Stand])
+        self.assertEqual(len(stands), 37)
+        for stand in stands:
+            self.assertEqual(stand.strata.name, str(stand.cond_id))
+        self.assertEqual(len(Strata.objects.all()), 4)
+
     def _extract_gz(self, zipfile):
         tmpfile = '/tmp/forestplanner_test_data.db'
         with open(tmpfile, "wb") as tmp:
@@ -768,6 +1039,14 @@ class AdjacencyTest(TestCase):
         for adj_stand in adj_stands:
             self.assertTrue(adj_stand.pk in adj[test_stand.pk])
 
+    def test_adjacency_postgis(self):
+        '''
+        the single self-join agrees with the in-memory engine
+        '''
+        adj = self.prop1.adjacency()
+        adj_db = self.prop1.adjacency(postgis=True)
+        self.assertEqual(adj, adj_db)
+
 
 class SchedulerTest(TestCase):
     '''
@@ -874,6 +1153,23 @@ class VariantTest(TestCase):
         self.prop1.save()
         self.assertEqual(self.prop1.variant, self.other)
 
+    def test_species_catalog(self):
+        from trees.models import SpeciesSizeCatalog
+        SpeciesSizeCatalog.rebuild([self.real])
+        client = Client()
+        url = '/trees/variant/%s/species_catalog.json' % self.real.id
+        response = client.get(url)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(loads(response.content),
+                         loads(self.real.species_catalog.catalog_json))
+
+        # unchanged catalog is not sent again
+        response = client.get(url, HTTP_IF_NONE_MATCH=response['ETag'])
+        self.assertEqual(response.status_code, 304)
+
+        response = client.get('/trees/variant/99999/species_catalog.json')
+        self.assertEqual(response.status_code, 404)
+
 
 class SearchTest(TestCase):
 
@@ -956,6 +1252,109 @@ class ScenarioTest(TestCase):
         self.assertTrue(out.has_key("__all__"))
         # TODO out = s1.output_stand_metrics
 
+    def test_fake_scenariostands(self):
+        from trees.utils import fake_scenariostands
+        Stand.objects.filter(pk__in=[self.stand1.pk, self.stand2.pk]).update(cond_id=1)
+        s1 = Scenario(user=self.user, name="My Scenario",
+                input_target_boardfeet=2000,
+                input_target_carbon=1,
+                input_property=self.prop1,
+                input_rxs={self.stand1.pk: self.rx1, self.stand2.pk: self.rx2},
+             )
+        s1.save()
+        sstands = fake_scenariostands(s1, offset_func=lambda rx: rx.internal_num)
+        self.assertEqual(sstands.count(), 2)
+        for sstand in sstands:
+            self.assertEqual(sstand.rx_internal_num, sstand.rx.internal_num)
+            self.assertEqual(sstand.offset, sstand.rx.internal_num)
+            self.assertEqual(sstand.acres, sstand.stand.acres)
+        # old rows are replaced, not added to
+        sstands = fake_scenariostands(s1)
+        self.assertEqual(sstands.count(), 2)
+        self.assertEqual([x.offset for x in sstands], [0, 0])
+
+    def test_materialize_results(self):
+        from trees.models import ScenarioStandResult
+        from trees.utils import fake_scenariostands
+        Stand.objects.filter(pk__in=[self.stand1.pk, self.stand2.pk]).update(cond_id=1)
+        s1 = Scenario(user=self.user, name="My Scenario",
+                input_target_boardfeet=2000,
+                input_target_carbon=1,
+                input_property=self.prop1,
+                input_rxs={self.stand1.pk: self.rx1, self.stand2.pk: self.rx1},
+             )
+        s1.save()
+        variant = self.prop1.variant
+        rx_num = Rx.objects.get(id=self.rx1).internal_num
+        for year in (2013, 2018):
+            FVSAggregate.objects.create(var=variant.code, cond=1, rx=rx_num, offset=0,
+                                        site=2, year=year, age=year - 1900, agl=10.0,
+                                        df_hrv=2000.0 if year == 2013 else None)
+        # some other offset, not part of the scenario
+        FVSAggregate.objects.create(var=variant.code, cond=1, rx=rx_num, offset=1,
+                                    site=2, year=2013, age=200, agl=20.0)
+
+        sstands = fake_scenariostands(s1)
+        self.assertIsNone(Scenario.objects.get(pk=s1.pk).results_materialized)
+        self.assertEqual(ScenarioStandResult.materialize(s1), 4)
+        self.assertIsNotNone(Scenario.objects.get(pk=s1.pk).results_materialized)
+        results = ScenarioStandResult.objects.filter(scenario=s1)
+        self.assertEqual(results.count(), 4)
+        for result in results:
+            self.assertEqual(result.offset, 0)
+            self.assertEqual(result.age, result.year - 1900)
+            self.assertEqual(result.acres, result.scenariostand.acres)
+        self.assertEqual(sorted(set(x.scenariostand_id for x in results)),
+                         sorted(x.id for x in sstands))
+
+        # 2 mbf/acre of doug fir in 2013, for a couple of prices at once
+        s1.invalidate_cache()
+        acres = sum(x.acres for x in sstands)
+        years, revenue = s1.gross_revenue([{'df_hrv': 100.0}, {'df_hrv': 250.0, 'pine_hrv': 1.0}])
+        self.assertEqual(years, [2013, 2018])
+        self.assertAlmostEqual(revenue[0][0], 2 * acres * 100.0)
+        self.assertAlmostEqual(revenue[1][0], 2 * acres * 250.0)
+        self.assertEqual(revenue[0][1], 0)
+
+        # rerunning replaces the results
+        self.assertEqual(ScenarioStandResult.materialize(s1), 4)
+        fake_scenariostands(s1)
+        self.assertEqual(ScenarioStandResult.objects.filter(scenario=s1).count(), 0)
+        self.assertIsNone(Scenario.objects.get(pk=s1.pk).results_materialized)
+
+        # a run whose stands match no growth-and-yield rows is still materialized
+        FVSAggregate.objects.all().delete()
+        self.assertEqual(ScenarioStandResult.materialize(s1), 0)
+        self.assertIsNotNone(Scenario.objects.get(pk=s1.pk).results_materialized)
+
+    def test_create_scenariostands(self):
+        from trees.models import SpatialConstraint
+        from trees.utils import create_scenariostands
+        # stands 1 and 2 share a geometry; keep one
+        Stand.objects.filter(pk=self.stand2.pk).delete()
+        Stand.objects.filter(pk=self.stand1.pk).update(cond_id=1)
+        SpatialConstraint.objects.create(geom=g1.centroid.buffer(40), category='R1',
+                                         default_rx_id=self.rx2)
+        s1 = Scenario(user=self.user, name="My Scenario",
+                input_target_boardfeet=2000,
+                input_target_carbon=1,
+                input_property=self.prop1,
+                input_rxs={self.stand1.pk: self.rx1},
+                spatial_constraints='R1',
+             )
+        s1.save()
+        sstands = create_scenariostands(s1, offset_func=lambda rx: rx.internal_num)
+        self.assertEqual(sstands.count(), 2)
+        constrained = sstands.get(constraint__isnull=False)
+        self.assertEqual(constrained.rx_id, self.rx2)
+        self.assertEqual(constrained.rx_internal_num, constrained.rx.internal_num)
+        self.assertEqual(constrained.offset, constrained.rx.internal_num)
+        unconstrained = sstands.get(constraint__isnull=True)
+        self.assertEqual(unconstrained.rx_id, self.rx1)
+        self.assertEqual(unconstrained.stand_id, self.stand1.pk)
+        self.assertAlmostEqual(sum(x.acres for x in sstands),
+                               Stand.objects.get(pk=self.stand1.pk).acres, delta=0.01)
+
     def test_post(self):
         self.client.login(username='featuretest', password='pword')
         response = self.client.post(self.create_url, {
@@ -995,6 +1394,77 @@ class ScenarioTest(TestCase):
         })
         self.assertEqual(response.status_code, 400, response.content)
 
+    def test_revenue_sweep(self):
+        import datetime
+        from trees.models import ScenarioStandResult, TimberPrice
+        from trees.utils import fake_scenariostands
+        Stand.objects.filter(pk__in=[self.stand1.pk, self.stand2.pk]).update(cond_id=1)
+        s1 = Scenario(user=self.user, name="My Scenario",
+                input_target_boardfeet=2000,
+                input_target_carbon=1,
+                input_property=self.prop1,
+                input_rxs={self.stand1.pk: self.rx1, self.stand2.pk: self.rx1},
+             )
+        s1.save()
+        url = Scenario.get_options().get_link('Scenario Revenue Sweep').reverse(s1)
+        self.client.login(username='featuretest', password='pword')
+
+        # not run yet
+        response = self.client.get(url, {'prices': dumps([{'df_hrv': 400.0}])})
+        self.assertEqual(response.status_code, 200, response.content)
+        self.assertIsNone(loads(response.content))
+
+        # run it, as schedule_harvest would: 2 mbf/acre of doug fir in 2013
+        # and 1 mbf/acre of another priced timber type in 2018
+        variant = self.prop1.variant
+        current = dict(TimberPrice.objects.filter(variant=variant).values_list('timber_type', 'price'))
+        other = sorted(t for t, price in current.items() if price > 0 and t != 'df_hrv')[0]
+        rx_num = Rx.objects.get(id=self.rx1).internal_num
+        FVSAggregate.objects.create(var=variant.code, cond=1, rx=rx_num, offset=0, site=2,
+                                    year=2013, age=113, agl=10.0, df_hrv=2000.0)
+        FVSAggregate.objects.create(var=variant.code, cond=1, rx=rx_num, offset=0, site=2,
+                                    year=2018, age=118, agl=10.0, **{other: 1000.0})
+        sstands = fake_scenariostands(s1)
+        ScenarioStandResult.materialize(s1)
+        Scenario.objects.filter(pk=s1.pk).update(
+            output_scheduler_results=dumps(dict(sstands.values_list('id', 'offset'))),
+            date_modified=datetime.datetime.now())
+        s1 = Scenario.objects.get(pk=s1.pk)
+        s1.invalidate_cache()
+        metrics = s1.output_revenue_metrics
+        self.assertIsNotNone(metrics)
+        acres = sum(x.acres for x in sstands)
+        df, other_price = current['df_hrv'], current[other]
+
+        prices = [{}, {'df_hrv': df * 2}, {other: other_price * 2}]
+        response = self.client.get(url, {'prices': dumps(prices)})
+        self.assertEqual(response.status_code, 200, response.content)
+        sweep = loads(response.content)
+        self.assertEqual(sweep['years'], metrics['years'])
+        self.assertEqual(sweep['years'], [2013, 2018])
+        self.assertEqual(len(sweep['gross']), len(prices))
+        for gross in sweep['gross']:
+            self.assertEqual(len(gross), len(sweep['years']))
+
+        # the current prices give exactly the revenue metrics
+        self.assertEqual(sweep['prices'][0], current)
+        self.assertEqual(sweep['gross'][0], metrics['gross'])
+        # volumes x prices; doubling a price only doubles that timber type's share
+        self.assertAlmostEqual(sweep['gross'][0][0], 2 * acres * df)
+        self.assertAlmostEqual(sweep['gross'][0][1], acres * other_price)
+        self.assertAlmostEqual(sweep['gross'][1][0], 2 * acres * df * 2)
+        self.assertEqual(sweep['gross'][1][1], sweep['gross'][0][1])
+        self.assertEqual(sweep['gross'][2][0], sweep['gross'][0][0])
+        self.assertAlmostEqual(sweep['gross'][2][1], acres * other_price * 2)
+
+        for bad in ([], [{'oak_hrv': 1.0}], [{'df_hrv': 'cheap'}], {'df_hrv': 1.0}):
+            response = self.client.get(url, {'prices': dumps(bad)})
+            self.assertEqual(response.status_code, 400, bad)
+        response = self.client.get(url, {'prices': '[{'})
+        self.assertEqual(response.status_code, 400)
+        response = self.client.get(url)
+        self.assertEqual(response.status_code, 400)
+
     def test_json_results(self):
         s1 = Scenario(user=self.user, name="My Scenario",
                 input_target_boardfeet=2000,
@@ -1014,6 +1484,106 @@ class ScenarioTest(TestCase):
         self.assertEqual(response.status_code, 200, response.content)
 
 
+class CostModelTest(TestCase):
+    def test_annual_costs(self):
+        from trees.costs import annual_costs, chunks
+        result = lambda system, harvest: {
+            'total_cost': harvest + 10.0, 'total_haul_cost': 10.0,
+            'total_harvest_cost': harvest, 'harvest_system': system}
+        priced = [
+            (2013, result('Ground-Based Mech WT', 100.0)),
+            (2013, result('Cable Manual WT', 200.0)),
+            (2018, None),  # cost model error
+            (2018, result('Helicopter Manual WT', 300.0)),
+            (2023, result('Ground-Based Mech WT', 50.0)),
+        ]
+        data = annual_costs([2013, 2018, 2023, 2028], priced)
+        self.assertEqual(data['years'], [2013, 2018, 2023, 2028])
+        self.assertEqual(data['ground'], [100.0, 0, 50.0, 0])
+        self.assertEqual(data['cable'], [200.0, 0, 0, 0])
+        self.assertEqual(data['haul'], [20.0, 10.0, 10.0, 0])
+
+        # chunked pricing reduces to the same totals
+        self.assertEqual(annual_costs([2013, 2018, 2023, 2028],
+                                      [x for chunk in chunks(priced, 2) for x in chunk]), data)
+
+    def test_memo(self):
+        from trees.costs import cost_key, split_memoized, memoize
+        from trees.models import CostMemo
+        user = User.objects.create_user(
+            'featuretest', 'featuretest@madrona.org', password='pword')
+        stand = Stand(user=user, name="My Stand", geometry_orig=g1)
+        stand.save()
+
+        cost_args = (10.0, 1000.0, 20.0, g1.wkt, 5.0, 10.0, 5.0, 10.0, 5.0, 10.0,
+                     1.0, 1.0, 1.0, 0, (-123.0, 44.0), 10.0, 0.5, (-123.1, 44.1))
+        other_args = (11.0,) + cost_args[1:]
+        rows = [(1, stand.pk, 2013, cost_args, 1.0), (2, stand.pk, 2013, other_args, 1.0),
+                (3, stand.pk, 2018, cost_args, 1.0)]
+        self.assertNotEqual(cost_key(cost_args, 1.0), cost_key(cost_args, 0.5))
+
+        result = {'total_cost': 20.0, 'total_haul_cost': 10.0,
+                  'total_harvest_cost': 10.0, 'harvest_system': 'Cable Manual WT'}
+        memo = lambda: CostMemo(key=cost_key(cost_args, 1.0), stand=stand, **result)
+        memoize([memo()])
+        # stored meanwhile by someone else
+        memoize([memo()])
+        self.assertEqual(CostMemo.objects.count(), 1)
+
+        priced, unpriced = split_memoized(rows)
+        self.assertEqual(priced, [(2013, result), (2018, result)])
+        self.assertEqual(unpriced, [rows[1]])
+
+        # new geometry, new terrain: memoized costs are gone
+        stand.geometry_orig = g1.buffer(10)
+        stand.geometry_final = g1.buffer(10)
+        stand.save()
+        self.assertEqual(CostMemo.objects.filter(stand=stand).count(), 0)
+
+    def test_mill_index(self):
+        from django.contrib.gis.gdal import DataSource
+        from forestcost import routing, landing
+        from trees import costs
+        user = User.objects.create_user(
+            'featuretest', 'featuretest@madrona.org', password='pword')
+        props = [ForestProperty(user=user, name="Property %d" % i,
+                                geometry_final=MultiPolygon(single_p1.buffer(i * 50000)))
+                 for i in range(2)]
+        for prop in props:
+            prop.save()
+
+        mills = [feature.geom.tuple[:2] for feature in DataSource(settings.MILL_SHAPEFILE)[0]]
+        routed = []
+
+        def fake_routing(landing_coords, mill_coords=None, mill_shp=None):
+            self.assertIsNone(mill_shp)
+            routed.append((landing_coords, mill_coords))
+            return 10.0, 0.5, mill_coords
+
+        old_routing, old_landing = routing.routing, landing.landing
+        routing.routing = fake_routing
+        landing.landing = lambda centroid_coords: centroid_coords
+        try:
+            costs._mills.clear()
+            for prop in props:
+                prop.invalidate_cache()
+                prop.cost_routing
+            # one load of the shapefile, shared by both properties
+            self.assertEqual(costs._mills.keys(), [settings.MILL_SHAPEFILE])
+            index = costs.mill_index()
+            props[0].invalidate_cache()
+            props[0].cost_routing
+            self.assertIs(costs.mill_index(), index)
+        finally:
+            routing.routing, landing.landing = old_routing, old_landing
+
+        self.assertEqual(len(routed), 3)
+        for landing_coords, mill_coords in routed:
+            nearest = min(mills, key=lambda mill: (mill[0] - landing_coords[0]) ** 2 +
+                          (mill[1] - landing_coords[1]) ** 2)
+            self.assertEqual(tuple(mill_coords), tuple(nearest))
+
+
 class AspectTest(TestCase):
     def test_aspect(self):
         from trees.utils import classify_aspect
@@ -1054,6 +1624,28 @@ class NearestPlotPyTest(TestCase):
         strata.save()
         return strata
 
+    def _create_treelive(self):
+        '''
+        treelive_summary rows known to match the property's variant:
+        Douglas-fir in the 2" class on condition 901 only and in the
+        10" class on conditions 902-904. Returns the variant code.
+        '''
+        from trees.models import TreeliveSummary, ConditionVariantLookup
+        from trees.plots import common_species_lookup, rebuild_candidate_indexes
+        variant = self.prop1.variant.code
+        species = common_species_lookup['Douglas-fir'][variant]
+        rows = [(901, 2.0), (902, 10.0), (903, 10.0), (904, 10.0)]
+        for i, (cond_id, dbh) in enumerate(rows):
+            TreeliveSummary.objects.create(
+                class_id=9000 + i, plot_id=cond_id, cond_id=cond_id, variant=variant,
+                fvs_spp_code=species, fia_forest_type_name='Douglas-fir',
+                calc_dbh_class=dbh, sumoftpa=20.0 + i, sumofba_ft2_ac=5.0 + i,
+                pct_of_totalba=40.0 + i, count_speciessizeclasses=2,
+                total_ba_ft2_ac=30.0 + i)
+            ConditionVariantLookup.objects.create(cond_id=cond_id, variant_code=variant)
+        rebuild_candidate_indexes()
+        return variant
+
     def test_bad_stand_list(self):
         stand_list = [ ('Douglas-fir', 2, 4, 145), ]
         strata = Strata(user=self.user, name="My Strata", search_age=30.0, search_tpa=120.0, stand_list=stand_list)
@@ -1085,6 +1677,281 @@ class NearestPlotPyTest(TestCase):
         variant = self.prop1.variant.code
         get_candidates(stand_list['classes'], variant)
 
+    def test_candidate_index(self):
+        from django.db import connection
+        from trees.plots import (get_candidates, get_candidate_index, rebuild_candidate_indexes,
+                                 common_species_lookup, dictfetchall)
+        variant = self._create_treelive()
+        classes = [('Douglas-fir', 2, 40, 145), ('Douglas-fir', 2, 4, 145),
+                   ('Douglas-fir', 10, 12, 50)]
+
+        # the per-class GROUP BY the index replaces
+        sql = """
+            SELECT
+                treelive_summary.COND_ID,
+                SUM(SumOfTPA) as "TPA__",
+                SUM(SumOfBA_FT2_AC) as "BAA__",
+                SUM(pct_of_totalba) as "PCTBA__",
+                AVG(COUNT_SPECIESSIZECLASSES) as "PLOTCLASSCOUNT__",
+                AVG(TOTAL_BA_FT2_AC) as "PLOTBA__"
+            FROM treelive_summary, trees_conditionvariantlookup as cvl
+            WHERE fvs_spp_code = %(fvsspecies)s
+            AND variant = %(variant_code)s
+            AND cvl.cond_id = treelive_summary.cond_id  --join
+            AND cvl.variant_code = %(variant_code)s
+            AND calc_dbh_class >= %(lowsize)s AND calc_dbh_class < %(highsize)s
+            AND pct_of_totalba is not null
+            GROUP BY treelive_summary.COND_ID
+        """
+        index = get_candidate_index(variant)
+        cursor = connection.cursor()
+        for sc in classes:
+            inputs = {
+                'species': sc[0],
+                'fvsspecies': common_species_lookup[sc[0]][variant],
+                'lowsize': int(sc[1]),
+                'highsize': int(sc[2]),
+                'variant_code': variant
+            }
+            cursor.execute(sql, inputs)
+            rows = dictfetchall(cursor, "%(species)s_%(lowsize)s_%(highsize)s" % inputs)
+            self.assertTrue(rows)
+
+            frame = index.class_frame(*sc[:3])
+            self.assertEqual(sorted(frame.index), sorted(row['cond_id'] for row in rows))
+            for row in rows:
+                for col, value in row.items():
+                    if col != 'cond_id':
+                        self.assertAlmostEqual(frame[col][row['cond_id']], value)
+
+        # both paths of get_candidates agree
+        settings.NN_CANDIDATE_INDEX = False
+        try:
+            from_crosstab = get_candidates(classes[:1], variant)
+        finally:
+            settings.NN_CANDIDATE_INDEX = True
+        # (cached candidates are shared by both paths)
+        rebuild_candidate_indexes()
+        from_index = get_candidates(classes[:1], variant)
+        self.assertEqual(sorted(from_crosstab.index), [901, 902, 903, 904])
+        self.assertEqual(sorted(from_crosstab.index), sorted(from_index.index))
+        for col in from_index.columns:
+            for cond_id in from_index.index:
+                self.assertAlmostEqual(from_crosstab[col][cond_id], from_index[col][cond_id])
+
+        # index is reused until the loaders rebuild it
+        index = get_candidate_index(variant)
+        self.assertIs(index, get_candidate_index(variant))
+        rebuild_candidate_indexes()
+        self.assertIsNot(index, get_candidate_index(variant))
+
+    def test_relaxed_candidates(self):
+        from trees.plots import get_candidates, get_relaxed_candidates
+        variant = self._create_treelive()
+        common = ('Douglas-fir', 2, 40, 145)
+        narrow = ('Douglas-fir', 2, 4, 145)
+        base = get_candidates([common], variant)
+        fewer = get_candidates([narrow], variant)
+        self.assertEqual(sorted(base.index), [901, 902, 903, 904])
+        self.assertEqual(sorted(fewer.index), [901])
+
+        # asking for more plots than the narrow class allows drops it
+        candidates, dropped = get_relaxed_candidates(
+            [narrow, common], variant, len(base))
+        self.assertEqual(dropped, [list(narrow)])
+        self.assertEqual(sorted(candidates.index), sorted(base.index))
+
+        candidates, dropped = get_relaxed_candidates([narrow, common], variant, 1)
+        self.assertEqual(dropped, [])
+        self.assertEqual(sorted(candidates.index), [901])
+
+    def test_strata_relaxed_classes(self):
+        variant = self._create_treelive()
+        stand_list = {
+            'property': self.prop1.uid,
+            'classes': [('Douglas-fir', 2, 40, 145), ('Douglas-fir', 10, 12, 50)],
+        }
+        strata = Strata(user=self.user, name="My Strata", search_age=30.0,
+                        search_tpa=120.0, stand_list=stand_list)
+        strata.save()
+        self.assertEqual(Strata.objects.get(pk=strata.pk).relaxed_classes, [])
+
+        # no plot has both classes; the candidate search drops the rarer one
+        strata.stand_list = {
+            'property': self.prop1.uid,
+            'classes': [('Douglas-fir', 2, 40, 145), ('Douglas-fir', 2, 4, 145),
+                        ('Douglas-fir', 10, 12, 50)],
+        }
+        strata.save()
+        self.assertEqual(Strata.objects.get(pk=strata.pk).relaxed_classes,
+                         [['Douglas-fir', 2, 4, 145]])
+
+        # the strata list reports the stored value
+        self.prop1.add(strata)
+        self.client.login(username='featuretest', password='pword')
+        response = self.client.get("/features/forestproperty/links/property-strata-list/%s/" % self.prop1.uid)
+        self.assertEqual(response.status_code, 200, response.content)
+        listed = [x for x in loads(response.content) if x['uid'] == strata.uid][0]
+        self.assertEqual(listed['relaxed_classes'], [['Douglas-fir', 2, 4, 145]])
+
+    def test_plot_matcher_cache(self):
+        from django.core.cache import cache
+        from trees.plots import get_plot_matcher, _plot_matcher_prefix, _plot_matchers
+        strata = self._create_strata()
+        classes = strata.stand_list['classes']
+        variant = self.prop1.variant.code
+        site_keys = ['calc_aspect', 'elev_ft', 'calc_slope', 'stand_age']
+
+        matcher = get_plot_matcher(classes, variant, site_keys)
+        self.assertIs(matcher, get_plot_matcher(classes, variant, site_keys))
+
+        # another worker process gets it from the shared cache
+        _plot_matchers.clear()
+        shared = get_plot_matcher(classes, variant, site_keys)
+        self.assertEqual(shared.keys, matcher.keys)
+        self.assertEqual(shared.num_candidates, matcher.num_candidates)
+
+        # only the arrays are shared; the plotsummaries are fetched again, in tree order
+        import cPickle
+        import pandas as pd
+        from trees.plots import stand_list_params
+        state = cPickle.loads(cPickle.dumps(matcher.__getstate__(), cPickle.HIGHEST_PROTOCOL))
+        self.assertFalse([x for x in state.values() if isinstance(x, pd.DataFrame)])
+        query, total_ba = stand_list_params(classes, matcher.columns)
+        query.update({'calc_aspect': 90, 'elev_ft': 1500, 'calc_slope': 10, 'stand_age': 40})
+        expected = matcher.match([query], 5)[0]
+        got = shared.match([query], 5)[0]
+        self.assertEqual([x.name for x in got], [x.name for x in expected])
+        self.assertEqual([x['_certainty'] for x in got], [x['_certainty'] for x in expected])
+        self.assertEqual(shared.plotsummaries.index.tolist(), matcher.plotsummaries.index.tolist())
+
+        # editing the strata drops the matchers for its old stand list
+        strata.stand_list = {
+            'property': self.prop1.uid,
+            'classes': [('Douglas-fir', 2, 6, 145), ]
+        }
+        strata.save()
+        self.assertEqual(cache.keys(_plot_matcher_prefix(classes) + "*"), [])
+        self.assertIsNot(shared, get_plot_matcher(classes, variant, site_keys))
+
+    def test_site_table(self):
+        import pandas as pd
+        from trees.models import IdbSummary
+        from trees.plots import get_sites, rebuild_candidate_indexes, SITE_COLUMNS
+        rebuild_candidate_indexes()
+        variant = self.prop1.variant.code
+        cond_ids = list(IdbSummary.objects.values_list('cond_id', flat=True))
+        candidates = pd.DataFrame(index=cond_ids + [-1])  # -1 has no site
+
+        from_sql = get_sites(candidates)
+        self.assertEqual(from_sql.columns.tolist(), SITE_COLUMNS)
+        self.assertNotIn(-1, from_sql.index)
+
+        from_table = get_sites(candidates, variant)
+        # the table only holds conditions in the variant
+        for cond_id in from_table.index:
+            for col in ['calc_aspect', 'elev_ft', 'stand_age']:
+                self.assertEqual(from_table[col][cond_id], from_sql[col][cond_id])
+
+    def _loop_nearest_plots(self, input_params, plotsummaries, k, weight_dict={}):
+        """
+        The original row-by-row attribute matrix construction,
+        kept as a reference for the vectorized nearest_plots
+        """
+        import math
+        import numpy as np
+        from trees.utils import angular_diff
+        keys = [x for x in input_params.keys() if x != 'calc_aspect']
+        ps_attr_list = []
+        for cond_id in plotsummaries.index.tolist():
+            ps = plotsummaries.ix[cond_id]
+            vals = [ps[attr] for attr in keys]
+            vals.append(angular_diff(ps['calc_aspect'], input_params['calc_aspect']))
+            ps_attr_list.append(vals)
+        rawpoints = np.array(ps_attr_list)
+        querypoint = np.array([round(input_params[attr], 2) for attr in keys] + [0])
+        weights = np.array([weight_dict.get(key, 1.0) for key in keys] +
+                           [weight_dict.get('_aspect', 1.0)])
+        stds = np.std(rawpoints, axis=0)
+        means = np.mean(rawpoints, axis=0)
+        scaled_points = np.nan_to_num((rawpoints - means) / stds * weights)
+        scaled_querypoint = (querypoint - means) / stds
+        scaled_querypoint[np.isinf(scaled_querypoint)] = 0
+        scaled_querypoint = np.nan_to_num(scaled_querypoint * weights)
+        distances = np.sqrt(((scaled_points - scaled_querypoint) ** 2).sum(axis=1))
+        max_dist = math.sqrt(sum((100 * x) ** 2 for x in weights))
+        top = np.argsort(distances, kind='mergesort')[:k]
+        return ([plotsummaries.index[i] for i in top],
+                [1.0 - ((distances[i] / max_dist) ** 0.5) for i in top])
+
+    def test_nearest_plots_vectorized(self):
+        import numpy as np
+        import pandas as pd
+        from trees.models import IdbSummary
+        from trees.plots import get_sites, nearest_plots
+        # all-ones weights so the reference doesn't need the default weight table
+        weight_dict = dict((key, 1.0) for key in
+                           ['calc_aspect', 'calc_slope', 'elev_ft', 'stand_age', 'PLOT_BA'])
+
+        cond_ids = list(IdbSummary.objects.values_list('cond_id', flat=True))
+        fixture_sites = get_sites(pd.DataFrame(index=cond_ids))
+        fixture_params = {'calc_aspect': 350.0, 'calc_slope': 10.0,
+                          'elev_ft': 1500.0, 'stand_age': 40.0}
+
+        rng = np.random.RandomState(42)
+        num = 500
+        random_sites = pd.DataFrame({
+            'calc_aspect': rng.rand(num) * 360,
+            'calc_slope': rng.rand(num) * 60,
+            'elev_ft': np.ones(num) * 1500.0,  # zero std dev
+            'stand_age': rng.randint(10, 200, num).astype(float),
+            'PLOT_BA': rng.rand(num) * 200,
+        }, index=rng.permutation(100000)[:num] + 1)
+        random_params = dict(fixture_params, PLOT_BA=120.0)
+
+        for params, sites in [(fixture_params, fixture_sites), (random_params, random_sites)]:
+            k = min(10, len(sites))
+            expected_ids, expected_certainty = self._loop_nearest_plots(params, sites, k)
+            ps, num_candidates = nearest_plots(params, sites, weight_dict, k=k, verbose=False)
+            self.assertEqual(num_candidates, len(sites))
+            self.assertEqual([p.name for p in ps], expected_ids)
+            for p, certainty in zip(ps, expected_certainty):
+                self.assertAlmostEqual(p['_certainty'], certainty)
+
+    def test_plot_matcher_batch(self):
+        import numpy as np
+        import pandas as pd
+        from trees.plots import PlotMatcher
+
+        rng = np.random.RandomState(7)
+        num = 1000
+        sites = pd.DataFrame({
+            'calc_aspect': rng.rand(num) * 360,
+            'elev_ft': rng.rand(num) * 3000,
+            'stand_age': rng.randint(10, 200, num).astype(float),
+            'PLOT_BA': rng.rand(num) * 200,
+        }, index=rng.permutation(100000)[:num] + 1)
+        queries = [{'calc_aspect': rng.rand() * 360, 'elev_ft': rng.rand() * 3000,
+                    'stand_age': 50.0, 'PLOT_BA': 120.0} for i in range(20)]
+
+        # heavy aspect weight forces the matcher to widen its tree search
+        for aspect_weight in [1.0, 500.0]:
+            weight_dict = {'_aspect': aspect_weight, 'elev_ft': 1.0,
+                           'stand_age': 1.0, 'PLOT_BA': 1.0}
+            matcher = PlotMatcher(sites, queries[0].keys(), weight_dict)
+            batch = matcher.match(queries, k=5)
+            self.assertEqual(len(batch), len(queries))
+            for query, ps in zip(queries, batch):
+                expected_ids, expected_certainty = self._loop_nearest_plots(
+                    query, sites, 5, weight_dict)
+                self.assertEqual([p.name for p in ps], expected_ids)
+
+        # the matcher survives the trip through the cache
+        import cPickle
+        restored = cPickle.loads(cPickle.dumps(matcher, cPickle.HIGHEST_PROTOCOL))
+        self.assertEqual([[p.name for p in ps] for ps in restored.match(queries, k=5)],
+                         [[p.name for p in ps] for ps in batch])
+
 
 class NearestPlotRestTest(TestCase):
     fixtures = ['test_treelive_summary', 'test_idb_summary', 'test_conditionvariantlookup']
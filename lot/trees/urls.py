@@ -33,10 +33,14 @@ urlpatterns = patterns(
         geosearch, name='trees-geosearch'),
     url(r'^variant/(?P<property_uid>\w+)/species_sizecls.json$',
         list_species_sizecls, name='trees-list_species_sizecls'),
+    url(r'^variant/(?P<variant_id>\d+)/species_catalog.json$',
+        variant_species_sizecls, name='trees-variant_species_sizecls'),
     url(r'^variant/(?P<variant_id>\d+)_decision.xml$',
         variant_decision_xml, name='trees-variant-decision-xml'),
     url(r'^user_property_list/$',
         user_property_list, name='trees-user_property_list'),
     url(r'^upload_stands/$',
         upload_stands, name='trees-upload_stands'),
+    url(r'^upload_stands/(?P<job_id>[\w-]+)/status/$',
+        upload_stands_status, name='trees-upload_stands_status'),
 )
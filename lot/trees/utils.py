@@ -1,16 +1,21 @@
-from trees.models import Stand, ForestProperty, IdbSummary, Strata, FVSAggregate
+from trees.models import Stand, ForestProperty, IdbSummary, Strata, FVSAggregate, postgres_now
+from trees.tasks import impute_rasters_batch
 from django.contrib.gis.gdal import DataSource
 from django.contrib.gis.gdal.error import OGRIndexError
 from django.conf import settings
-from madrona.common.utils import get_logger
+from django.contrib.contenttypes.models import ContentType
+from madrona.common.utils import get_logger, clean_geometry
 from django.db.models import Min, Max, Avg
+from django.db import connection, transaction
 from shapely.ops import cascaded_union
 from shapely import wkt
+from shapely import wkb as shapely_wkb
 from shapely.geometry import Polygon, MultiPolygon
 import numpy as np
-from scipy.spatial import KDTree
+from scipy.spatial import cKDTree
 import datetime
 import math
+from collections import defaultdict
 
 logger = get_logger()
 
@@ -26,12 +31,181 @@ def datetime_to_unix(dt):
     return total
 
 
+def extract_upload(upload, tempdir):
+    """
+    Stream an uploaded file to tempdir, unzipping it member by member
+    if it is a zip, and return the path to the OGR datasource
+    (the .shp for zipped shapefiles)
+    """
+    import os
+    import shutil
+    import zipfile
+
+    ogr_path = os.path.join(tempdir, os.path.basename(upload.name))
+    with open(ogr_path, 'wb') as dest:
+        for chunk in upload.chunks():
+            dest.write(chunk)
+
+    if not ogr_path.endswith('zip'):
+        return ogr_path
+
+    shp_path = None
+    zf = zipfile.ZipFile(ogr_path)
+    for info in zf.infolist():
+        name = info.filename.split('/')[-1]
+        if not name:
+            continue  # directory
+        shp_part = os.path.join(tempdir, name)
+        src = zf.open(info)
+        with open(shp_part, 'wb') as fout:
+            shutil.copyfileobj(src, fout, 1024 * 1024)
+        src.close()
+        if shp_part.endswith(".shp"):
+            shp_path = shp_part
+    zf.close()
+    os.remove(ogr_path)
+    return shp_path
+
+
+def _union_wkb(wkbs):
+    # process pool worker for OutlineBuilder; WKB in and out
+    return cascaded_union([shapely_wkb.loads(x) for x in wkbs]).wkb
+
+
+def _ring_areas(rings):
+    """
+    Areas of linear rings (shoelace formula, all rings at once)
+    """
+    if not rings:
+        return np.zeros(0)
+    coords = [np.asarray(ring.coords)[:, :2] for ring in rings]
+    lengths = [len(c) for c in coords]
+    xy = np.concatenate(coords)
+    ids = np.repeat(np.arange(len(coords)), lengths)
+    # pairs of consecutive vertices within the same (closed) ring
+    same = ids[:-1] == ids[1:]
+    cross = xy[:-1, 0] * xy[1:, 1] - xy[1:, 0] * xy[:-1, 1]
+    return np.abs(np.bincount(ids[:-1][same], weights=cross[same],
+                              minlength=len(coords))) / 2.0
+
+
+class OutlineBuilder(object):
+    """
+    Property outline (union of the stands) built incrementally.
+
+    Stands are unioned a batch at a time as they are added and the batch
+    unions are merged pairwise, a tree-structured union rather than one
+    monolithic cascaded_union. With processes > 1
+    (default settings.OUTLINE_UNION_PROCESSES) batches are unioned in a
+    process pool; this is not available inside celery workers, where it
+    falls back to unioning in process. The pool is shut down by union(),
+    or by close() if the outline is abandoned.
+    """
+
+    def __init__(self, batch_size=500, processes=None):
+        self.batch_size = batch_size
+        if processes is None:
+            processes = getattr(settings, 'OUTLINE_UNION_PROCESSES', 1)
+        self.processes = processes
+        self.pool = None
+        self.pending = []
+        # (level, geometry) unions of 2**level batches, or pool results
+        self.chunks = []
+
+    def add(self, geom):
+        self.pending.append(shapely_wkb.loads(str(geom.wkb)))
+        if len(self.pending) >= self.batch_size:
+            self._flush()
+
+    def _get_pool(self):
+        if self.pool is None and self.processes > 1:
+            from multiprocessing import Pool
+            try:
+                self.pool = Pool(self.processes)
+            except AssertionError:
+                # daemonic processes (celery workers) can't have children
+                self.processes = 1
+        return self.pool
+
+    def close(self):
+        """ stop the process pool's workers, if any """
+        if self.pool is not None:
+            self.pool.terminate()
+            self.pool.join()
+            self.pool = None
+
+    def _flush(self):
+        if not self.pending:
+            return
+        batch, self.pending = self.pending, []
+
+        pool = self._get_pool()
+        if pool:
+            self.chunks.append((0, pool.apply_async(_union_wkb, ([g.wkb for g in batch],))))
+            return
+
+        self.chunks.append((0, cascaded_union(batch)))
+        # merge equal sized neighbours, like a binary counter
+        while len(self.chunks) > 1 and self.chunks[-1][0] == self.chunks[-2][0]:
+            (level, b), (level, a) = self.chunks.pop(), self.chunks.pop()
+            self.chunks.append((level + 1, cascaded_union([a, b])))
+
+    def union(self):
+        self._flush()
+        if self.pool:
+            parts = [shapely_wkb.loads(res.get()) for level, res in self.chunks]
+            while len(parts) > 1:
+                pairs = [parts[i:i + 2] for i in range(0, len(parts), 2)]
+                parts = [shapely_wkb.loads(x) for x in
+                         self.pool.map(_union_wkb, [[g.wkb for g in pair] for pair in pairs])]
+            self.pool.close()
+            self.pool.join()
+            self.pool = None
+        else:
+            parts = [geom for level, geom in self.chunks]
+            while len(parts) > 1:
+                parts = [cascaded_union(parts[i:i + 2]) for i in range(0, len(parts), 2)]
+        self.chunks = [(0, parts[0])] if parts else []
+        return parts[0] if parts else None
+
+    def multipolygon(self):
+        casc_poly = self.union()
+
+        # keep the polygonal parts; point or line features don't add any area
+        if casc_poly is None:
+            parts = []
+        elif casc_poly.type in ('MultiPolygon', 'GeometryCollection'):
+            parts = list(casc_poly.geoms)
+        else:
+            parts = [casc_poly]
+        polygons = [x for x in parts if x.type == 'Polygon' and not x.is_empty]
+        if not polygons:
+            raise Exception("No polygon stands in upload")
+
+        # Identify small 'slivers' or areas of empty space b/t polygons that are unintentional
+        # If they're smaller than the threshold, remove them
+        interiors = [list(c.interiors) for c in polygons]
+        keep = iter(_ring_areas([x for rings in interiors for x in rings]) > settings.SLIVER_THRESHOLD)
+        polys = []
+        for c, rings in zip(polygons, interiors):
+            holes = [x for x in rings if keep.next()]
+            polys.append(Polygon(shell=c.exterior, holes=holes))
+
+        return MultiPolygon(polys)
+
+
 class StandImporter:
 
-    def __init__(self, user):
+    def __init__(self, user, progress=None):
         self.user = user
         self.required_fields = []  # ['name']
         self.optional_fields = ['name', 'domspp', 'rx']  # model must provide defaults!
+        # progress(stage, done, total) is called as the import proceeds
+        self.progress = progress
+
+    def _report(self, stage, done, total):
+        if self.progress:
+            self.progress(stage, done, total)
 
     def _validate_field_mapping(self, layer, field_mapping):
         fields = layer.fields
@@ -54,6 +228,29 @@ class StandImporter:
 
         return field_mapping
 
+    def _read_stands(self, layer, field_mapping, use_condid):
+        """
+        Generator of (stand, condid) read from the layer's features
+        """
+        for feature in layer:
+            stand = Stand(
+                user=self.user,
+                name=str(datetime_to_unix(datetime.datetime.now())),
+                geometry_orig=feature.geom.geos)
+
+            for fname in self.optional_fields:
+                if fname in field_mapping.keys():
+                    try:
+                        stand.__dict__[fname] = feature.get(
+                            field_mapping[fname])
+                    except OGRIndexError:
+                        pass
+
+            condid = None
+            if use_condid:
+                condid = feature.get('condid')
+            yield stand, condid
+
     def import_ogr(self, shp_path, field_mapping=None, layer_num=0,
                    forest_property=None, new_property_name=None, pre_impute=False):
         ds = DataSource(shp_path)
@@ -65,106 +262,132 @@ class StandImporter:
             raise Exception(
                 "Must provide either existing forest_property OR new_property_name")
 
-        if new_property_name:
-            # Calculating property outline from stands
-            stands = []
-            for feature in layer:
-                stands.append(wkt.loads(feature.geom.wkt))
-            casc_poly = cascaded_union(stands)
-
-            if casc_poly.type == 'MultiPolygon':
-                polys = []
-                for c in casc_poly:
-                    # Identify small 'slivers' or areas of empty space b/t polygons that are unintentional
-                    # If they're smaller than the threshold, remove them
-                    interiors = [x for x in c.interiors if Polygon(
-                        x).area > settings.SLIVER_THRESHOLD]
-                    polys.append(Polygon(shell=c.exterior, holes=interiors))
-            elif casc_poly.type == 'Polygon':
-                # Identify small 'slivers' or areas of empty space b/t polygons that are unintentional
-                # If they're smaller than the threshold, remove them
-                interiors = [x for x in casc_poly.interiors if Polygon(
-                    x).area > settings.SLIVER_THRESHOLD]
-                polys = [Polygon(shell=casc_poly.exterior, holes=interiors)]
-
-            casc = MultiPolygon(polys)
-
-            # Creating Property
-            self.forest_property = ForestProperty.objects.create(
-                user=self.user, name=new_property_name, geometry_final=casc.wkt)
-        else:
-            self.forest_property = forest_property
-
+        # special case for user-inventory situation
+        # if there is a condid field, it is implicitly required.
+        use_condid = 'condid' in layer.fields
+
+        # One transaction for the property, strata and stands. The features
+        # are read, checked and inserted a batch at a time: invalid geometries
+        # are repaired as Stand.save would, and if any feature can't be
+        # repaired (the error lists every one) or anything else fails, the
+        # whole upload is rolled back. Of the stands, only the ids still to be
+        # imputed are kept in memory; the property outline is built as we go.
+        batch_size = getattr(settings, 'STAND_IMPORT_BATCH_SIZE', 500)
+        outline = OutlineBuilder() if new_property_name else None
+        invalid = []
+        condids = set()
+        impute_ids = []
+        first_id = None
+        saved = 0
         try:
-            # special case for user-inventory situation
-            # if there is a condid field, it is implicitly required.
-            use_condid = False
-            if 'condid' in layer.fields:
-                use_condid = True
-                variant = self.forest_property.variant
-                valid_condids = FVSAggregate.valid_condids(variant)
-
-            stands = []
-            stratum = {}
-            for feature in layer:
-                stand = Stand(
-                    user=self.user,
-                    name=str(datetime_to_unix(datetime.datetime.now())),
-                    geometry_orig=feature.geom.geos)
-
-                for fname in self.optional_fields:
-                    if fname in field_mapping.keys():
+            with transaction.commit_on_success():
+                if new_property_name:
+                    # Creating Property; no outline until every stand is read
+                    self.forest_property = ForestProperty.objects.create(
+                        user=self.user, name=new_property_name, geometry_final=None)
+                else:
+                    self.forest_property = forest_property
+
+                batch = []
+                for i, (stand, condid) in enumerate(self._read_stands(layer, field_mapping, use_condid)):
+                    if (i + 1) % 500 == 0:
+                        self._report('reading', i + 1, num_features)
+                    if not stand.geometry_orig.valid:
                         try:
-                            stand.__dict__[fname] = feature.get(
-                                field_mapping[fname])
-                        except OGRIndexError:
-                            pass
+                            stand.geometry_orig = clean_geometry(stand.geometry_orig)
+                        except Exception:
+                            invalid.append(str(i + 1))
+                    if invalid:
+                        # the upload is rejected; just look for the other invalid features
+                        continue
+                    if outline:
+                        outline.add(stand.geometry_orig)
+                    if use_condid:
+                        stand.cond_id = condid
+                        stand.locked_cond_id = condid
+                        condids.add(condid)
+                    batch.append(stand)
+                    if len(batch) >= batch_size:
+                        impute_ids.extend(self._insert_stands(batch, pre_impute))
+                        first_id = first_id or batch[0].id
+                        saved += len(batch)
+                        batch = []
+                        self._report('saving', saved, num_features)
+                if invalid:
+                    raise Exception("Invalid geometry for feature(s) %s" % ", ".join(invalid))
+                self._report('reading', num_features, num_features)
+
+                if batch:
+                    impute_ids.extend(self._insert_stands(batch, pre_impute))
+                    first_id = first_id or batch[0].id
+                    saved += len(batch)
+                self._report('saving', saved, num_features)
+
+                if new_property_name:
+                    self.forest_property.geometry_final = outline.multipolygon().wkt
+                    self.forest_property.save()
 
-                # If user inventory case, check each feature which must contain integer condids
-                # that refer to valid fvsaggregate records for that variant
                 if use_condid:
-                    condid = feature.get('condid')
-
-                    if condid not in valid_condids:
-                        raise Exception('Condition id {} is not valid for the {} variant (check fvsaggregate table)'.format(condid, variant))
-
-                    if condid in stratum.keys():
-                        # use cached
-                        strata = stratum[condid]
-                    else:
-                        # create it
-                        kwargs = condid_strata(condid, self.forest_property.uid)
-                        strata = Strata(user=self.user, name=condid, **kwargs)
-                        strata.save(skip_validation=True)  # no need for NN validation
-                        self.forest_property.add(strata)
-                        stratum[condid] = strata
-
-                    stand.cond_id = condid
-                    stand.locked_cond_id = condid
-                    stand.strata = strata
-
-                stand.full_clean()
-                stands.append(stand)
-                del stand
-
-            for stand in stands:
-                stand.save()
-                self.forest_property.add(stand)
-                if pre_impute:
-                    # Technically locked stands won't need terrain variables
-                    # ... but terrain info is nice to have anyways for all stands.
-                    # Note the work is done asynchronously to ensure fast uploads
-                    stand.preimpute()
-        except:
-            # Any failures? Rollback and re-raise...
-            for stand in stands:
-                stand.delete()
-            if new_property_name:
-                self.forest_property.delete()
-            raise
+                    self._assign_strata(condids, first_id)
+        finally:
+            if outline:
+                # don't leave union workers behind if the upload failed
+                outline.close()
+
+        self.forest_property.invalidate_cache()
+
+        # Technically locked stands won't need terrain variables
+        # ... but terrain info is nice to have anyways for all stands.
+        # Note the work is done asynchronously (once for the whole property)
+        # to ensure fast uploads
+        if impute_ids:
+            savetime = datetime_to_unix(postgres_now())
+            impute_rasters_batch.apply_async(args=(impute_ids, savetime))
 
         return True
 
+    def _assign_strata(self, condids, first_id):
+        # If user inventory case, each feature must contain integer condids
+        # that refer to valid fvsaggregate records for that variant.
+        # Checked once the property outline (hence its variant) is known;
+        # the stands of this upload (ids from first_id) then get their strata
+        variant = self.forest_property.variant
+        valid_condids = FVSAggregate.valid_condids(variant)
+
+        stands = Stand.objects.filter(
+            content_type=ContentType.objects.get_for_model(self.forest_property),
+            object_id=self.forest_property.pk, id__gte=first_id)
+        for condid in sorted(condids):
+            if condid not in valid_condids:
+                raise Exception('Condition id {} is not valid for the {} variant (check fvsaggregate table)'.format(condid, variant))
+
+            kwargs = condid_strata(condid, self.forest_property.uid)
+            strata = Strata(user=self.user, name=condid, **kwargs)
+            strata.save(skip_validation=True)  # no need for NN validation
+            self.forest_property.add(strata)
+            stands.filter(locked_cond_id=condid).update(strata=strata)
+
+    def _insert_stands(self, stands, pre_impute=False):
+        """
+        Validate and bulk insert a batch of stands;
+        returns the ids of those that need terrain imputed
+        """
+        for stand in stands:
+            stand.full_clean()
+            # what Stand.save would do; bulk_create bypasses it
+            stand.apply_manipulators()
+            stand.collection = self.forest_property
+
+        # bulk_create doesn't hand back ids, so take them from the sequence
+        cursor = connection.cursor()
+        cursor.execute("SELECT nextval(pg_get_serial_sequence(%s, 'id')) "
+                       "FROM generate_series(1, %s)", [Stand._meta.db_table, len(stands)])
+        for stand, (stand_id,) in zip(stands, cursor.fetchall()):
+            stand.id = stand_id
+
+        Stand.objects.bulk_create(stands)
+        return [stand.id for stand in stands if pre_impute or not stand.cond_id]
+
 
 def condid_strata(condid, forest_property_uid=''):
     """
@@ -191,36 +414,19 @@ def condid_strata(condid, forest_property_uid=''):
     }
 
 
-def calculate_adjacency(qs, threshold):
+def calculate_adjacency(qs, threshold, postgis=False):
     """
     Determines a matrix of adjacent polygons from a Feature queryset.
     Since the data are not topological, adjacency is determined
     by a minimum distance threshold.
+    Computed in python from one load of the geometries (see trees.adjacency)
+    or, with postgis=True, by a single self-join in the database.
     """
-    features = list(qs)
-    adj = {}
-
-    for feat in features:
-        fid = feat.pk
-        adj[fid] = []
-
-        geom_orig = feat.geometry_final
-        geom_buf = feat.geometry_final.buffer(threshold)
-
-        filterqs = qs.filter(
-            geometry_final__bboverlaps=geom_buf, geometry_final__intersects=geom_buf)
-        for feat2 in filterqs:
-            fid2 = feat2.pk
-            if fid == fid2:
-                continue
-            adj[fid].append(fid2)
-
-        if len(adj[fid]) == 0:
-            adj[fid] = None
-
-        del filterqs
+    from trees.adjacency import adjacency_map, load_features, postgis_adjacency_map
 
-    return adj
+    if postgis:
+        return postgis_adjacency_map(qs, threshold)
+    return adjacency_map(load_features(qs), threshold)
 
 
 class NoPlotMatchError(Exception):
@@ -315,7 +521,7 @@ def nearest_plots(categories, input_params, weight_dict, k=10):
     scaled_querypoint = np.nan_to_num(scaled_querypoint * weights)
 
     # Create tree and query it for nearest plot
-    tree = KDTree(scaled_points)
+    tree = cKDTree(scaled_points)
     querypoints = np.array([scaled_querypoint])
     result = tree.query(querypoints, k=k)
     distances = result[0][0]
@@ -378,6 +584,18 @@ def angular_diff(x, y):
     return math.fabs(math.degrees(min(y - x, y - x + 2 * math.pi, y - x - 2 * math.pi, key=abs)))
 
 
+def angular_diff_array(xs, y):
+    '''
+    Vectorized angular_diff
+    input: array of angles in degrees and a single angle in degrees
+    output: array of absolute angular differences in degrees
+    '''
+    xs = np.radians(np.asarray(xs, dtype=float))
+    y = math.radians(y)
+    diffs = np.abs(np.vstack([y - xs, y - xs + 2 * math.pi, y - xs - 2 * math.pi]))
+    return np.degrees(diffs.min(axis=0))
+
+
 def potential_minmax(categories, weight_dict, search_params):
     categories = process_categories(categories, search_params)
     ps = IdbSummary.objects.filter(**categories)
@@ -387,209 +605,201 @@ def potential_minmax(categories, weight_dict, search_params):
     return ps.aggregate(*args)
 
 
-def create_scenariostands(the_scenario):
+def create_scenariostands(the_scenario, offset_func=None):
     """
     Given a scenario, do a spatial identity between
       * Stands for this scenario
       * All SpatialConstraints chosen for this scenario
-    and populate the ScenarioStands with the results
+    and populate the ScenarioStands with the results.
+    The Rx of a SpatialConstraint takes precedence over the scenario Rx.
+
+    The identity and the attribute joins run in the database (into temp
+    tables) and the ScenarioStands are created with a single INSERT ... SELECT.
+    offset_func(rx) gives the offset for each new ScenarioStand (default 0)
 
     input: scenario instance
     output: ScenarioStands queryset
     side effects: removes old ScenarioStands and populates with new shapes
     dependencies: scenario must be runnable
     """
-    from trees.models import ScenarioStand, Stand, Rx, SpatialConstraint, ScenarioNotRunnable
-    from django.db import connection
+    from trees.models import ScenarioStand, ScenarioStandResult, ScenarioNotRunnable
 
     if not the_scenario.is_runnable:
         raise ScenarioNotRunnable(
             "%s has stands without cond_id or is otherwise unrunnable" % the_scenario.uid)
 
-    # Avoid use of IN?
-    # Doesn't seem to improve performance much
-    # orig_combo_sql = """
-    #      SELECT id AS stand_id, NULL AS constraint_id, geometry_final AS geom
-    #      FROM trees_stand
-    #      WHERE content_type_id = 47 and object_id = 80
-
-    #      UNION ALL
-
-    #      SELECT NULL AS stand_id, sc.id AS constraint_id, geom
-    #      --from trees_spatialconstraint sc
-    #      FROM trees_spatialconstraint sc, trees_forestproperty fp
-    #      WHERE fp.id = 80 AND fp.geometry_final && sc.geom AND category IN ('R2')
-    #     """
-
-    orig_combo_sql = """
-         SELECT id AS stand_id, NULL AS constraint_id, geometry_final AS geom
-         FROM trees_stand
-         WHERE id IN (%(stand_ids)s)
-
-         UNION ALL
-
-         SELECT NULL AS stand_id, sc.id AS constraint_id, geom
-         FROM trees_spatialconstraint sc
-         WHERE sc.id IN (%(constraint_ids)s)
-    """ % {
-        # in case there are no constraints involved, fake a -1 id
-        'constraint_ids': ",".join([str(int(x.id)) for x in the_scenario.constraint_set()] + ['-1']),
-        'stand_ids': ",".join([str(int(x.id)) for x in the_scenario.stand_set()]),
-    }
+    input_rxs = the_scenario.input_rxs
+    stand_ids = []
+    rx_ids = []
+    for stand in the_scenario.stand_set():
+        try:
+            rx_id = input_rxs[stand.id]
+        except KeyError:
+            rx_id = input_rxs[unicode(stand.id)]
+        stand_ids.append(int(stand.id))
+        rx_ids.append(int(rx_id))
+    constraint_ids = [int(x.id) for x in the_scenario.constraint_set()]
 
-    # testing, above query assumed to reside in _temp_orig
-    #orig_combo_sql = "SELECT * FROM _temp_orig"
-
-    sql = """
-    -- ArcGIS-style Identity
-    -- similar to a global arcgis-style union but "clipped" to one of the input layers
-    -- advantage to this method is that you can include polygons from multiple input tables
-    -- and overlapping polygons are handled gracefuly by taking the max/min(id)
-    -- see https://gist.github.com/perrygeo/5320964
-    --
-    -- 1. put all polygons into one table, maintaining ids for each input layer
-    -- 2. deconstruct into lines and rebuild polygons
-    -- 3. take points on surface
-    -- 4. group by geom and aggregate original ids by point overlap
-    -- 5. Join with the original tables to pull in attributes
-    -- 6. query on attributes to create an Identity
-
-    SELECT
-       geometry_final,
-       cond_id,
-       default_rx_id as rx_id,
-       stand_id,
-       constraint_id
-    FROM
-    (SELECT z.geom AS geometry_final,
-          stand_id,
-          constraint_id,
-          default_rx_id,
-          cond_id
-    FROM
-     (SELECT proc.geom AS geom,
-             Max(orig.stand_id) AS stand_id,
-             Max(orig.constraint_id) AS constraint_id
-      FROM
-        (
-        %(orig_combo_sql)s
-        ) AS orig,
-
-        (SELECT geom, St_pointonsurface(geom) as ptgeom
-         FROM St_dump(
-            (SELECT St_polygonize(the_geom) AS the_geom
-             FROM
-               (SELECT St_union(the_geom) AS the_geom
-                FROM
-                  (SELECT St_exteriorring(geom) AS the_geom
-                   FROM
-                     (
-                     %(orig_combo_sql)s
-                     ) AS combo
-                  ) AS lines
-               ) AS noded_lines
-            )
-        )) AS proc
-      WHERE proc.ptgeom && orig.geom
-      AND ST_Contains(orig.geom, proc.ptgeom)
-      GROUP BY proc.geom) AS z
-    LEFT JOIN trees_stand s ON s.id = z.stand_id
-    LEFT JOIN trees_spatialconstraint c ON c.id = z.constraint_id) AS _unionjoin
-    WHERE stand_id IS NOT NULL ;
-    """ % {
-        'orig_combo_sql': orig_combo_sql
-    }
-    print sql
+    # 1. put all polygons into one table, maintaining ids for each input layer
+    # (temp tables outlive an enclosing transaction that isn't committed)
+    orig_sql = """
+        DROP TABLE IF EXISTS _identity_orig, _identity, _identity_input_rx;
 
-    # pre-clean
-    ScenarioStand.objects.filter(scenario=the_scenario).delete()
+        CREATE TEMP TABLE _identity_orig ON COMMIT DROP AS
+        SELECT id AS stand_id, NULL::integer AS constraint_id, geometry_final AS geom
+        FROM trees_stand
+        WHERE id = ANY(%s)
 
-    input_rxs = the_scenario.input_rxs
+        UNION ALL
 
-    # exec query
-    cursor = connection.cursor()
-    cursor.execute(sql)
+        SELECT NULL AS stand_id, sc.id AS constraint_id, geom
+        FROM trees_spatialconstraint sc
+        WHERE sc.id = ANY(%s);
 
-    # loop through output identity polygons and
-    # and create corresponding ScenarioStands
-    print "Looping through results..."
-    for row in cursor.fetchall():
+        CREATE INDEX _identity_orig_geom ON _identity_orig USING GIST (geom);
+        ANALYZE _identity_orig;
+    """
 
-        # [x[0] for x in cursor.description]
-        # ['geometry_final', 'cond_id', 'rx_id', 'stand_id', 'constraint_id']
+    identity_sql = """
+        -- ArcGIS-style Identity
+        -- similar to a global arcgis-style union but "clipped" to one of the input layers
+        -- advantage to this method is that you can include polygons from multiple input tables
+        -- and overlapping polygons are handled gracefuly by taking the max/min(id)
+        -- see https://gist.github.com/perrygeo/5320964
+        --
+        -- 2. deconstruct into lines and rebuild polygons
+        -- 3. take points on surface
+        -- 4. group by geom and aggregate original ids by point overlap
+        -- 5. Join with the original tables to pull in attributes
+        -- 6. query on attributes to create an Identity
+        CREATE TEMP TABLE _identity ON COMMIT DROP AS
+        SELECT z.geom AS geometry_final,
+               s.cond_id,
+               c.default_rx_id AS constraint_rx_id,
+               z.stand_id,
+               z.constraint_id
+        FROM
+         (SELECT proc.geom AS geom,
+                 Max(orig.stand_id) AS stand_id,
+                 Max(orig.constraint_id) AS constraint_id
+          FROM
+            _identity_orig AS orig,
+            (SELECT geom, St_pointonsurface(geom) AS ptgeom
+             FROM St_dump(
+                (SELECT St_polygonize(the_geom) AS the_geom
+                 FROM
+                   (SELECT St_union(St_boundary(geom)) AS the_geom
+                    FROM _identity_orig
+                   ) AS noded_lines
+                )
+            )) AS proc
+          WHERE proc.ptgeom && orig.geom
+          AND ST_Contains(orig.geom, proc.ptgeom)
+          GROUP BY proc.geom) AS z
+        LEFT JOIN trees_stand s ON s.id = z.stand_id
+        LEFT JOIN trees_spatialconstraint c ON c.id = z.constraint_id
+        WHERE z.stand_id IS NOT NULL;
+
+        -- the scenario Rx user input, by stand
+        CREATE TEMP TABLE _identity_input_rx ON COMMIT DROP AS
+        SELECT unnest(%s::integer[]) AS stand_id, unnest(%s::integer[]) AS rx_id;
+    """
 
-        the_cond_id = row[1]
-        if not the_cond_id:
+    identity_from = """
+        FROM _identity i
+        JOIN _identity_input_rx irx ON irx.stand_id = i.stand_id
+        LEFT JOIN trees_rx rx ON rx.id = COALESCE(i.constraint_rx_id, irx.rx_id)
+    """
+
+    check_sql = """
+        SELECT COUNT(*),
+               SUM(CASE WHEN i.cond_id IS NULL THEN 1 ELSE 0 END),
+               SUM(CASE WHEN rx.id IS NULL THEN 1 ELSE 0 END)
+        %s
+    """ % identity_from
+
+    insert_sql = """
+        INSERT INTO trees_scenariostand
+            (user_id, name, date_created, date_modified, geometry_orig, geometry_final,
+             cond_id, rx_id, rx_internal_num, scenario_id, stand_id, constraint_id,
+             acres, "offset")
+        SELECT %%s, '', now(), now(), i.geometry_final, i.geometry_final,
+               i.cond_id, rx.id,
+               -- what ScenarioStand.save would do, see Rx.internal_num
+               substring(rx.internal_name from 3)::integer,
+               %%s, i.stand_id, i.constraint_id,
+               ST_Area(ST_Transform(i.geometry_final, %%s)) * %%s,
+               0
+        %s
+    """ % identity_from
+
+    cursor = connection.cursor()
+    with transaction.commit_on_success():
+        # pre-clean
+        ScenarioStandResult.clear(the_scenario)
+        ScenarioStand.objects.filter(scenario=the_scenario).delete()
+
+        cursor.execute(orig_sql, [stand_ids, constraint_ids])
+        cursor.execute(identity_sql, [stand_ids, rx_ids])
+
+        cursor.execute(check_sql)
+        count, missing_cond, missing_rx = cursor.fetchone()
+        if missing_cond:
             raise ScenarioNotRunnable(
                 "%s - not all ScenarioStands have cond_id" % the_scenario.uid)
-
-        rx_id = row[2]
-        the_rx = None
-        stand_id = row[3]
-        the_stand = None
-        constraint_id = row[4]
-        the_constraint = None
-
-        if rx_id:
-            # comes from a spatial constraint
-            the_rx = Rx.objects.get(id=rx_id)
-        elif stand_id:
-            # comes from the scenario Rx user input
-            try:
-                rx_id = input_rxs[stand_id]
-            except KeyError:
-                try:
-                    rx_id = input_rxs[unicode(stand_id)]
-                except:
-                    # do we raise Exception or apply a default Rx silently?
-                    err = "%s not in input_rxs!" % stand_id
-                    logger.error(err)
-                    raise ScenarioNotRunnable(err)
-
-            the_rx = Rx.objects.get(id=rx_id)
-
-        if stand_id:
-            the_stand = Stand.objects.get(id=stand_id)
-        else:
+        if missing_rx:
             raise ScenarioNotRunnable(
-                "%s - not all ScenarioStands have stand_id" % the_scenario.uid)
+                "%s - not all ScenarioStands have a valid Rx" % the_scenario.uid)
 
-        if constraint_id:
-            the_constraint = SpatialConstraint.objects.get(id=constraint_id)
+        cursor.execute(insert_sql, [the_scenario.user_id, the_scenario.id,
+                                    settings.EQUAL_AREA_SRID,
+                                    settings.EQUAL_AREA_ACRES_CONVERSION])
+        logger.debug("%s - %d ScenarioStands from %d stands and %d constraints" % (
+            the_scenario.uid, count, len(stand_ids), len(constraint_ids)))
 
-        ScenarioStand.objects.create(
-            user=the_scenario.user,
-            geometry_final=row[0],
-            geometry_orig=row[0],
-            cond_id=the_cond_id,
-            scenario=the_scenario,
-            rx=the_rx,
-            stand=the_stand,
-            constraint=the_constraint
-        )
+        sstands = ScenarioStand.objects.filter(scenario=the_scenario)
+        if offset_func:
+            set_scenariostand_offsets(sstands, offset_func)
 
-    return ScenarioStand.objects.filter(scenario=the_scenario)
+    return sstands
+
+
+def set_scenariostand_offsets(sstands, offset_func):
+    """
+    Set the offset of each ScenarioStand to offset_func(rx)
+    with one UPDATE per distinct offset
+    """
+    from trees.models import Rx
+
+    rows = list(sstands.values_list('id', 'rx'))
+    rxs = Rx.objects.in_bulk(set(rx_id for sstand_id, rx_id in rows))
+    by_offset = defaultdict(list)
+    for sstand_id, rx_id in rows:
+        by_offset[offset_func(rxs[rx_id])].append(sstand_id)
+    for offset, ids in by_offset.items():
+        sstands.filter(id__in=ids).update(offset=offset)
 
 
-def fake_scenariostands(the_scenario):
+def fake_scenariostands(the_scenario, offset_func=None):
     """
     fake the output of create_scenariostands with NO spatial constriaints
     Basically just copy the Stands over to ScenarioStands
 
+    offset_func(rx) gives the offset for each new ScenarioStand (default 0)
+    so they can be inserted complete rather than saved again one by one.
+
     side effects: removes old ScenarioStands and populates with new shapes
     dependencies: scenario must be runnable
     """
-    from trees.models import ScenarioStand, Rx, ScenarioNotRunnable
+    from trees.models import ScenarioStand, ScenarioStandResult, Rx, ScenarioNotRunnable
 
     if not the_scenario.is_runnable:
         raise ScenarioNotRunnable(
             "%s has stands without cond_id or is otherwise unrunnable" % the_scenario.uid)
 
-    # pre-clean
-    ScenarioStand.objects.filter(scenario=the_scenario).delete()
-
     input_rxs = the_scenario.input_rxs
 
+    stand_rxs = []
     for stand in the_scenario.stand_set():
         if not stand.cond_id:
             raise ScenarioNotRunnable(
@@ -607,21 +817,42 @@ def fake_scenariostands(the_scenario):
                 logger.error(err)
                 raise ScenarioNotRunnable(err)
 
-        the_rx = Rx.objects.get(id=rx_id)
-        cond_id = stand.cond_id
+        stand_rxs.append((stand, int(rx_id)))
+
+    # resolve all the Rxs at once
+    rxs = Rx.objects.in_bulk(set(rx_id for stand, rx_id in stand_rxs))
+
+    sstands = []
+    for stand, rx_id in stand_rxs:
+        try:
+            the_rx = rxs[rx_id]
+        except KeyError:
+            err = "Rx %s does not exist!" % rx_id
+            logger.error(err)
+            raise ScenarioNotRunnable(err)
 
-        ScenarioStand.objects.create(
+        sstands.append(ScenarioStand(
             user=the_scenario.user,
             geometry_final=stand.geometry_final,
             geometry_orig=stand.geometry_orig,
-            cond_id=cond_id,
+            cond_id=stand.cond_id,
             scenario=the_scenario,
             rx=the_rx,
+            # what ScenarioStand.save would do; bulk_create bypasses it
+            rx_internal_num=the_rx.internal_num,
             stand=stand,
             constraint=None,
             acres=stand.acres,
-            offset=0
-        )
+            offset=offset_func(the_rx) if offset_func else 0
+        ))
+
+    batch_size = getattr(settings, 'STAND_IMPORT_BATCH_SIZE', 500)
+    with transaction.commit_on_success():
+        # pre-clean
+        ScenarioStandResult.clear(the_scenario)
+        ScenarioStand.objects.filter(scenario=the_scenario).delete()
+        for i in range(0, len(sstands), batch_size):
+            ScenarioStand.objects.bulk_create(sstands[i:i + batch_size])
 
     return ScenarioStand.objects.filter(scenario=the_scenario)
 
@@ -10,6 +10,7 @@ from geopy import geocoders
 from geopy.point import Point
 from trees.models import Stand
 from django.views.decorators.cache import cache_page
+from django.views.decorators.http import condition
 from django.core.cache import cache
 import json
 import os
@@ -17,75 +18,54 @@ import os
 logger = get_logger()
 
 
-@cache_page(60 * 60 * 24 * 365)
 def list_species_sizecls(request, property_uid):
     '''
-    Provide a json list of all species and available size classes
-    in the specified variant
+    Redirect to the species and size class catalog for the
+    property's variant; the catalog does not depend on the property
+    so clients share one cached copy per variant
     '''
-    from django.db import connection
+    from django.core.urlresolvers import reverse
 
     forestproperty = get_object_for_viewing(request, property_uid)
     if isinstance(forestproperty, HttpResponse):
         return forestproperty
     variant = forestproperty.variant
 
-    sql = """
-    SELECT fia_forest_type_name,
-           --variant_code,
-           MIN(calc_dbh_class) AS min_dbh,
-           MAX(calc_dbh_class) AS max_dbh,
-           COUNT(calc_dbh_class) AS number
-           --avg(calc_dbh_class) as avg_dbh,
-           --count(calc_dbh_class) as count_trees,
-           --stddev(calc_dbh_class) as sdev_dbh
-    FROM treelive_summary summary, trees_conditionvariantlookup cvl
-    WHERE cvl.cond_id = summary.cond_id
-    AND cvl.variant_code = %s
-    GROUP BY fia_forest_type_name, variant_code
-    """
-    cursor = connection.cursor()
-    cursor.execute(sql, (variant.code,))
-    res = []
-
-    # Suggested diameter classes
-    dbh_classes = [
-        [0, 2],
-        [2, 6],
-        [6, 12],
-        [12, 24],
-        [24, 36],
-        [36, 48],
-        [48, 999],  # the top end will get replaced
-    ]
-    ignore_species = []
-
-    for row in cursor.fetchall():
-        species = row[0]
-        min_dbh = row[1]
-        max_dbh = row[2]
-        count = row[3]
-        relevant_classes = [dict(zip(['min', 'max'], [float(y) for y in x]))
-                            for x in dbh_classes
-                            if x[1] > min_dbh and x[0] <= max_dbh]
-
-        # filter
-        if count <= 10:
-            continue
-        if species in ignore_species:
-            continue
-        if 'unknown' in species.lower():
-            continue
-        if len(relevant_classes) == 0:
-            continue
-
-        relevant_classes[-1]['max'] = max_dbh  # limit top end
-        res.append({
-            'species': species,
-            'size_classes': relevant_classes,
-        })
-
-    return HttpResponse(json.dumps(res),
+    return HttpResponseRedirect(reverse('trees-variant_species_sizecls',
+                                        kwargs={'variant_id': variant.id}))
+
+
+def _species_catalog(request, variant_id):
+    from trees.models import FVSVariant, SpeciesSizeCatalog
+    # looked up once for both the ETag and the response
+    if not hasattr(request, '_species_catalog'):
+        try:
+            variant = FVSVariant.objects.get(id=int(variant_id))
+            request._species_catalog = SpeciesSizeCatalog.for_variant(variant)
+        except FVSVariant.DoesNotExist:
+            request._species_catalog = None
+    return request._species_catalog
+
+
+def _species_catalog_etag(request, variant_id):
+    catalog = _species_catalog(request, variant_id)
+    if catalog is None:
+        return None
+    return catalog.etag
+
+
+@condition(etag_func=_species_catalog_etag)
+def variant_species_sizecls(request, variant_id):
+    '''
+    Provide a json list of all species and available size classes
+    in the specified variant, from the catalog built at data-load time
+    '''
+    catalog = _species_catalog(request, variant_id)
+    if catalog is None:
+        return HttpResponse(json.dumps({'error': 'Variant %s does not exist' % variant_id}),
+                            mimetype='application/json', status=404)
+
+    return HttpResponse(catalog.catalog_json,
                         mimetype='application/json', status=200)
 
 
@@ -174,11 +154,17 @@ def user_property_list(request):
 def upload_stands(request):
     '''
     Upload stands via OGR datasource
+
+    The upload is streamed to disk. Small datasets are imported right away
+    (201 with the property uid); larger ones (over settings.STAND_UPLOAD_ASYNC_FEATURES
+    stands) are imported by a celery job (202 with a status url to poll).
     '''
     from trees.forms import UploadStandsForm
     from trees.models import ForestProperty
+    from trees.utils import extract_upload
+    from django.contrib.gis.gdal import DataSource
     import tempfile
-    import zipfile
+    import shutil
 
     if not request.user.is_authenticated():
         return HttpResponse('You must be logged in.', status=401)
@@ -201,58 +187,56 @@ def upload_stands(request):
             if not prop_pk and not new_prop_name:
                 return HttpResponse('You must provide either a new property name or existing property id.', status=401)
 
+            fp = None
+            if not new_prop_name:
+                try:
+                    fp = ForestProperty.objects.get(pk=prop_pk)
+                except ForestProperty.DoesNotExist:
+                    return HttpResponse('<p class="label label-important">Could not find forest property %s</p>' % prop_pk, status=404)
+
             # Save to disk
-            f = request.FILES['ogrfile']
-            tempdir = os.path.join(
-                tempfile.gettempdir(), request.user.username)
-            if not os.path.exists(tempdir):
-                os.makedirs(tempdir)
-            ogr_path = os.path.join(tempdir, f.name)
-            dest = open(ogr_path, 'wb+')
-            for chunk in f.chunks():
-                dest.write(chunk)
-            dest.close()
-
-            # if zipfile, unzip and change ogr_path
-            if ogr_path.endswith('zip'):
-                shp_path = None
-                zf = zipfile.ZipFile(ogr_path)
-                for info in zf.infolist():
-                    contents = zf.read(info.filename)
-                    shp_part = os.path.join(
-                        tempdir, info.filename.split(os.path.sep)[-1])
-                    fout = open(shp_part, "wb")
-                    fout.write(contents)
-                    fout.close()
-                    if shp_part.endswith(".shp"):
-                        shp_path = shp_part
-                ogr_path = shp_path
-
-            assert os.path.exists(ogr_path)
+            tempdir = tempfile.mkdtemp(prefix="%s_" % request.user.username)
+            ogr_path = extract_upload(request.FILES['ogrfile'], tempdir)
+            if not ogr_path or not os.path.exists(ogr_path):
+                shutil.rmtree(tempdir, ignore_errors=True)
+                return HttpResponse('<p class="label label-important">Error importing stands: no shapefile found in upload</p>', status=400)
+
+            try:
+                num_features = len(DataSource(ogr_path)[0])
+            except Exception as err:
+                shutil.rmtree(tempdir, ignore_errors=True)
+                return HttpResponse('<p class="label label-important">Error importing stands:\n%s</p>' % (err,), status=500)
+
+            if num_features > getattr(settings, 'STAND_UPLOAD_ASYNC_FEATURES', 1000):
+                from trees.tasks import import_stands
+                from django.core.urlresolvers import reverse
+                try:
+                    job = import_stands.apply_async(
+                        args=(ogr_path, request.user.pk),
+                        kwargs={'property_pk': fp and fp.pk, 'new_property_name': new_prop_name})
+                except Exception as err:
+                    # the task never ran, so it won't clean up after itself
+                    shutil.rmtree(tempdir, ignore_errors=True)
+                    return HttpResponse('<p class="label label-important">Error importing stands:\n%s</p>' % (err,), status=500)
+                cache.set('StandUpload_%s' % job.id, request.user.pk, 60 * 60 * 24)
+                return HttpResponse(json.dumps({
+                    'job_id': job.id,
+                    'total': num_features,
+                    'status_url': reverse('trees-upload_stands_status', kwargs={'job_id': job.id}),
+                }), status=202, mimetype='application/json')
 
             # Import
             from trees.utils import StandImporter
-            fp = None
             try:
                 s = StandImporter(request.user)
-
-                if new_prop_name:
-                    s.import_ogr(ogr_path,
-                                 new_property_name=new_prop_name,
-                                 pre_impute=True)
-                else:
-                    try:
-                        fp = ForestProperty.objects.get(pk=prop_pk)
-                    except ForestProperty.DoesNotExist:
-                        return HttpResponse('<p class="label label-important">Could not find forest property %s</p>' % prop_pk, status=404)
-                    s.import_ogr(ogr_path, forest_property=fp, pre_impute=True)
+                s.import_ogr(ogr_path, forest_property=fp,
+                             new_property_name=new_prop_name, pre_impute=True)
             except Exception as err:
                 return HttpResponse('<p class="label label-important">Error importing stands:\n%s</p>' % (err,), status=500)
+            finally:
+                shutil.rmtree(tempdir, ignore_errors=True)
 
-            if not fp:
-                fp = ForestProperty.objects.filter(
-                    name=new_prop_name).latest('date_modified')
-            res = HttpResponse(json.dumps({'X-Madrona-Select': fp.uid}),
+            res = HttpResponse(json.dumps({'X-Madrona-Select': s.forest_property.uid}),
                                status=201, mimetype='application/json')
             return res
     else:
@@ -262,6 +246,34 @@ def upload_stands(request):
     # return render_to_response('upload.html', {'form': form}, status=status)
 
 
+def upload_stands_status(request, job_id):
+    '''
+    Progress of a background stand upload (see upload_stands);
+    201 with the property uid once it is done
+    '''
+    from celery.result import AsyncResult
+
+    if not request.user.is_authenticated():
+        return HttpResponse('You must be logged in.', status=401)
+    if cache.get('StandUpload_%s' % job_id) != request.user.pk:
+        return HttpResponse(json.dumps({'error': 'Upload %s not found' % job_id}),
+                            mimetype='application/json', status=404)
+
+    job = AsyncResult(job_id)
+    res = {'state': job.state}
+    status = 200
+    if job.state == 'PROGRESS':
+        res.update(job.info)
+    elif job.state == 'SUCCESS':
+        res.update(job.result)
+        status = 201
+    elif job.state == 'FAILURE':
+        res['error'] = '<p class="label label-important">Error importing stands:\n%s</p>' % (job.result,)
+        status = 500
+
+    return HttpResponse(json.dumps(res), mimetype='application/json', status=status)
+
+
 def geojson_forestproperty(request, instance):
     '''
     Generic view to represent all Properties as GeoJSON
@@ -487,14 +499,27 @@ def stand_list_nn(request):
 
 def add_stands_to_strata(request, instance):
     from madrona.features.views import get_object_for_editing
+    from trees.models import datetime_to_unix, postgres_now
+    from trees.tasks import impute_nearest_neighbor_batch, impute_rasters_batch
     in_stands = request.POST.get("stands", None)
     stands = in_stands.split(",")
+    batch = []
+    terrain_batch = []
     for uid in stands:
         stand = get_object_for_editing(request, uid, target_klass=Stand)
         if isinstance(stand, HttpResponse):
             return stand
         stand.strata = instance
-        stand.save()
+        stand.save(defer_nn=True, defer_rasters=True)
+        if not stand.has_terrain:
+            terrain_batch.append(stand.id)
+        elif not stand.is_locked and not stand.cond_id:
+            batch.append(stand.id)
+    savetime = datetime_to_unix(postgres_now())
+    if batch:
+        impute_nearest_neighbor_batch.apply_async(args=(batch, savetime))
+    if terrain_batch:
+        impute_rasters_batch.apply_async(args=(terrain_batch, savetime))
     instance.save()
     return HttpResponse("Stands %r added to %s" % (stands, instance.uid), mimetype='text/html', status=200)
 
@@ -503,7 +528,14 @@ def forestproperty_strata_list(request, instance):
     from trees.models import Strata
     slist = sorted(instance.feature_set(feature_classes=[Strata]),
                    key=lambda x: x.date_created, reverse=False)
-    return HttpResponse(json.dumps([x._dict for x in slist]), mimetype="text/javascript")
+    strata = []
+    for x in slist:
+        d = x._dict
+        # classes the candidate search had to drop, so the UI can explain it
+        # (None until the stand list is next validated)
+        d['relaxed_classes'] = x.relaxed_classes or []
+        strata.append(d)
+    return HttpResponse(json.dumps(strata), mimetype="text/javascript")
 
 
 def run_scenario(request, instance):
@@ -586,6 +618,9 @@ def forestproperty_myrx(request, instance):
 
 def scenario_cash_flow(request, instance):
     data = instance.output_cash_metrics
+    if data and data.get('status') == 'computing':
+        # cost model still running; client polls again
+        return HttpResponse(json.dumps(data), mimetype="text/javascript", status=202)
     return HttpResponse(json.dumps(data), mimetype="text/javascript")
 
 
@@ -594,6 +629,38 @@ def scenario_revenue(request, instance):
     return HttpResponse(json.dumps(data), mimetype="text/javascript")
 
 
+def scenario_revenue_sweep(request, instance):
+    """
+    Annual gross revenue for several sets of timber prices at once
+    ?prices=[{"df_hrv": 450, "pine_hrv": 300}, {"df_hrv": 500}, ...]
+    (price per mbf by timber type; see trees.models.timber_choices)
+    """
+    from trees.models import timber_choices
+    from django.conf import settings
+
+    timber_types = set(x[0] for x in timber_choices)
+    max_vectors = getattr(settings, 'REVENUE_SWEEP_MAX_VECTORS', 100)
+    try:
+        price_vectors = json.loads(request.GET['prices'])
+        if not isinstance(price_vectors, list) or not 0 < len(price_vectors) <= max_vectors:
+            raise ValueError("prices must be a list of 1 to %d price vectors" % max_vectors)
+        for pv in price_vectors:
+            if not isinstance(pv, dict):
+                raise ValueError("each price vector must be an object")
+            for timber_type, price in pv.items():
+                if timber_type not in timber_types:
+                    raise ValueError("unknown timber type %s" % timber_type)
+                if not isinstance(price, (int, long, float)) or isinstance(price, bool):
+                    raise ValueError("price for %s must be a number" % timber_type)
+    except KeyError:
+        return HttpResponseBadRequest("Specify price vectors with the prices parameter")
+    except ValueError as e:
+        return HttpResponseBadRequest("Invalid prices: %s" % e)
+
+    data = instance.output_revenue_sweep(price_vectors)
+    return HttpResponse(json.dumps(data), mimetype="text/javascript")
+
+
 def carbongroup_dashboard(request, instance):
     if request.user.is_authenticated() and instance.user == request.user:
         if request.method == 'POST':
@@ -72,7 +72,16 @@ var refreshCashflow = function() {
 
   var xhr1 = $.ajax( cashflow_url1, {
     dataType: 'json'
-  }).done(function(data) {
+  }).done(function(data, textStatus, jqXHR) {
+    if (jqXHR.status === 202) {
+      // costs are still being computed; check back shortly
+      setTimeout(function() {
+        if ($('#cash-select-scenario1').find(":selected").val() === opt1) {
+          refreshCashflow();
+        }
+      }, 3000);
+      return;
+    }
     if (data && data['years']) {
       cashChartOptions.axes.xaxis.ticks = data['years'];
       var dataSeries = [
@@ -188,7 +188,41 @@ app.chartInit = function () {
 };
 
 app.standUploadFormInit = function () {
-	
+
+	var uploadDone = function (data) {
+		$("#uploadResponse").fadeOut();
+		$("#uploadResponse").html('<p class="label label-success">Success</p>');
+		$("#uploadResponse").fadeIn();
+		$('#uploadForm').clearForm();
+		var interval = setTimeout(function () {
+			$("#uploadResponse").html('');
+			app.properties.viewModel.afterUploadSuccess(data);
+		}, 2000);
+	};
+
+	var pollUpload = function (statusUrl) {
+		$.ajax({
+			url: statusUrl,
+			dataType: 'json',
+			success: function (data, status, xhr) {
+				if (xhr.status === 201) {
+					uploadDone(data);
+					return;
+				}
+				if (data.state === 'PROGRESS') {
+					$("#uploadResponse").html('<p class="label label-info">Processing stand data (' +
+						data.stage + ' ' + data.current + ' of ' + data.total + '); please wait... ' +
+						'<span style="margin-left: 15px"><img src="/media/img/ajax-loader.gif"></span></p>');
+				}
+				setTimeout(function () { pollUpload(statusUrl); }, 2000);
+			},
+			error: function (xhr) {
+				var data = $.parseJSON(xhr.responseText);
+				$("#uploadResponse").html(data.error);
+			}
+		});
+	};
+
 	var options = {
 		beforeSubmit: function (formData, jqForm, options) {
 			var name, file;
@@ -228,14 +262,10 @@ app.standUploadFormInit = function () {
 		},
 		success: function (data, status, xhr) {
 			if (xhr.status === 201) {
-				$("#uploadResponse").fadeOut();
-				$("#uploadResponse").html('<p class="label label-success">Success</p>');
-				$("#uploadResponse").fadeIn();
-				$('#uploadForm').clearForm();
-				var interval = setTimeout(function () {
-					$("#uploadResponse").html('');
-					app.properties.viewModel.afterUploadSuccess(data);
-				}, 2000);
+				uploadDone(data);
+			} else if (xhr.status === 202) {
+				// large upload; imported in the background
+				pollUpload(data.status_url);
 			}
 		}
 
@@ -49,4 +49,12 @@ for rast in $OUTDIR/*.striped.tif; do
     rm $rast
 done
 
+# Version stamp; cached terrain results are keyed on it (trees.terrain)
+# so a refreshed dataset never serves stale values:
+#   python manage.py terrain_cache --rebuild
+date -u +"%Y%m%d%H%M%S" > $OUTDIR/VERSION
+
+# Once copied to settings.TERRAIN_DIR, optionally write uncompressed copies
+# for the workers to memory-map:  python manage.py terrain_memmap
+
 ls -alth $OUTDIR
@@ -6,49 +6,36 @@ Output is 2-column csv listing all pairs of adjacent features.
 
 Since shapefiles (and other OGR data sources) are not topological, adjacency is determined
 by a minimum distance threshold.
+
+The features are read once and matched with the same STRtree-based engine
+the web app uses (lot/trees/adjacency.py).
 """
 from django.contrib.gis.gdal import DataSource
+from shapely import wkb
+import os
 import sys
 
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..', 'lot'))
+from trees.adjacency import adjacency_map, write_adjacency_csv
+
+
 def calc_adj(inds, outfile, threshold, fid_field=None):
     ds = DataSource(inds)
-    ds2 = DataSource(inds)
     layer = ds[0]
-    layer2 = ds2[0]
 
-    outfh = open(outfile, 'w')
-
-    for i, feat in enumerate(layer):
-        print i, "of", layer.num_feat
+    features = []
+    for feat in layer:
         if fid_field == None:
             fid = feat.fid
         else:
             fid = feat[fid_field]
+        features.append((fid, wkb.loads(str(feat.geom.wkb))))
+    print len(features), "features"
 
-        #geom_orig = feat.geom
-        geom_buf = feat.geom.geos.buffer(threshold)
-
-        layer2.spatial_filter = geom_buf.extent
-        for feat2 in layer2:
-            if fid_field == None:
-                fid2 = feat2.fid
-            else:
-                fid2 = feat2[fid_field]
-
-            if fid == fid2:
-                continue
-
-            # Determine adjacency
-            # Using the distance method is ~ 4X slower than buffer->intersect
-            # adjacent = feat2.geom.geos.distance(geom_orig.geos) <= threshold
-            adjacent = feat2.geom.geos.intersects(geom_buf)
-
-            if adjacent:
-                outfh.write("%d,%d\n" % (fid, fid2))
-
-        outfh.flush()
-        layer2.spatial_filter = None
+    adj = adjacency_map(features, threshold)
 
+    outfh = open(outfile, 'w')
+    write_adjacency_csv(adj, outfh)
     outfh.close()
 
 if __name__ == "__main__":
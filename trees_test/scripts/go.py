@@ -143,10 +143,9 @@ def second():
     print "======================="
     print "Step 7: Determine adjaceny"
     print "======================="
-    print
-    print "TBD...."
-    print "Just copy one over for now"
-    print
+    from adjacency import calc_adj
+    calc_adj(os.path.join(INDATA, 'shp', 'MgtBasins.shp'),
+             os.path.join(OUTDATA, 'scheduler_out', 'adj.txt'), threshold=500)
 
     print "======================="
     print "Step 8: Run scheduler"